@@ -1,5 +1,24 @@
+from pronunciation_dictionary_utils.binary_dictionary import (BinaryDictionary, is_binary_dict,
+                                                              save_binary_dict)
+from pronunciation_dictionary_utils.case_indexed_dictionary import CaseIndexedPronunciationDict
+from pronunciation_dictionary_utils.columnar_dictionary import (ColumnarDictionary,
+                                                                get_phoneme_set_columnar,
+                                                                map_symbols_columnar,
+                                                                normalize_weights_columnar,
+                                                                remove_symbols_from_pronunciations_columnar)
 from pronunciation_dictionary_utils.common import merge_pronunciations
-from pronunciation_dictionary_utils.merging import merge_dictionaries
+from pronunciation_dictionary_utils.compact_dictionary import (CompactPronunciationDict,
+                                                               CompactPronunciations)
+from pronunciation_dictionary_utils.entry_operators import (EntryOperator, apply_entry_operators,
+                                                            get_map_symbols_operator,
+                                                            get_normalize_weights_operator,
+                                                            get_remove_symbols_operator,
+                                                            get_replace_symbols_operator,
+                                                            get_select_single_pronunciation_operator,
+                                                            get_sort_pronunciations_operator)
+from pronunciation_dictionary_utils.merging import merge_dictionaries, merge_many, merge_sorted
+from pronunciation_dictionary_utils.pattern_replacement import PatternReplacer
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
 from pronunciation_dictionary_utils.pronunciations_map_symbols import map_symbols
 from pronunciation_dictionary_utils.pronunciations_map_symbols_dict import map_symbols_dict
 from pronunciation_dictionary_utils.pronunciations_remove_symbols import \
@@ -9,8 +28,12 @@ from pronunciation_dictionary_utils.pronunciations_replace_pronunciation import
 from pronunciation_dictionary_utils.pronunciations_sorting import sort_pronunciations
 from pronunciation_dictionary_utils.single_pronunciation_selection import \
   select_single_pronunciation
-from pronunciation_dictionary_utils.subset_extraction import select_subset_dictionary
+from pronunciation_dictionary_utils.subset_extraction import (select_subset_binary_dictionary,
+                                                              select_subset_dictionary,
+                                                              select_subset_entries)
 from pronunciation_dictionary_utils.weights_normalization import normalize_weights
+from pronunciation_dictionary_utils.word_normalization import WordNormalizer
 from pronunciation_dictionary_utils.words_casing_adjustment import change_word_casing
 from pronunciation_dictionary_utils.words_remove_symbols import remove_symbols_from_words
-from pronunciation_dictionary_utils.words_sorting import sort_words
+from pronunciation_dictionary_utils.words_sorting import (sort_words, sort_words_external,
+                                                          sort_words_in_place)
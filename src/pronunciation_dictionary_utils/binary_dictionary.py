@@ -0,0 +1,200 @@
+"""
+Binary dictionary format which is opened with `mmap`, i.e., only the bytes of the accessed entries are
+read and decoded. The file consists of a header, the encoded dictionary of `dictionary_snapshot` (offsets,
+hash table and entries in the order of the dictionary) and the indices of the entries sorted by word.
+"""
+
+import mmap
+import struct
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
+
+from pronunciation_dictionary_utils.dictionary_snapshot import (OFFSET_SIZE, DictionarySnapshot,
+                                                                cast_offsets, encode_dictionary)
+from pronunciation_dictionary_utils.validation import validate_dictionary
+
+BINARY_FORMAT = b"PDUBIN01"
+# size of the encoded dictionary
+BINARY_HEADER = struct.Struct("<Q")
+DATA_START = len(BINARY_FORMAT) + BINARY_HEADER.size
+
+
+def is_binary_dict(path: Path) -> bool:
+  with path.open("rb") as file:
+    return file.read(len(BINARY_FORMAT)) == BINARY_FORMAT
+
+
+def get_padding(size: int) -> bytes:
+  return bytes(-size % OFFSET_SIZE)
+
+
+@lru_cache(maxsize=1)
+def get_irregular_upper_case_forms() -> Dict[str, List[str]]:
+  """
+  Returns the characters which are neither the upper-case nor the title-case form of their lower-case
+  form, e.g., the Kelvin sign, grouped by their lower-case form.
+  """
+  result: Dict[str, List[str]] = {}
+  for start in range(0, sys.maxunicode + 1, 128):
+    block = "".join(map(chr, range(start, min(start + 128, sys.maxunicode + 1))))
+    # most blocks contain no upper-case characters
+    if block.lower() == block:
+      continue
+    for character in block:
+      character_lower = character.lower()
+      if character_lower != character and character not in (character_lower.upper(), character_lower.title()):
+        result.setdefault(character_lower, []).append(character)
+  return result
+
+
+def get_case_variants(word_lower: Word, position: int) -> Iterator[Tuple[str, int]]:
+  """
+  Yields the spellings which can start at `position` of the lower-case word together with the count of
+  the characters of the lower-case word which they cover.
+  """
+  character = word_lower[position]
+  yield from ((variant, 1) for variant in dict.fromkeys((character, character.upper(), character.title())))
+  irregular_forms = get_irregular_upper_case_forms()
+  for length in range(1, len(word_lower) - position + 1):
+    for variant in irregular_forms.get(word_lower[position:position + length], []):
+      yield variant, length
+
+
+def save_binary_dict(dictionary: PronunciationDict, path: Path) -> None:
+  if msg := validate_dictionary(dictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+
+  parts = encode_dictionary(dictionary)
+  size = sum(len(part) for part in parts)
+  words = list(dictionary.keys())
+  # str comparison is equal to the comparison of the code points
+  sorted_indices = sorted(range(len(words)), key=words.__getitem__)
+
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with path.open("wb") as file:
+    file.write(BINARY_FORMAT)
+    file.write(BINARY_HEADER.pack(size))
+    for part in parts:
+      file.write(part)
+    file.write(get_padding(size))
+    file.write(struct.pack(f"<{len(sorted_indices)}Q", *sorted_indices))
+
+
+class BinaryDictionary(Mapping):
+  """
+  Read-only dictionary of a file written with `save_binary_dict`. Opening the file only maps it into
+  memory; words and pronunciations are decoded on access.
+  """
+
+  def __init__(self, path: Path) -> None:
+    with path.open("rb") as file:
+      if file.read(len(BINARY_FORMAT)) != BINARY_FORMAT:
+        raise ValueError(f"File \"{path.absolute()}\" is no binary dictionary!")
+      self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    self.__buffer = memoryview(self.__mmap)
+    size, = BINARY_HEADER.unpack_from(self.__buffer, len(BINARY_FORMAT))
+    data_end = DATA_START + size
+    self.__data = self.__buffer[DATA_START:data_end]
+    self.__snapshot = DictionarySnapshot(self.__data)
+    sorted_start = data_end + len(get_padding(size))
+    self.__sorted_indices = cast_offsets(self.__buffer[sorted_start:])
+    assert len(self.__sorted_indices) == len(self.__snapshot)
+
+  def __enter__(self) -> "BinaryDictionary":
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def __getitem__(self, word: Word) -> Pronunciations:
+    return self.__snapshot[word]
+
+  def __contains__(self, word: object) -> bool:
+    return word in self.__snapshot
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self.__snapshot)
+
+  def __len__(self) -> int:
+    return len(self.__snapshot)
+
+  def get_index(self, word: Word) -> Optional[int]:
+    """
+    Returns the position of the word in the dictionary or None if it doesn't exist.
+    """
+    return self.__snapshot.find_index(word)
+
+  def get_word(self, index: int) -> Word:
+    return self.__snapshot.get_word(index)
+
+  def get_pronunciations(self, index: int) -> Pronunciations:
+    return self.__snapshot.get_pronunciations(index)
+
+  def __get_sorted_position(self, word: Word) -> int:
+    # first position in the sorted indices whose word is not less than `word`
+    low, high = 0, len(self.__sorted_indices)
+    while low < high:
+      middle = (low + high) // 2
+      if self.get_word(self.__sorted_indices[middle]) < word:
+        low = middle + 1
+      else:
+        high = middle
+    return low
+
+  def __has_prefix(self, prefix: str) -> bool:
+    position = self.__get_sorted_position(prefix)
+    return position < len(self.__sorted_indices) and self.get_word(self.__sorted_indices[position]).startswith(prefix)
+
+  def get_indices_ignore_case(self, word: Word) -> List[int]:
+    """
+    Returns the positions of all words with the same lower-case form as `word` in the order of the
+    dictionary. The case variants are built character by character and only extended while the sorted
+    words contain them as prefix, i.e., the dictionary is not scanned.
+    """
+    word_lower = word.lower()
+    indices = []
+    # spelling, count of the covered characters of the lower-case word
+    candidates = [("", 0)]
+    while len(candidates) > 0:
+      spelling, position = candidates.pop()
+      if position == len(word_lower):
+        index = self.get_index(spelling)
+        if index is not None and spelling.lower() == word_lower:
+          indices.append(index)
+        continue
+      for variant, length in get_case_variants(word_lower, position):
+        if self.__has_prefix(spelling + variant):
+          candidates.append((spelling + variant, position + length))
+    indices.sort()
+    return indices
+
+  def iterate_range(self, start: Optional[Word] = None, stop: Optional[Word] = None) -> Iterator[Tuple[Word, Pronunciations]]:
+    """
+    Yields the entries whose words are within [start, stop) in sorted order.
+    """
+    position = 0 if start is None else self.__get_sorted_position(start)
+    while position < len(self.__sorted_indices):
+      index = self.__sorted_indices[position]
+      word = self.get_word(index)
+      if stop is not None and word >= stop:
+        break
+      yield word, self.get_pronunciations(index)
+      position += 1
+
+  def to_dict(self) -> PronunciationDict:
+    return OrderedDict(
+      (self.get_word(index), self.get_pronunciations(index))
+      for index in range(len(self))
+    )
+
+  def close(self) -> None:
+    self.__sorted_indices.release()
+    self.__snapshot.release()
+    self.__data.release()
+    self.__buffer.release()
+    self.__mmap.close()
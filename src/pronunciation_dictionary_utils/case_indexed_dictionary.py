@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import Pronunciations, Word
+
+
+class CaseIndexedPronunciationDict(OrderedDict):
+  """
+  `PronunciationDict` with an index which maps the lower-case form of each word to its spellings. The
+  index is kept up to date on all changes, i.e., case-insensitive operations like
+  `select_subset_dictionary` and `change_word_casing` (mode "lower") only need to look at the affected
+  words instead of lower-casing all words of the dictionary.
+  """
+
+  def __init__(self, *args, **kwargs) -> None:
+    # lower-case form -> spelling -> position in the dictionary
+    self.__index: Dict[Word, Dict[Word, int]] = {}
+    # words which are not in lower-case
+    self.__cased_words: Dict[Word, None] = {}
+    self.__next_position = 0
+    self.__first_position = 0
+    super().__init__(*args, **kwargs)
+
+  def __setitem__(self, word: Word, pronunciations: Pronunciations) -> None:
+    if word not in self:
+      self.__add_to_index(word, self.__next_position)
+      self.__next_position += 1
+    super().__setitem__(word, pronunciations)
+
+  def __delitem__(self, word: Word) -> None:
+    super().__delitem__(word)
+    self.__remove_from_index(word)
+
+  def pop(self, word: Word, *default):
+    if word in self:
+      self.__remove_from_index(word)
+    return super().pop(word, *default)
+
+  def popitem(self, last: bool = True) -> Tuple[Word, Pronunciations]:
+    word, pronunciations = super().popitem(last)
+    self.__remove_from_index(word)
+    return word, pronunciations
+
+  def clear(self) -> None:
+    super().clear()
+    self.__index.clear()
+    self.__cased_words.clear()
+
+  def move_to_end(self, word: Word, last: bool = True) -> None:
+    super().move_to_end(word, last)
+    if last:
+      position = self.__next_position
+      self.__next_position += 1
+    else:
+      self.__first_position -= 1
+      position = self.__first_position
+    self.__index[word.lower()][word] = position
+
+  def __add_to_index(self, word: Word, position: int) -> None:
+    word_lower = word.lower()
+    if word_lower not in self.__index:
+      self.__index[word_lower] = {}
+    self.__index[word_lower][word] = position
+    if word_lower != word:
+      self.__cased_words[word] = None
+
+  def __remove_from_index(self, word: Word) -> None:
+    word_lower = word.lower()
+    spellings = self.__index[word_lower]
+    del spellings[word]
+    if len(spellings) == 0:
+      del self.__index[word_lower]
+    self.__cased_words.pop(word, None)
+
+  def contains_ignore_case(self, word: Word) -> bool:
+    return word.lower() in self.__index
+
+  def get_spellings(self, word: Word) -> OrderedSet[Word]:
+    """
+    Returns all words with the same lower-case form as `word` in the order of the dictionary.
+    """
+    spellings = self.__index.get(word.lower(), {})
+    return OrderedSet(sorted(spellings, key=spellings.__getitem__))
+
+  def get_cased_words(self) -> List[Word]:
+    """
+    Returns all words which are not in lower-case in the order of the dictionary.
+    """
+    return self.sort_words(self.__cased_words)
+
+  def sort_words(self, words: Iterable[Word]) -> List[Word]:
+    """
+    Returns the words in the order of the dictionary.
+    """
+    return sorted(words, key=lambda word: self.__index[word.lower()][word])
@@ -0,0 +1,172 @@
+import marshal
+from array import array
+from collections import OrderedDict
+from functools import partial
+from itertools import compress, count, islice
+from operator import ne
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
+from tqdm import tqdm
+
+from pronunciation_dictionary_utils.executors import Executor
+
+# start index of the chunk, indices of the changed words within the chunk, encoded new values
+ChunkResult = Tuple[int, bytes, bytes]
+
+
+def encode_pronunciations(pronunciations: Pronunciations) -> Tuple:
+  return tuple(pronunciations.items())
+
+
+def decode_pronunciations(encoded_pronunciations: Tuple) -> Pronunciations:
+  return OrderedDict(encoded_pronunciations)
+
+
+def encode_word(word: Word) -> Word:
+  return word
+
+
+def decode_word(word: Word) -> Word:
+  return word
+
+
+def process_chunk(chunk: Tuple[int, List[Word]], method: Callable[[Word], Tuple[Word, Optional[Any]]], encode: Callable[[Any], Any]) -> Optional[ChunkResult]:
+  start, words = chunk
+  indices = array("I")
+  values = []
+  for index, word in enumerate(words):
+    _, new_value = method(word)
+    if new_value is not None:
+      indices.append(index)
+      values.append(encode(new_value))
+  if len(indices) == 0:
+    return None
+  return start, indices.tobytes(), marshal.dumps(tuple(values))
+
+
+def process_word_chunk(chunk: Tuple[int, List[Word]], method: Callable[[List[Word]], List[Word]]) -> Optional[ChunkResult]:
+  start, words = chunk
+  new_words = method(words)
+  assert len(new_words) == len(words)
+  indices = array("I", compress(count(), map(ne, words, new_words)))
+  if len(indices) == 0:
+    return None
+  return start, indices.tobytes(), marshal.dumps(tuple(new_words[index] for index in indices))
+
+
+def process_entry_chunk(chunk: Tuple[int, List[Word]], method: Callable[[List[Word]], List[Optional[Any]]], encode: Callable[[Any], Any]) -> Optional[ChunkResult]:
+  start, words = chunk
+  new_values = method(words)
+  assert len(new_values) == len(words)
+  return encode_changed_values(start, new_values, encode)
+
+
+def encode_changed_values(start: int, new_values: List[Optional[Any]], encode: Callable[[Any], Any]) -> Optional[ChunkResult]:
+  indices = array("I")
+  values = []
+  for index, new_value in enumerate(new_values):
+    if new_value is not None:
+      indices.append(index)
+      values.append(encode(new_value))
+  if len(indices) == 0:
+    return None
+  return start, indices.tobytes(), marshal.dumps(tuple(values))
+
+
+def process_pronunciations_chunk(chunk: Tuple[int, List[Tuple[Word, Pronunciations]]], method: Callable[[Pronunciations], Optional[Pronunciations]]) -> Optional[ChunkResult]:
+  start, entries = chunk
+  new_values = [method(pronunciations) for _, pronunciations in entries]
+  return encode_changed_values(start, new_values, encode_pronunciations)
+
+
+def get_chunks(words: Iterable[Word], chunksize: int) -> Iterator[Tuple[int, List[Word]]]:
+  iterator = iter(words)
+  start = 0
+  while chunk := list(islice(iterator, chunksize)):
+    yield start, chunk
+    start += len(chunk)
+
+
+class ChangedEntries():
+  """
+  Changed values of the processed words. The results of the workers are kept encoded per chunk and are
+  only decoded while iterating.
+  """
+
+  def __init__(self, words: Sequence[Word], results: List[ChunkResult], decode: Callable[[Any], Any]) -> None:
+    self.__words = words
+    self.__results = results
+    self.__decode = decode
+
+  def __iter__(self) -> Iterator[Tuple[Word, Any]]:
+    for start, encoded_indices, encoded_values in self.__results:
+      indices = array("I")
+      indices.frombytes(encoded_indices)
+      values = marshal.loads(encoded_values)
+      for index, value in zip(indices, values):
+        yield self.__words[start + index], self.__decode(value)
+
+  def __len__(self) -> int:
+    return sum(len(encoded_indices) // array("I").itemsize for _, encoded_indices, _ in self.__results)
+
+
+def get_changed_entries(executor: Executor, method: Callable[[Word], Tuple[Word, Optional[Any]]], words: Sequence[Word], chunksize: int, encode: Callable[[Any], Any], decode: Callable[[Any], Any], silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  """
+  Processes the words in chunks; the workers return only the changed values of each chunk.
+  `method` returns the word and its new value or `None` if nothing changed.
+  """
+  process_method = partial(process_chunk, method=method, encode=encode)
+  return get_changed_entries_of_chunks(executor, process_method, words, chunksize, decode, silent, desc)
+
+
+def get_changed_entries_of_chunks(executor: Executor, process_method: Callable[[Tuple[int, List[Word]]], Optional[ChunkResult]], words: Sequence[Word], chunksize: int, decode: Callable[[Any], Any], silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  return collect_changed_entries(executor, process_method, get_chunks(words, chunksize), words, chunksize, decode, silent, desc)
+
+
+def collect_changed_entries(executor: Executor, process_method: Callable[[Tuple[int, List[Any]]], Optional[ChunkResult]], chunks: Iterable[Tuple[int, List[Any]]], words: Sequence[Word], chunksize: int, decode: Callable[[Any], Any], silent: bool, desc: Optional[str]) -> ChangedEntries:
+  results = []
+  with tqdm(total=len(words), unit="words", desc=desc, disable=silent) as progress_bar:
+    for result in executor.imap(process_method, chunks, 1):
+      if result is not None:
+        results.append(result)
+      progress_bar.update(min(chunksize, progress_bar.total - progress_bar.n))
+  return ChangedEntries(words, results, decode)
+
+
+def get_changed_pronunciations(executor: Executor, method: Callable[[Word], Tuple[Word, Optional[Pronunciations]]], words: Sequence[Word], chunksize: int, silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  return get_changed_entries(executor, method, words, chunksize, encode_pronunciations, decode_pronunciations, silent, desc)
+
+
+def get_changed_pronunciations_of_chunks(executor: Executor, method: Callable[[List[Word]], List[Optional[Pronunciations]]], words: Sequence[Word], chunksize: int, silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  """
+  Same as `get_changed_pronunciations` but `method` processes all words of a chunk at once and returns the
+  new pronunciations (or `None` if nothing changed) for each of them.
+  """
+  process_method = partial(process_entry_chunk, method=method, encode=encode_pronunciations)
+  return get_changed_entries_of_chunks(executor, process_method, words, chunksize, decode_pronunciations, silent, desc)
+
+
+def get_changed_pronunciations_of_entries(executor: Executor, method: Callable[[Pronunciations], Optional[Pronunciations]], dictionary: PronunciationDict, chunksize: int, silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  """
+  Same as `get_changed_pronunciations` but the pronunciations are sent to the workers together with the
+  words, i.e., the workers don't need access to the dictionary. `method` returns the new pronunciations
+  or `None` if nothing changed.
+  """
+  words = list(dictionary.keys())
+  process_method = partial(process_pronunciations_chunk, method=method)
+  chunks = get_chunks(dictionary.items(), chunksize)
+  return collect_changed_entries(executor, process_method, chunks, words, chunksize, decode_pronunciations, silent, desc)
+
+
+def get_changed_words(executor: Executor, method: Callable[[Word], Tuple[Word, Optional[Word]]], words: Sequence[Word], chunksize: int, silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  return get_changed_entries(executor, method, words, chunksize, encode_word, decode_word, silent, desc)
+
+
+def get_changed_words_of_chunks(executor: Executor, method: Callable[[List[Word]], List[Word]], words: Sequence[Word], chunksize: int, silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  """
+  Same as `get_changed_words` but `method` processes all words of a chunk at once and returns the new
+  word for each of them.
+  """
+  process_method = partial(process_word_chunk, method=method)
+  return get_changed_entries_of_chunks(executor, process_method, words, chunksize, decode_word, silent, desc)
@@ -0,0 +1,295 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from ordered_set import OrderedSet
+from pronunciation_dictionary import PronunciationDict, Symbol, Word
+
+from pronunciation_dictionary_utils.segment_operations import (get_offsets, get_segment_any,
+                                                               get_segment_ids, get_segment_sums)
+from pronunciation_dictionary_utils.validation import validate_dictionary, validate_type
+
+DEFAULT_EMPTY_WEIGHT = 1
+
+
+class ColumnarDictionary():
+  """
+  Column oriented (CSR) representation of a pronunciation dictionary:
+  - `words`: object array of the words
+  - `pronunciation_offsets`: pronunciations of word i are in [pronunciation_offsets[i], pronunciation_offsets[i + 1])
+  - `symbol_offsets`: symbols of pronunciation j are in [symbol_offsets[j], symbol_offsets[j + 1])
+  - `symbol_ids`: int32 ids of the symbols in `symbols`
+  - `symbols`: symbol table; each symbol is contained only once, new symbols are added via
+    `get_symbol_id`
+  - `weights`: float64 weight of each pronunciation
+  """
+
+  def __init__(self, words: np.ndarray, pronunciation_offsets: np.ndarray, symbol_offsets: np.ndarray, symbol_ids: np.ndarray, symbols: List[Symbol], weights: np.ndarray) -> None:
+    assert len(pronunciation_offsets) == len(words) + 1
+    assert len(symbol_offsets) == len(weights) + 1
+    self.words = words
+    self.pronunciation_offsets = pronunciation_offsets
+    self.symbol_offsets = symbol_offsets
+    self.symbol_ids = symbol_ids
+    self.symbols = symbols
+    self.weights = weights
+    self.__symbol_ids: Dict[Symbol, int] = {symbol: symbol_id for symbol_id, symbol in enumerate(symbols)}
+
+  @classmethod
+  def from_pronunciation_dict(cls, dictionary: PronunciationDict) -> "ColumnarDictionary":
+    if msg := validate_dictionary(dictionary):
+      raise ValueError(f"Parameter 'dictionary': {msg}")
+
+    symbols: List[Symbol] = []
+    symbol_to_id: Dict[Symbol, int] = {}
+    pronunciation_counts = []
+    symbol_counts = []
+    symbol_ids = []
+    weights = []
+    for pronunciations in dictionary.values():
+      pronunciation_counts.append(len(pronunciations))
+      for pronunciation, weight in pronunciations.items():
+        symbol_counts.append(len(pronunciation))
+        weights.append(weight)
+        for symbol in pronunciation:
+          symbol_id = symbol_to_id.get(symbol)
+          if symbol_id is None:
+            symbol_id = len(symbols)
+            symbols.append(symbol)
+            symbol_to_id[symbol] = symbol_id
+          symbol_ids.append(symbol_id)
+
+    words = np.empty(len(dictionary), dtype=object)
+    words[:] = list(dictionary.keys())
+    return cls(
+      words,
+      get_offsets(np.array(pronunciation_counts, dtype=np.int64)),
+      get_offsets(np.array(symbol_counts, dtype=np.int64)),
+      np.array(symbol_ids, dtype=np.int32),
+      symbols,
+      np.array(weights, dtype=np.float64),
+    )
+
+  def to_pronunciation_dict(self) -> PronunciationDict:
+    symbols = np.array(self.symbols, dtype=object)[self.symbol_ids].tolist()
+    symbol_offsets = self.symbol_offsets.tolist()
+    pronunciation_offsets = self.pronunciation_offsets.tolist()
+    weights = self.weights.tolist()
+    result = OrderedDict()
+    for i, word in enumerate(self.words.tolist()):
+      result[word] = OrderedDict((
+        (tuple(symbols[symbol_offsets[j]:symbol_offsets[j + 1]]), weights[j])
+        for j in range(pronunciation_offsets[i], pronunciation_offsets[i + 1])
+      ))
+    return result
+
+  def __len__(self) -> int:
+    return len(self.words)
+
+  @property
+  def pronunciation_counts(self) -> np.ndarray:
+    return np.diff(self.pronunciation_offsets)
+
+  @property
+  def symbol_counts(self) -> np.ndarray:
+    return np.diff(self.symbol_offsets)
+
+  def get_symbol_id(self, symbol: Symbol) -> int:
+    """
+    Returns the id of the symbol and adds it to the symbol table if it doesn't exist.
+    """
+    symbol_id = self.__symbol_ids.get(symbol)
+    if symbol_id is None:
+      symbol_id = len(self.symbols)
+      self.symbols.append(symbol)
+      self.__symbol_ids[symbol] = symbol_id
+    return symbol_id
+
+  def find_symbol_id(self, symbol: Symbol) -> Optional[int]:
+    """
+    Returns the id of the symbol or None if it doesn't exist.
+    """
+    return self.__symbol_ids.get(symbol)
+
+
+def merge_duplicate_pronunciations(dictionary: ColumnarDictionary, word_mask: np.ndarray) -> None:
+  """
+  Merges equal pronunciations of the words in `word_mask`; the first occurrence is kept and gets the sum
+  of the weights, like it is done when adding pronunciations to an `OrderedDict`.
+  """
+  pronunciation_word_ids = get_segment_ids(dictionary.pronunciation_offsets)
+  candidate_words = word_mask & (dictionary.pronunciation_counts > 1)
+  candidates = np.flatnonzero(candidate_words[pronunciation_word_ids])
+  if len(candidates) == 0:
+    return
+
+  # one row per pronunciation: word id followed by the symbol ids padded with -1
+  symbol_counts = dictionary.symbol_counts
+  candidate_lengths = symbol_counts[candidates]
+  rows = np.full((len(candidates), int(candidate_lengths.max()) + 1), -1, dtype=np.int64)
+  rows[:, 0] = pronunciation_word_ids[candidates]
+  row_ids = np.repeat(np.arange(len(candidates)), candidate_lengths)
+  column_ids = np.arange(len(row_ids)) - np.repeat(get_offsets(candidate_lengths)[:-1], candidate_lengths)
+  symbol_positions = np.repeat(dictionary.symbol_offsets[candidates], candidate_lengths) + column_ids
+  rows[row_ids, column_ids + 1] = dictionary.symbol_ids[symbol_positions]
+
+  _, first_indices, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+  inverse = inverse.reshape(-1)
+  if len(first_indices) == len(candidates):
+    return
+
+  group_weights = np.bincount(inverse, weights=dictionary.weights[candidates])
+  keep = np.ones(len(dictionary.weights), dtype=bool)
+  keep[candidates] = first_indices[inverse] == np.arange(len(candidates))
+  dictionary.weights[candidates[first_indices]] = group_weights
+  remove_pronunciations(dictionary, keep)
+
+
+def remove_pronunciations(dictionary: ColumnarDictionary, keep: np.ndarray) -> None:
+  pronunciation_word_ids = get_segment_ids(dictionary.pronunciation_offsets)
+  symbol_counts = dictionary.symbol_counts
+  dictionary.symbol_ids = dictionary.symbol_ids[np.repeat(keep, symbol_counts)]
+  dictionary.symbol_offsets = get_offsets(symbol_counts[keep])
+  dictionary.weights = dictionary.weights[keep]
+  dictionary.pronunciation_offsets = get_offsets(
+    np.bincount(pronunciation_word_ids[keep], minlength=len(dictionary.words)))
+
+
+def remove_words(dictionary: ColumnarDictionary, keep: np.ndarray) -> None:
+  pronunciation_keep = np.repeat(keep, dictionary.pronunciation_counts)
+  remove_pronunciations(dictionary, pronunciation_keep)
+  dictionary.words = dictionary.words[keep]
+  dictionary.pronunciation_offsets = get_offsets(dictionary.pronunciation_counts[keep])
+
+
+def normalize_weights_columnar(dictionary: ColumnarDictionary) -> int:
+  """
+  Divides the weights of each word by their sum. Returns the number of changed words.
+  """
+  if msg := validate_type(dictionary, ColumnarDictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+
+  weight_sums = get_segment_sums(dictionary.weights, dictionary.pronunciation_offsets)
+  pronunciation_sums = np.repeat(weight_sums, dictionary.pronunciation_counts)
+  divisible = pronunciation_sums != 0
+  new_weights = dictionary.weights.copy()
+  np.divide(dictionary.weights, pronunciation_sums, out=new_weights, where=divisible)
+  changed_pronunciations = new_weights != dictionary.weights
+  changed_words = get_segment_any(changed_pronunciations, dictionary.pronunciation_offsets)
+  dictionary.weights = new_weights
+  return int(np.count_nonzero(changed_words))
+
+
+def map_symbols_columnar(dictionary: ColumnarDictionary, symbols: OrderedSet[Symbol], map_to: List[Symbol]) -> Set[Word]:
+  """
+  Replaces each of the symbols with the symbols in `map_to` (full mapping). Returns the changed words.
+  """
+  if msg := validate_type(dictionary, ColumnarDictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if msg := validate_type(symbols, OrderedSet):
+    raise ValueError(f"Parameter 'symbols': {msg}")
+  if msg := validate_type(map_to, list):
+    raise ValueError(f"Parameter 'map_to': {msg}")
+
+  map_to_ids = np.array([dictionary.get_symbol_id(symbol) for symbol in map_to], dtype=np.int32)
+  replaced = np.zeros(len(dictionary.symbols), dtype=bool)
+  for symbol in symbols:
+    symbol_id = dictionary.find_symbol_id(symbol)
+    # mapping a symbol to itself changes nothing
+    if symbol_id is not None and map_to != [symbol]:
+      replaced[symbol_id] = True
+
+  symbol_replaced = replaced[dictionary.symbol_ids]
+  if not np.any(symbol_replaced):
+    return set()
+
+  # each replaced symbol becomes len(map_to) symbols
+  new_lengths = np.where(symbol_replaced, len(map_to), 1)
+  new_positions = get_offsets(new_lengths)
+  new_symbol_ids = np.empty(new_positions[-1], dtype=np.int32)
+  kept_positions = new_positions[:-1][~symbol_replaced]
+  new_symbol_ids[kept_positions] = dictionary.symbol_ids[~symbol_replaced]
+  if len(map_to) > 0:
+    replaced_positions = new_positions[:-1][symbol_replaced]
+    for i, map_to_id in enumerate(map_to_ids):
+      new_symbol_ids[replaced_positions + i] = map_to_id
+
+  changed_pronunciations = get_segment_any(symbol_replaced, dictionary.symbol_offsets)
+  changed_words = get_segment_any(changed_pronunciations, dictionary.pronunciation_offsets)
+
+  dictionary.symbol_offsets = new_positions[dictionary.symbol_offsets]
+  dictionary.symbol_ids = new_symbol_ids
+  merge_duplicate_pronunciations(dictionary, changed_words)
+
+  return set(dictionary.words[changed_words].tolist())
+
+
+def remove_symbols_from_pronunciations_columnar(dictionary: ColumnarDictionary, symbols: OrderedSet[Symbol], keep_empty: bool, empty_symbol: Optional[Symbol]) -> Tuple[OrderedSet[Word], int]:
+  """
+  Removes the symbols from all positions of the pronunciations (mode "all"). Words without remaining
+  pronunciations are removed or get the `empty_symbol` as pronunciation if `keep_empty` is set.
+  Returns the removed words and the number of changed words.
+  """
+  if msg := validate_type(dictionary, ColumnarDictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if msg := validate_type(symbols, OrderedSet):
+    raise ValueError(f"Parameter 'symbols': {msg}")
+  if msg := validate_type(keep_empty, bool):
+    raise ValueError(f"Parameter 'keep_empty': {msg}")
+  if empty_symbol is not None and (msg := validate_type(empty_symbol, str)):
+    raise ValueError(f"Parameter 'empty_symbol': {msg}")
+
+  removed = np.zeros(len(dictionary.symbols), dtype=bool)
+  for symbol in symbols:
+    symbol_id = dictionary.find_symbol_id(symbol)
+    if symbol_id is not None:
+      removed[symbol_id] = True
+
+  symbol_removed = removed[dictionary.symbol_ids]
+  if not np.any(symbol_removed):
+    return OrderedSet(), 0
+
+  changed_pronunciations = get_segment_any(symbol_removed, dictionary.symbol_offsets)
+  changed_words = get_segment_any(changed_pronunciations, dictionary.pronunciation_offsets)
+
+  dictionary.symbol_offsets = get_offsets(
+    get_segment_sums((~symbol_removed).astype(np.int64), dictionary.symbol_offsets))
+  dictionary.symbol_ids = dictionary.symbol_ids[~symbol_removed]
+  remove_pronunciations(dictionary, dictionary.symbol_counts > 0)
+  merge_duplicate_pronunciations(dictionary, changed_words)
+
+  empty_words = dictionary.pronunciation_counts == 0
+  removed_words = OrderedSet()
+  if np.any(empty_words):
+    if keep_empty:
+      assert empty_symbol is not None
+      set_single_pronunciation(dictionary, empty_words, dictionary.get_symbol_id(empty_symbol))
+    else:
+      removed_words = OrderedSet(dictionary.words[empty_words].tolist())
+      remove_words(dictionary, ~empty_words)
+
+  return removed_words, int(np.count_nonzero(changed_words))
+
+
+def set_single_pronunciation(dictionary: ColumnarDictionary, word_mask: np.ndarray, symbol_id: int) -> None:
+  """
+  Adds the pronunciation consisting of the symbol to the words without pronunciations in `word_mask`.
+  """
+  counts = dictionary.pronunciation_counts
+  assert np.all(counts[word_mask] == 0)
+  # position of the new pronunciations within the existing ones
+  insert_positions = dictionary.pronunciation_offsets[:-1][word_mask]
+  symbol_insert_positions = dictionary.symbol_offsets[insert_positions]
+  dictionary.weights = np.insert(dictionary.weights, insert_positions, DEFAULT_EMPTY_WEIGHT)
+  dictionary.symbol_ids = np.insert(dictionary.symbol_ids, symbol_insert_positions, symbol_id)
+  symbol_counts = np.insert(dictionary.symbol_counts, insert_positions, 1)
+  dictionary.symbol_offsets = get_offsets(symbol_counts)
+  dictionary.pronunciation_offsets = get_offsets(np.where(word_mask, 1, counts))
+
+
+def get_phoneme_set_columnar(dictionary: ColumnarDictionary) -> Set[Symbol]:
+  if msg := validate_type(dictionary, ColumnarDictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+
+  used_symbol_ids = np.unique(dictionary.symbol_ids)
+  return {dictionary.symbols[symbol_id] for symbol_id in used_symbol_ids.tolist()}
@@ -1,8 +1,11 @@
 from collections import OrderedDict
 
+import numpy as np
 from pronunciation_dictionary import PronunciationDict, Pronunciations
 
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciations
 from pronunciation_dictionary_utils.validation import validate_pronunciations
+from pronunciation_dictionary_utils.weight_engine import WeightTable
 
 
 def merge_pronunciations(pronunciations1: Pronunciations, pronunciations2: Pronunciations) -> bool:
@@ -10,7 +13,13 @@ def merge_pronunciations(pronunciations1: Pronunciations, pronunciations2: Pronu
     raise ValueError(f"Parameter 'pronunciations1': {msg}")
   if msg := validate_pronunciations(pronunciations2):
     raise ValueError(f"Parameter 'pronunciations2': {msg}")
+  return merge_valid_pronunciations(pronunciations1, pronunciations2)
 
+
+def merge_valid_pronunciations(pronunciations1: Pronunciations, pronunciations2: Pronunciations) -> bool:
+  """
+  Same as `merge_pronunciations` but without validating the parameters.
+  """
   if pronunciations1 == pronunciations2:
     return False
 
@@ -68,12 +77,20 @@ def merge_pronunciations(pronunciations1: Pronunciations, pronunciations2: Pronu
 
 
 def convert_weights_to_probabilities_dict(dictionary: PronunciationDict) -> None:
-  for pronunciations in dictionary.values():
-    convert_weights_to_probabilities(pronunciations)
+  weight_table = WeightTable.from_dictionary(dictionary)
+  new_weights, changed_words = weight_table.get_normalized_weights(ignore_zero_sums=False)
+  for index in np.flatnonzero(changed_words).tolist():
+    pronunciations = dictionary[weight_table.words[index]]
+    start, end = weight_table.offsets[index], weight_table.offsets[index + 1]
+    probs = weight_table.weights[start:end].tolist()
+    normed_probs = new_weights[start:end].tolist()
+    for pronunciation, prob, normed_prob in zip(list(pronunciations.keys()), probs, normed_probs):
+      if prob != normed_prob:
+        pronunciations[pronunciation] = normed_prob
 
 
 def convert_weights_to_probabilities(pronunciations: Pronunciations) -> bool:
-  assert isinstance(pronunciations, OrderedDict)
+  assert isinstance(pronunciations, (OrderedDict, CompactPronunciations))
   changed_anything = False
   sum_probs = sum(pronunciations.values())
   for pronunciation, prob in pronunciations.items():
@@ -0,0 +1,328 @@
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+
+from pronunciation_dictionary import Pronunciation, PronunciationDict, Pronunciations, Word
+
+COUNT = struct.Struct("<I")
+WEIGHT = struct.Struct("<d")
+LENGTH = struct.Struct("<I")
+SYMBOL_ID = struct.Struct("<I")
+
+
+class SymbolTable():
+  """
+  Assigns an id to each symbol; each symbol is stored only once per process. The table is shared by
+  all compact dictionaries of the process and lives as long as the process, i.e., symbols are never
+  removed (the symbol inventories of dictionaries are small). New symbols are added under a lock, so
+  compact dictionaries can be built from multiple threads.
+  """
+
+  def __init__(self) -> None:
+    self.__symbols: List[str] = []
+    self.__symbol_ids: Dict[str, int] = {}
+    self.__lock = threading.Lock()
+
+  def get_id(self, symbol: str) -> int:
+    symbol_id = self.__symbol_ids.get(symbol)
+    if symbol_id is None:
+      with self.__lock:
+        # another thread could have added the symbol in the meantime
+        symbol_id = self.__symbol_ids.get(symbol)
+        if symbol_id is None:
+          symbol_id = len(self.__symbols)
+          # the symbol needs to be decodable before its id is used
+          self.__symbols.append(symbol)
+          self.__symbol_ids[symbol] = symbol_id
+    return symbol_id
+
+  def find_ids(self, symbols: Tuple[str, ...]) -> Optional[Tuple[int, ...]]:
+    """
+    Returns the ids of the symbols without adding unknown symbols; returns None if a symbol is unknown.
+    """
+    symbol_ids = tuple(self.__symbol_ids.get(symbol) for symbol in symbols)
+    if None in symbol_ids:
+      return None
+    return symbol_ids
+
+  @property
+  def symbols(self) -> List[str]:
+    return self.__symbols
+
+
+# symbol table of all compact dictionaries of the process
+symbol_table = SymbolTable()
+
+
+def encode_pronunciations(items: Iterable[Tuple[Pronunciation, float]]) -> bytes:
+  weights = []
+  lengths = []
+  symbol_ids = []
+  for pronunciation, weight in items:
+    weights.append(weight)
+    lengths.append(len(pronunciation))
+    symbol_ids.extend(symbol_table.get_id(symbol) for symbol in pronunciation)
+  count = len(weights)
+  return struct.pack(f"<I{count}d{count}I{len(symbol_ids)}I", count, *weights, *lengths, *symbol_ids)
+
+
+def decode_pronunciations(data: bytes) -> List[Tuple[Pronunciation, float]]:
+  count, = COUNT.unpack_from(data, 0)
+  weights_and_lengths = struct.unpack_from(f"<{count}d{count}I", data, COUNT.size)
+  weights = weights_and_lengths[:count]
+  lengths = weights_and_lengths[count:]
+  symbol_count = sum(lengths)
+  symbol_ids = struct.unpack_from(f"<{symbol_count}I", data, COUNT.size + count * 12)
+  symbols = symbol_table.symbols
+  result = []
+  start = 0
+  for weight, length in zip(weights, lengths):
+    pronunciation = tuple(symbols[symbol_id] for symbol_id in symbol_ids[start:start + length])
+    result.append((pronunciation, weight))
+    start += length
+  return result
+
+
+def find_pronunciation(data: bytes, pronunciation: Pronunciation) -> Optional[Tuple[int, int]]:
+  """
+  Returns the index of the pronunciation and the index of its first symbol id in the encoded
+  pronunciations without decoding them; returns None if the pronunciation isn't contained.
+  """
+  if not isinstance(pronunciation, tuple):
+    return None
+  symbol_ids = symbol_table.find_ids(pronunciation)
+  if symbol_ids is None:
+    return None
+  count, = COUNT.unpack_from(data, 0)
+  lengths = struct.unpack_from(f"<{count}I", data, COUNT.size + count * WEIGHT.size)
+  all_symbol_ids = struct.unpack_from(
+    f"<{sum(lengths)}I", data, COUNT.size + count * (WEIGHT.size + LENGTH.size))
+  start = 0
+  for index, length in enumerate(lengths):
+    if length == len(symbol_ids) and all_symbol_ids[start:start + length] == symbol_ids:
+      return index, start
+    start += length
+  return None
+
+
+class CompactPronunciations(MutableMapping):
+  """
+  Memory efficient replacement for the `OrderedDict` of pronunciations of a word. All pronunciations
+  are encoded into one bytes object (weights as float64, symbols as ids of the symbol table). Like an
+  `OrderedDict`, the pronunciations keep their order and comparisons with ordered mappings consider it.
+  Single pronunciations are looked up, assigned and deleted on the encoded data, i.e., without decoding
+  the other pronunciations.
+  """
+
+  __slots__ = ("_data",)
+
+  def __init__(self, pronunciations: Optional[Union[Mapping[Pronunciation, float], Iterable[Tuple[Pronunciation, float]]]] = None) -> None:
+    if pronunciations is None:
+      pronunciations = ()
+    elif isinstance(pronunciations, Mapping):
+      pronunciations = pronunciations.items()
+    self._data = encode_pronunciations(pronunciations)
+
+  def __getitem__(self, pronunciation: Pronunciation) -> float:
+    position = find_pronunciation(self._data, pronunciation)
+    if position is None:
+      raise KeyError(pronunciation)
+    index, _ = position
+    return WEIGHT.unpack_from(self._data, COUNT.size + index * WEIGHT.size)[0]
+
+  def __contains__(self, pronunciation: object) -> bool:
+    return find_pronunciation(self._data, pronunciation) is not None
+
+  def __setitem__(self, pronunciation: Pronunciation, weight: float) -> None:
+    data = self._data
+    position = find_pronunciation(data, pronunciation)
+    if position is not None:
+      # only the weight is replaced
+      index, _ = position
+      weight_start = COUNT.size + index * WEIGHT.size
+      self._data = b"".join((
+        data[:weight_start],
+        WEIGHT.pack(weight),
+        data[weight_start + WEIGHT.size:],
+      ))
+      return
+    count, = COUNT.unpack_from(data, 0)
+    weights_end = COUNT.size + count * WEIGHT.size
+    lengths_end = weights_end + count * LENGTH.size
+    symbol_ids = [symbol_table.get_id(symbol) for symbol in pronunciation]
+    self._data = b"".join((
+      COUNT.pack(count + 1),
+      data[COUNT.size:weights_end],
+      WEIGHT.pack(weight),
+      data[weights_end:lengths_end],
+      LENGTH.pack(len(symbol_ids)),
+      data[lengths_end:],
+      struct.pack(f"<{len(symbol_ids)}I", *symbol_ids),
+    ))
+
+  def __delitem__(self, pronunciation: Pronunciation) -> None:
+    data = self._data
+    position = find_pronunciation(data, pronunciation)
+    if position is None:
+      raise KeyError(pronunciation)
+    index, symbols_index = position
+    count, = COUNT.unpack_from(data, 0)
+    weight_start = COUNT.size + index * WEIGHT.size
+    lengths_start = COUNT.size + count * WEIGHT.size
+    length_start = lengths_start + index * LENGTH.size
+    length, = LENGTH.unpack_from(data, length_start)
+    symbols_start = lengths_start + count * LENGTH.size + symbols_index * SYMBOL_ID.size
+    self._data = b"".join((
+      COUNT.pack(count - 1),
+      data[COUNT.size:weight_start],
+      data[weight_start + WEIGHT.size:length_start],
+      data[length_start + LENGTH.size:symbols_start],
+      data[symbols_start + length * SYMBOL_ID.size:],
+    ))
+
+  def __iter__(self) -> Iterator[Pronunciation]:
+    for pronunciation, _ in decode_pronunciations(self._data):
+      yield pronunciation
+
+  def __len__(self) -> int:
+    return COUNT.unpack_from(self._data, 0)[0]
+
+  def items(self):
+    return decode_pronunciations(self._data)
+
+  def values(self):
+    return [weight for _, weight in decode_pronunciations(self._data)]
+
+  def __eq__(self, other: object) -> bool:
+    if isinstance(other, (OrderedDict, CompactPronunciations)):
+      return list(self.items()) == list(other.items())
+    if isinstance(other, Mapping):
+      return dict(self.items()) == dict(other.items())
+    return NotImplemented
+
+  def __ne__(self, other: object) -> bool:
+    result = self.__eq__(other)
+    if result is NotImplemented:
+      return result
+    return not result
+
+  __hash__ = None
+
+  def __repr__(self) -> str:
+    return f"{type(self).__name__}({self.items()!r})"
+
+  def __reduce__(self):
+    return type(self), (self.items(),)
+
+  def copy(self) -> "CompactPronunciations":
+    result = CompactPronunciations.__new__(CompactPronunciations)
+    result._data = self._data
+    return result
+
+  def to_pronunciations(self) -> Pronunciations:
+    return OrderedDict(self.items())
+
+
+class CompactPronunciationDict(MutableMapping):
+  """
+  Memory efficient replacement for a `PronunciationDict` which stores the pronunciations of each word
+  as `CompactPronunciations` in an insertion ordered `dict`. Assigned pronunciations are converted
+  automatically; all functions of this library accept it instead of a `PronunciationDict`.
+  """
+
+  __slots__ = ("_entries",)
+
+  def __init__(self, dictionary: Optional[Union[Mapping[Word, Pronunciations], Iterable[Tuple[Word, Pronunciations]]]] = None) -> None:
+    self._entries: Dict[Word, CompactPronunciations] = {}
+    if dictionary is not None:
+      self.update(dictionary)
+
+  def __getitem__(self, word: Word) -> CompactPronunciations:
+    return self._entries[word]
+
+  def __setitem__(self, word: Word, pronunciations: Pronunciations) -> None:
+    if not isinstance(pronunciations, CompactPronunciations):
+      pronunciations = CompactPronunciations(pronunciations)
+    self._entries[word] = pronunciations
+
+  def __delitem__(self, word: Word) -> None:
+    del self._entries[word]
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries)
+
+  def __reversed__(self) -> Iterator[Word]:
+    return reversed(list(self._entries))
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries
+
+  def keys(self):
+    return self._entries.keys()
+
+  def values(self):
+    return self._entries.values()
+
+  def items(self):
+    return self._entries.items()
+
+  def clear(self) -> None:
+    self._entries.clear()
+
+  def popitem(self, last: bool = True) -> Tuple[Word, CompactPronunciations]:
+    if len(self._entries) == 0:
+      raise KeyError("dictionary is empty")
+    word = next(reversed(self._entries)) if last else next(iter(self._entries))
+    return word, self._entries.pop(word)
+
+  def move_to_end(self, word: Word, last: bool = True) -> None:
+    pronunciations = self._entries.pop(word)
+    if last:
+      self._entries[word] = pronunciations
+    else:
+      self._entries = {word: pronunciations, **self._entries}
+
+  def __eq__(self, other: object) -> bool:
+    if isinstance(other, (OrderedDict, CompactPronunciationDict)):
+      return len(self) == len(other) and all(
+        word1 == word2 and pronunciations1 == pronunciations2
+        for (word1, pronunciations1), (word2, pronunciations2) in zip(self.items(), other.items())
+      )
+    if isinstance(other, Mapping):
+      return len(self) == len(other) and all(
+        word in other and other[word] == pronunciations
+        for word, pronunciations in self.items()
+      )
+    return NotImplemented
+
+  def __ne__(self, other: object) -> bool:
+    result = self.__eq__(other)
+    if result is NotImplemented:
+      return result
+    return not result
+
+  __hash__ = None
+
+  def __repr__(self) -> str:
+    return f"{type(self).__name__}({list(self.items())!r})"
+
+  def __reduce__(self):
+    return type(self), (list(self.items()),)
+
+  def copy(self) -> "CompactPronunciationDict":
+    result = CompactPronunciationDict()
+    result._entries = {
+      word: pronunciations.copy()
+      for word, pronunciations in self._entries.items()
+    }
+    return result
+
+  def to_pronunciation_dict(self) -> PronunciationDict:
+    return OrderedDict((
+      (word, pronunciations.to_pronunciations())
+      for word, pronunciations in self._entries.items()
+    ))
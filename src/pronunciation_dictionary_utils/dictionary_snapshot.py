@@ -0,0 +1,182 @@
+import marshal
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator, List, Mapping, Optional
+from zlib import crc32
+
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
+
+# entry count, size of the hash table
+HEADER = struct.Struct("<QQ")
+WORD_LENGTH = struct.Struct("<I")
+OFFSET_SIZE = 8
+
+
+def cast_offsets(buffer: memoryview) -> memoryview:
+  """
+  Returns a view of the buffer as little-endian unsigned 64-bit integers like they are written by
+  `encode_dictionary`. The buffer is only copied if the system uses another byte order.
+  """
+  if sys.byteorder == "little":
+    return buffer.cast("Q")
+  count = len(buffer) // OFFSET_SIZE
+  return memoryview(array("Q", struct.unpack(f"<{count}Q", buffer)))
+
+
+def get_table_size(entry_count: int) -> int:
+  table_size = 1
+  while table_size < entry_count * 2:
+    table_size *= 2
+  return table_size
+
+
+def encode_entry(word: Word, pronunciations: Pronunciations) -> bytes:
+  encoded_word = word.encode("utf-8")
+  encoded_pronunciations = marshal.dumps(tuple(pronunciations.items()))
+  return WORD_LENGTH.pack(len(encoded_word)) + encoded_word + encoded_pronunciations
+
+
+def encode_dictionary(dictionary: PronunciationDict) -> List[bytes]:
+  """
+  Encodes the dictionary into parts which need to be concatenated. The encoding consists of a header,
+  the offsets of the entries, an open addressing hash table which maps the words to the entries and
+  the entries itself.
+  """
+  entries = [
+    encode_entry(word, pronunciations)
+    for word, pronunciations in dictionary.items()
+  ]
+  entry_count = len(entries)
+  table_size = get_table_size(entry_count)
+
+  data_start = HEADER.size + (entry_count + 1) * OFFSET_SIZE + table_size * OFFSET_SIZE
+  offsets = [data_start]
+  for entry in entries:
+    offsets.append(offsets[-1] + len(entry))
+
+  # stores index + 1 of the entry, 0 marks an empty slot
+  table = [0] * table_size
+  mask = table_size - 1
+  for index, word in enumerate(dictionary.keys()):
+    slot = crc32(word.encode("utf-8")) & mask
+    while table[slot] != 0:
+      slot = (slot + 1) & mask
+    table[slot] = index + 1
+
+  result = [
+    HEADER.pack(entry_count, table_size),
+    struct.pack(f"<{entry_count + 1}Q", *offsets),
+    struct.pack(f"<{table_size}Q", *table),
+  ]
+  result.extend(entries)
+  return result
+
+
+class DictionarySnapshot(Mapping):
+  """
+  Read-only view of an encoded dictionary. Entries are decoded on access; the buffer is not copied.
+  """
+
+  def __init__(self, buffer: memoryview) -> None:
+    self.__entry_count, self.__table_size = HEADER.unpack_from(buffer, 0)
+    offsets_start = HEADER.size
+    table_start = offsets_start + (self.__entry_count + 1) * OFFSET_SIZE
+    table_end = table_start + self.__table_size * OFFSET_SIZE
+    self.__buffer = buffer[:]
+    self.__offsets = cast_offsets(buffer[offsets_start:table_start])
+    self.__table = cast_offsets(buffer[table_start:table_end])
+
+  def __get_word_range(self, index: int):
+    start = self.__offsets[index]
+    word_length, = WORD_LENGTH.unpack_from(self.__buffer, start)
+    word_start = start + WORD_LENGTH.size
+    return word_start, word_start + word_length
+
+  def find_index(self, word: Word) -> Optional[int]:
+    encoded_word = word.encode("utf-8")
+    mask = self.__table_size - 1
+    slot = crc32(encoded_word) & mask
+    while (value := self.__table[slot]) != 0:
+      index = value - 1
+      word_start, word_end = self.__get_word_range(index)
+      if self.__buffer[word_start:word_end] == encoded_word:
+        return index
+      slot = (slot + 1) & mask
+    return None
+
+  def get_word(self, index: int) -> Word:
+    word_start, word_end = self.__get_word_range(index)
+    return str(self.__buffer[word_start:word_end], "utf-8")
+
+  def get_pronunciations(self, index: int) -> Pronunciations:
+    _, word_end = self.__get_word_range(index)
+    entry_end = self.__offsets[index + 1]
+    return OrderedDict(marshal.loads(self.__buffer[word_end:entry_end]))
+
+  def __getitem__(self, word: Word) -> Pronunciations:
+    index = self.find_index(word)
+    if index is None:
+      raise KeyError(word)
+    return self.get_pronunciations(index)
+
+  def __contains__(self, word: object) -> bool:
+    return isinstance(word, str) and self.find_index(word) is not None
+
+  def __iter__(self) -> Iterator[Word]:
+    for index in range(self.__entry_count):
+      yield self.get_word(index)
+
+  def __len__(self) -> int:
+    return self.__entry_count
+
+  def release(self) -> None:
+    self.__offsets.release()
+    self.__table.release()
+    self.__buffer.release()
+
+
+class SharedDictionarySnapshot():
+  """
+  Encoded dictionary in shared memory which worker processes can attach to by name independent of the
+  start method, i.e., the dictionary is neither pickled for each worker nor copied on write.
+  """
+
+  def __init__(self, shared_memory: SharedMemory, owner: bool) -> None:
+    self.__shared_memory = shared_memory
+    self.__owner = owner
+    self.__snapshot = DictionarySnapshot(shared_memory.buf)
+
+  @classmethod
+  def create(cls, dictionary: PronunciationDict) -> "SharedDictionarySnapshot":
+    parts = encode_dictionary(dictionary)
+    size = sum(len(part) for part in parts)
+    shared_memory = SharedMemory(create=True, size=size)
+    position = 0
+    for part in parts:
+      shared_memory.buf[position:position + len(part)] = part
+      position += len(part)
+    return cls(shared_memory, owner=True)
+
+  @classmethod
+  def attach(cls, name: str) -> "SharedDictionarySnapshot":
+    return cls(SharedMemory(name=name), owner=False)
+
+  @property
+  def name(self) -> str:
+    return self.__shared_memory.name
+
+  @property
+  def snapshot(self) -> DictionarySnapshot:
+    return self.__snapshot
+
+  def close(self) -> None:
+    """
+    Detaches from the shared memory and frees it if this instance has created it.
+    """
+    self.__snapshot.release()
+    self.__shared_memory.close()
+    if self.__owner:
+      self.__shared_memory.unlink()
@@ -0,0 +1,228 @@
+import re
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import (MultiprocessingOptions, PronunciationDict, Pronunciations,
+                                      Symbol, Word)
+
+from pronunciation_dictionary_utils.chunk_processing import (get_changed_pronunciations,
+                                                             get_changed_pronunciations_of_entries)
+from pronunciation_dictionary_utils.executors import get_process_lookup_dict, invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.pronunciations_map_symbols import (map_pronunciations_full,
+                                                                       map_pronunciations_partial)
+from pronunciation_dictionary_utils.pronunciations_remove_symbols import (DEFAULT_EMPTY_WEIGHT,
+                                                                          remove_symbols_from_pronunciations_entry)
+from pronunciation_dictionary_utils.pronunciations_replace_pronunciation import \
+  replace_symbols_from_pronunciations_entry
+from pronunciation_dictionary_utils.pronunciations_sorting import sort_pronunciations_entry
+from pronunciation_dictionary_utils.single_pronunciation_selection import (SelectionMode,
+                                                                           select_single_pronunciation_entry,
+                                                                           validate_selection_mode)
+from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
+                                                       validate_removal_mode, validate_seed,
+                                                       validate_type)
+from pronunciation_dictionary_utils.weights_normalization import \
+  normalize_pronunciations_weights_entry
+
+# Transforms the pronunciations of one word; an empty result removes the word.
+EntryOperator = Callable[[Pronunciations], Pronunciations]
+
+
+def get_map_symbols_operator(symbols: OrderedSet[Symbol], map_to: Union[List[Symbol], Symbol], partial_mapping: bool) -> EntryOperator:
+  """
+  Operator of `map_symbols`.
+  """
+  if msg := validate_type(symbols, OrderedSet):
+    raise ValueError(f"Parameter 'symbols': {msg}")
+  if len(symbols) == 0:
+    raise ValueError("Parameter 'symbols': At least one symbol needs to be passed!")
+  if msg := validate_type(partial_mapping, bool):
+    raise ValueError(f"Parameter 'partial_mapping': {msg}")
+  if partial_mapping:
+    if msg := validate_type(map_to, str):
+      raise ValueError(f"Parameter 'map_to': {msg}")
+    return partial(map_pronunciations_partial, replace_symbols=symbols, map_symbol=map_to)
+  if msg := validate_type(map_to, list):
+    raise ValueError(f"Parameter 'map_to': {msg}")
+  return partial(map_pronunciations_full, replace_symbols=symbols, mapping_symbols=map_to)
+
+
+def get_remove_symbols_operator(symbols: OrderedSet[Symbol], mode: str, keep_empty: bool, empty_symbol: Optional[Symbol]) -> EntryOperator:
+  """
+  Operator of `remove_symbols_from_pronunciations`.
+  """
+  if msg := validate_type(symbols, OrderedSet):
+    raise ValueError(f"Parameter 'symbols': {msg}")
+  if msg := validate_removal_mode(mode):
+    raise ValueError(f"Parameter 'mode': {msg}")
+  if msg := validate_type(keep_empty, bool):
+    raise ValueError(f"Parameter 'keep_empty': {msg}")
+  if keep_empty and (msg := validate_type(empty_symbol, str)):
+    raise ValueError(f"Parameter 'empty_symbol': {msg}")
+  return partial(
+    remove_symbols_operator,
+    symbols=symbols,
+    mode=mode,
+    empty_symbol=empty_symbol if keep_empty else None,
+  )
+
+
+def get_replace_symbols_operator(text: str, replace_with: str, keep_empty: bool, empty_symbol: Optional[Symbol]) -> EntryOperator:
+  """
+  Operator of `replace_symbols_in_pronunciations`.
+  """
+  if msg := validate_type(text, str):
+    raise ValueError(f"Parameter 'text': {msg}")
+  if msg := validate_type(replace_with, str):
+    raise ValueError(f"Parameter 'replace_with': {msg}")
+  if msg := validate_type(keep_empty, bool):
+    raise ValueError(f"Parameter 'keep_empty': {msg}")
+  if keep_empty and (msg := validate_type(empty_symbol, str)):
+    raise ValueError(f"Parameter 'empty_symbol': {msg}")
+  if len(text) == 0:
+    return keep_pronunciations
+  return partial(
+    replace_symbols_operator,
+    pattern=re.compile(text),
+    replace_with=replace_with,
+    empty_symbol=empty_symbol if keep_empty else None,
+  )
+
+
+def get_sort_pronunciations_operator(descending: bool, ignore_weight: bool) -> EntryOperator:
+  """
+  Operator of `sort_pronunciations`.
+  """
+  if msg := validate_type(descending, bool):
+    raise ValueError(f"Parameter 'descending': {msg}")
+  if msg := validate_type(ignore_weight, bool):
+    raise ValueError(f"Parameter 'ignore_weight': {msg}")
+  return partial(sort_pronunciations_entry, descending=descending, ignore_weight=ignore_weight)
+
+
+def get_normalize_weights_operator() -> EntryOperator:
+  """
+  Operator of `normalize_weights`.
+  """
+  return normalize_pronunciations_weights_entry
+
+
+def get_select_single_pronunciation_operator(mode: SelectionMode, seed: Optional[int]) -> EntryOperator:
+  """
+  Operator of `select_single_pronunciation`.
+  """
+  if msg := validate_selection_mode(mode):
+    raise ValueError(f"Parameter 'mode': {msg}")
+  if seed is not None and (msg := validate_seed(seed)):
+    raise ValueError(f"Parameter 'seed': {msg}")
+  return partial(select_single_pronunciation_entry, mode=mode, seed=seed)
+
+
+def apply_entry_operators(dictionary: PronunciationDict, operators: Sequence[EntryOperator], mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None, transfer_entries: bool = False) -> Tuple[OrderedSet[Word], OrderedSet[Word]]:
+  """
+  Applies all operators one after another to each entry in one pass over the dictionary, i.e., each
+  word is dispatched and its result is transferred only once. Returns the changed words and the
+  words which were removed because no pronunciations were left.
+  If `transfer_entries` is set, the pronunciations are sent to the workers instead of giving them
+  access to the dictionary, i.e., the workers of a session can be reused for many small dictionaries
+  (e.g., the parts of a streamed dictionary).
+  """
+  if msg := validate_dictionary(dictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if not isinstance(operators, (list, tuple)):
+    raise ValueError("Parameter 'operators': Value needs of type 'list' or 'tuple'!")
+  for operator in operators:
+    if not callable(operator):
+      raise ValueError("Parameter 'operators': Operators need to be callable!")
+  if msg := validate_mp_options(mp_options):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
+  if msg := validate_type(transfer_entries, bool):
+    raise ValueError(f"Parameter 'transfer_entries': {msg}")
+
+  if len(operators) == 0:
+    return OrderedSet(), OrderedSet()
+
+  with use_session(session, mp_options) as current_session:
+    if transfer_entries:
+      executor = current_session.get_executor()
+      process_method = partial(
+        process_apply_entry_operators_to_pronunciations,
+        operators=tuple(operators),
+      )
+      changed_entries = get_changed_pronunciations_of_entries(
+        executor, process_method, dictionary, mp_options.chunksize, silent)
+    else:
+      executor = current_session.get_executor(dictionary)
+      process_method = partial(
+        process_apply_entry_operators,
+        operators=tuple(operators),
+      )
+      entries = OrderedSet(dictionary.keys())
+      changed_entries = get_changed_pronunciations(
+        executor, process_method, entries, mp_options.chunksize, silent)
+
+  changed_words = OrderedSet()
+  removed_words = OrderedSet()
+  for word, new_pronunciations in changed_entries:
+    if len(new_pronunciations) == 0:
+      removed_words.add(word)
+      dictionary.pop(word)
+    else:
+      dictionary[word] = new_pronunciations
+    changed_words.add(word)
+
+  if len(changed_words) > 0:
+    invalidate_dictionary(dictionary)
+
+  return changed_words, removed_words
+
+
+def process_apply_entry_operators(word: Word, operators: Tuple[EntryOperator, ...]) -> Tuple[Word, Optional[Pronunciations]]:
+  pronunciations = get_process_lookup_dict()[word]
+  new_pronunciations = apply_entry_operators_entry(pronunciations, operators)
+  if new_pronunciations == pronunciations:
+    return word, None
+  return word, new_pronunciations
+
+
+def process_apply_entry_operators_to_pronunciations(pronunciations: Pronunciations, operators: Tuple[EntryOperator, ...]) -> Optional[Pronunciations]:
+  new_pronunciations = apply_entry_operators_entry(pronunciations, operators)
+  if new_pronunciations == pronunciations:
+    return None
+  return new_pronunciations
+
+
+def apply_entry_operators_entry(pronunciations: Pronunciations, operators: Sequence[EntryOperator]) -> Pronunciations:
+  for operator in operators:
+    if len(pronunciations) == 0:
+      # the word will be removed
+      break
+    pronunciations = operator(pronunciations)
+  return pronunciations
+
+
+def keep_pronunciations(pronunciations: Pronunciations) -> Pronunciations:
+  return pronunciations
+
+
+def get_empty_symbol_if_empty(pronunciations: Pronunciations, empty_symbol: Optional[Symbol]) -> Pronunciations:
+  if len(pronunciations) == 0 and empty_symbol is not None:
+    return OrderedDict((
+      ((empty_symbol,), DEFAULT_EMPTY_WEIGHT),
+    ))
+  return pronunciations
+
+
+def remove_symbols_operator(pronunciations: Pronunciations, symbols: OrderedSet[Symbol], mode: str, empty_symbol: Optional[Symbol]) -> Pronunciations:
+  new_pronunciations = remove_symbols_from_pronunciations_entry(pronunciations, symbols, mode)
+  return get_empty_symbol_if_empty(new_pronunciations, empty_symbol)
+
+
+def replace_symbols_operator(pronunciations: Pronunciations, pattern: re.Pattern, replace_with: str, empty_symbol: Optional[Symbol]) -> Pronunciations:
+  new_pronunciations = replace_symbols_from_pronunciations_entry(pronunciations, pattern, replace_with)
+  return get_empty_symbol_if_empty(new_pronunciations, empty_symbol)
@@ -0,0 +1,346 @@
+import gc
+import os
+import pickle
+import threading
+from functools import partial
+from itertools import chain, islice
+from math import ceil
+from multiprocessing import get_start_method
+from multiprocessing.pool import Pool, ThreadPool
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, TypeVar
+from weakref import WeakSet
+
+from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict
+
+from pronunciation_dictionary_utils.dictionary_snapshot import SharedDictionarySnapshot
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Backend = Literal["inline", "thread", "process", "auto"]
+BACKENDS = ("inline", "thread", "process", "auto")
+
+# amount of items that are processed inline to measure the cost per item
+AUTO_PROBE_SIZE = 100
+# maximum duration of the inline processing to measure the cost per item
+AUTO_MAX_PROBE_DURATION = 0.05
+# estimated duration to start the worker processes
+AUTO_POOL_START_DURATION = 0.05
+# estimated duration to encode one entry into a shared snapshot
+AUTO_SNAPSHOT_DURATION_PER_ENTRY = 5e-6
+# maximum amount of items which are read ahead of an iterator of unknown length
+AUTO_MAX_LOOKAHEAD = 10000
+
+# lookup dictionary of the worker processes
+process_lookup_dict: PronunciationDict = None
+process_shared_snapshot: Optional[SharedDictionarySnapshot] = None
+# lookup dictionary of the items which are currently processed by inline and thread executors
+thread_state = threading.local()
+# process executors whose workers hold a copy of a dictionary
+process_executors: "WeakSet[ProcessExecutor]" = WeakSet()
+
+
+def init_process_lookup_dict(lookup_dict: Optional[PronunciationDict]) -> None:
+  global process_lookup_dict
+  process_lookup_dict = lookup_dict
+
+
+def init_process_shared_lookup_dict(shared_memory_name: Optional[str]) -> None:
+  global process_shared_snapshot
+  if shared_memory_name is None:
+    init_process_lookup_dict(None)
+    return
+  # keep the reference, otherwise the shared memory would be detached
+  process_shared_snapshot = SharedDictionarySnapshot.attach(shared_memory_name)
+  init_process_lookup_dict(process_shared_snapshot.snapshot)
+
+
+def get_process_lookup_dict() -> PronunciationDict:
+  lookup_dict = getattr(thread_state, "lookup_dict", None)
+  if lookup_dict is None:
+    lookup_dict = process_lookup_dict
+  assert lookup_dict is not None
+  return lookup_dict
+
+
+def process_with_lookup_dict(item: T, method: Callable[[T], R], lookup_dict: Optional[PronunciationDict]) -> R:
+  previous_lookup_dict = getattr(thread_state, "lookup_dict", None)
+  thread_state.lookup_dict = lookup_dict
+  try:
+    return method(item)
+  finally:
+    thread_state.lookup_dict = previous_lookup_dict
+
+
+def bind_lookup_dict(method: Callable[[T], R], lookup_dict: Optional[PronunciationDict]) -> Callable[[T], R]:
+  """
+  Returns `method` which reads `lookup_dict` via `get_process_lookup_dict` in the current thread, i.e.,
+  executors in the same process don't overwrite each other's dictionaries.
+  """
+  return partial(process_with_lookup_dict, method=method, lookup_dict=lookup_dict)
+
+
+def invalidate_dictionary(dictionary: PronunciationDict) -> None:
+  """
+  Marks the copies of the dictionary in the workers of all sessions as outdated; needs to be called
+  after the dictionary was changed.
+  """
+  for executor in list(process_executors):
+    executor.invalidate_dictionary(dictionary)
+
+
+def uses_shared_snapshot() -> bool:
+  """
+  Forked workers inherit the dictionary of the parent process; with other start methods it would be
+  pickled for each worker, therefore they attach to a shared snapshot instead.
+  """
+  return get_start_method() != "fork"
+
+
+def validate_backend(backend: str) -> Optional[str]:
+  if backend not in BACKENDS:
+    return "Value needs to be 'inline', 'thread', 'process' or 'auto'!"
+  return None
+
+
+class Executor():
+  def prepare(self, dictionary: Optional[PronunciationDict]) -> None:
+    """
+    Ensures that the workers can access the current state of the dictionary.
+    """
+    raise NotImplementedError()
+
+  def invalidate(self) -> None:
+    pass
+
+  def imap(self, method: Callable[[T], R], items: Iterable[T], chunksize: int) -> Iterator[R]:
+    raise NotImplementedError()
+
+  def close(self) -> None:
+    pass
+
+
+class InlineExecutor(Executor):
+  """
+  Processes all items serially in the current process.
+  """
+
+  def __init__(self) -> None:
+    self.__dictionary: Optional[PronunciationDict] = None
+
+  def prepare(self, dictionary: Optional[PronunciationDict]) -> None:
+    if dictionary is not None:
+      self.__dictionary = dictionary
+
+  def imap(self, method: Callable[[T], R], items: Iterable[T], chunksize: int) -> Iterator[R]:
+    return map(bind_lookup_dict(method, self.__dictionary), items)
+
+  def close(self) -> None:
+    self.__dictionary = None
+
+
+class ThreadExecutor(Executor):
+  """
+  Processes the items in a thread pool; the threads access the dictionary directly.
+  """
+
+  def __init__(self, mp_options: MultiprocessingOptions) -> None:
+    self.__mp_options = mp_options
+    self.__pool: Optional[ThreadPool] = None
+    self.__dictionary: Optional[PronunciationDict] = None
+
+  def prepare(self, dictionary: Optional[PronunciationDict]) -> None:
+    if dictionary is not None:
+      self.__dictionary = dictionary
+    if self.__pool is None:
+      self.__pool = ThreadPool(processes=self.__mp_options.n_jobs)
+
+  def imap(self, method: Callable[[T], R], items: Iterable[T], chunksize: int) -> Iterator[R]:
+    assert self.__pool is not None
+    return self.__pool.imap(bind_lookup_dict(method, self.__dictionary), items, chunksize)
+
+  def close(self) -> None:
+    if self.__pool is not None:
+      self.__pool.terminate()
+      self.__pool.join()
+      self.__pool = None
+    self.__dictionary = None
+
+
+class ProcessExecutor(Executor):
+  """
+  Processes the items in a process pool. Forked workers inherit the last prepared dictionary, otherwise
+  they attach to an encoded snapshot of it in shared memory. The workers are only restarted if another
+  dictionary is prepared or the dictionary was invalidated in the meantime.
+  """
+
+  def __init__(self, mp_options: MultiprocessingOptions) -> None:
+    self.__mp_options = mp_options
+    self.__pool: Optional[Pool] = None
+    self.__shared_snapshot: Optional[SharedDictionarySnapshot] = None
+    self.__dictionary: Optional[PronunciationDict] = None
+    self.__outdated = False
+    process_executors.add(self)
+
+  @property
+  def is_open(self) -> bool:
+    return self.__pool is not None
+
+  def is_current(self, dictionary: Optional[PronunciationDict]) -> bool:
+    """
+    Returns whether the workers are running and hold the current state of the dictionary.
+    """
+    if self.__pool is None:
+      return False
+    return dictionary is None or (dictionary is self.__dictionary and not self.__outdated)
+
+  def prepare(self, dictionary: Optional[PronunciationDict]) -> None:
+    if self.__pool is not None and not self.is_current(dictionary):
+      self.close()
+
+    if self.__pool is None:
+      if dictionary is not None and uses_shared_snapshot():
+        self.__shared_snapshot = SharedDictionarySnapshot.create(dictionary)
+        initializer, initargs = init_process_shared_lookup_dict, (self.__shared_snapshot.name,)
+      else:
+        initializer, initargs = init_process_lookup_dict, (dictionary,)
+      # forked workers would otherwise copy the pages of all objects they visit during garbage collection
+      gc.freeze()
+      try:
+        self.__pool = Pool(
+          processes=self.__mp_options.n_jobs,
+          initializer=initializer,
+          initargs=initargs,
+          maxtasksperchild=self.__mp_options.maxtasksperchild,
+        )
+      finally:
+        gc.unfreeze()
+      self.__dictionary = dictionary
+      self.__outdated = False
+
+  def invalidate(self) -> None:
+    self.__outdated = True
+
+  def invalidate_dictionary(self, dictionary: PronunciationDict) -> None:
+    if dictionary is self.__dictionary:
+      self.__outdated = True
+
+  def imap(self, method: Callable[[T], R], items: Iterable[T], chunksize: int) -> Iterator[R]:
+    assert self.__pool is not None
+    return self.__pool.imap(method, items, chunksize)
+
+  def close(self) -> None:
+    if self.__pool is not None:
+      self.__pool.terminate()
+      self.__pool.join()
+      self.__pool = None
+    if self.__shared_snapshot is not None:
+      self.__shared_snapshot.close()
+      self.__shared_snapshot = None
+    self.__dictionary = None
+    self.__outdated = False
+
+
+class AutoExecutor(Executor):
+  """
+  Processes the first items (at most 100 or 50 ms) inline to measure the cost per item and the cost to
+  send an item and its result between processes. The remaining items are processed in a process pool
+  only if the expected savings outweigh the start of the pool (incl. the snapshot of the dictionary).
+  """
+
+  def __init__(self, mp_options: MultiprocessingOptions) -> None:
+    self.__mp_options = mp_options
+    self.__inline_executor = InlineExecutor()
+    self.__process_executor = ProcessExecutor(mp_options)
+    self.__dictionary: Optional[PronunciationDict] = None
+
+  @property
+  def is_open(self) -> bool:
+    return self.__process_executor.is_open
+
+  def prepare(self, dictionary: Optional[PronunciationDict]) -> None:
+    self.__dictionary = dictionary
+    self.__inline_executor.prepare(dictionary)
+
+  def invalidate(self) -> None:
+    self.__process_executor.invalidate()
+
+  def imap(self, method: Callable[[T], R], items: Iterable[T], chunksize: int) -> Iterator[R]:
+    total = len(items) if hasattr(items, "__len__") else None
+    iterator = iter(items)
+
+    probe_method = bind_lookup_dict(method, self.__dictionary)
+    probe_items = []
+    probe_results = []
+    start = perf_counter()
+    for item in islice(iterator, AUTO_PROBE_SIZE):
+      probe_items.append(item)
+      probe_results.append(probe_method(item))
+      if perf_counter() - start >= AUTO_MAX_PROBE_DURATION:
+        break
+    duration = perf_counter() - start
+    probe_count = len(probe_results)
+    transfer_duration = get_transfer_duration(probe_items, probe_results)
+    yield from probe_results
+
+    remaining = iterator
+    use_processes = False
+    worker_count = min(self.__mp_options.n_jobs, os.cpu_count() or 1)
+    if probe_count > 0 and worker_count > 1:
+      duration_per_item = duration / probe_count
+      transfer_duration_per_item = transfer_duration / probe_count
+      # the parent process sends and receives all items, the workers process them in parallel
+      worker_duration_per_item = (duration_per_item + transfer_duration_per_item) / worker_count
+      parallel_duration_per_item = transfer_duration_per_item + worker_duration_per_item
+      saved_duration_per_item = duration_per_item - parallel_duration_per_item
+      if saved_duration_per_item > 0:
+        min_count = ceil(self.__get_setup_duration() / saved_duration_per_item)
+        if total is not None:
+          use_processes = total - probe_count > min_count
+        elif min_count < AUTO_MAX_LOOKAHEAD:
+          lookahead = list(islice(iterator, min_count + 1))
+          use_processes = len(lookahead) > min_count
+          remaining = chain(lookahead, iterator)
+
+    if use_processes:
+      self.__process_executor.prepare(self.__dictionary)
+      yield from self.__process_executor.imap(method, remaining, chunksize)
+    else:
+      yield from self.__inline_executor.imap(method, remaining, chunksize)
+
+  def __get_setup_duration(self) -> float:
+    if self.__process_executor.is_current(self.__dictionary):
+      return 0
+    duration = AUTO_POOL_START_DURATION
+    if self.__dictionary is not None and uses_shared_snapshot():
+      duration += len(self.__dictionary) * AUTO_SNAPSHOT_DURATION_PER_ENTRY
+    return duration
+
+  def close(self) -> None:
+    self.__inline_executor.close()
+    self.__process_executor.close()
+    self.__dictionary = None
+
+
+def get_transfer_duration(items: List[T], results: List[R]) -> float:
+  """
+  Returns the duration to pickle and unpickle the items and their results.
+  """
+  start = perf_counter()
+  for item, result in zip(items, results):
+    pickle.loads(pickle.dumps(item))
+    pickle.loads(pickle.dumps(result))
+  return perf_counter() - start
+
+
+def create_executor(backend: Backend, mp_options: MultiprocessingOptions) -> Executor:
+  if backend == "inline":
+    return InlineExecutor()
+  if backend == "thread":
+    return ThreadExecutor(mp_options)
+  if backend == "process":
+    return ProcessExecutor(mp_options)
+  if backend == "auto":
+    return AutoExecutor(mp_options)
+  assert False
@@ -0,0 +1,151 @@
+"""
+Engine for operations which change the words of a dictionary (e.g., removing symbols or changing the
+casing). The new words are computed by the workers beforehand; here the entries are renamed and all
+entries which get the same word are merged. If multiple worker processes are available, the words are
+grouped by their new word and the groups are merged by the workers.
+"""
+
+import math
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
+from tqdm import tqdm
+
+from pronunciation_dictionary_utils.common import merge_pronunciations, merge_valid_pronunciations
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+from pronunciation_dictionary_utils.validation import validate_pronunciations
+
+# new word and the words whose pronunciations are merged into it in the order of the dictionary
+MergeGroup = Tuple[Word, List[Word]]
+# new word and the pronunciations which are merged into it
+MergePartitionEntry = Tuple[Word, List[Pronunciations]]
+RewriteResult = Tuple[OrderedSet[Word], OrderedSet[Word], OrderedSet[Word]]
+
+
+def rewrite_words(dictionary: PronunciationDict, changed_words: Iterable[Tuple[Word, Word]], session: ProcessingSession, chunksize: int, silent: bool) -> RewriteResult:
+  """
+  Renames each word to its new word. The pronunciations of all words with the same new word are merged
+  in the order of the dictionary into the entry of the new word, which is appended to the dictionary
+  if it didn't exist before. Words whose new word is empty are removed unless an empty word exists.
+  Returns the renamed words, the created words and the removed words.
+  """
+  if session.backend in ("inline", "thread") or session.mp_options.n_jobs == 1:
+    # the merging wouldn't run in parallel
+    return rewrite_words_serially(dictionary, changed_words)
+
+  renamed_words = OrderedSet()
+  # new word -> first word which gets it
+  first_words: Dict[Word, Word] = {}
+  # new word -> all words which get it, only for new words of multiple words
+  merged_words: Dict[Word, List[Word]] = {}
+  for word, new_word in changed_words:
+    renamed_words.add(word)
+    if new_word in first_words:
+      if new_word in merged_words:
+        merged_words[new_word].append(word)
+      else:
+        merged_words[new_word] = [first_words[new_word], word]
+    else:
+      first_words[new_word] = word
+
+  if not first_words.keys().isdisjoint(renamed_words):
+    # a new word is renamed itself, i.e., the result depends on the order of the renamings
+    new_words = {
+      word: new_word
+      for new_word, words in get_words_per_new_word(first_words, merged_words)
+      for word in words
+    }
+    return rewrite_words_serially(dictionary, ((word, new_words[word]) for word in renamed_words))
+
+  merge_groups = [
+    (new_word, [new_word] + words if new_word in dictionary else words)
+    for new_word, words in get_words_per_new_word(first_words, merged_words)
+    if new_word in dictionary or (len(words) > 1 and new_word != "")
+  ]
+  merged_pronunciations = merge_groups_partitioned(
+    dictionary, merge_groups, session, chunksize, silent)
+
+  created_words = OrderedSet()
+  removed_words = OrderedSet()
+  for new_word, words in get_words_per_new_word(first_words, merged_words):
+    exists = new_word in dictionary
+    pronunciations = dictionary.pop(words[0])
+    for word in words[1:]:
+      del dictionary[word]
+    if not exists and new_word == "":
+      removed_words.update(words)
+      continue
+    if new_word in merged_pronunciations:
+      pronunciations = merged_pronunciations[new_word]
+    dictionary[new_word] = pronunciations
+    if not exists:
+      created_words.add(new_word)
+
+  return renamed_words, created_words, removed_words
+
+
+def get_words_per_new_word(first_words: Dict[Word, Word], merged_words: Dict[Word, List[Word]]) -> Iterator[Tuple[Word, List[Word]]]:
+  for new_word, word in first_words.items():
+    if new_word in merged_words:
+      yield new_word, merged_words[new_word]
+    else:
+      yield new_word, [word]
+
+
+def merge_groups_partitioned(dictionary: PronunciationDict, merge_groups: List[MergeGroup], session: ProcessingSession, chunksize: int, silent: bool) -> Dict[Word, Pronunciations]:
+  """
+  Distributes the groups by the hash of their new word into parts of about `chunksize` groups which
+  are merged by the workers. The pronunciations are sent with the parts, i.e., the workers don't need
+  access to the dictionary.
+  """
+  if len(merge_groups) == 0:
+    return {}
+  executor = session.get_executor()
+  n_partitions = math.ceil(len(merge_groups) / chunksize)
+  partitions: List[List[MergePartitionEntry]] = [[] for _ in range(n_partitions)]
+  for new_word, words in merge_groups:
+    partitions[hash(new_word) % n_partitions].append(
+      (new_word, [dictionary[word] for word in words]))
+
+  result = {}
+  with tqdm(total=len(merge_groups), unit="words", desc="Merging", disable=silent) as progress_bar:
+    for merged_entries in executor.imap(process_merge_partition, partitions, 1):
+      result.update(merged_entries)
+      progress_bar.update(len(merged_entries))
+  return result
+
+
+def process_merge_partition(partition: List[MergePartitionEntry]) -> List[Tuple[Word, Pronunciations]]:
+  result = []
+  for new_word, pronunciations_to_merge in partition:
+    merged_pronunciations = None
+    for pronunciations in pronunciations_to_merge:
+      if merged_pronunciations is None:
+        if msg := validate_pronunciations(pronunciations):
+          raise ValueError(f"Parameter 'pronunciations1': {msg}")
+        merged_pronunciations = pronunciations
+      else:
+        if msg := validate_pronunciations(pronunciations):
+          raise ValueError(f"Parameter 'pronunciations2': {msg}")
+        merge_valid_pronunciations(merged_pronunciations, pronunciations)
+    result.append((new_word, merged_pronunciations))
+  return result
+
+
+def rewrite_words_serially(dictionary: PronunciationDict, changed_words: Iterable[Tuple[Word, Word]]) -> RewriteResult:
+  renamed_words = OrderedSet()
+  created_words = OrderedSet()
+  removed_words = OrderedSet()
+  for word, new_word in changed_words:
+    popped_pronunciations = dictionary.pop(word)
+    if new_word in dictionary:
+      existing_pronunciations = dictionary[new_word]
+      merge_pronunciations(existing_pronunciations, popped_pronunciations)
+    elif new_word == "":
+      removed_words.add(word)
+    else:
+      created_words.add(new_word)
+      dictionary[new_word] = popped_pronunciations
+    renamed_words.add(word)
+  return renamed_words, created_words, removed_words
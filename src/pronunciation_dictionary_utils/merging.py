@@ -1,10 +1,16 @@
-from typing import Optional
+from collections import OrderedDict
+from heapq import merge
+from itertools import groupby
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from typing import OrderedDict as ODType
 
 from ordered_set import OrderedSet
-from pronunciation_dictionary import PronunciationDict
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
 
 from pronunciation_dictionary_utils.common import merge_pronunciations
-from pronunciation_dictionary_utils.validation import validate_dictionary
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.validation import validate_dictionary, validate_type
+from pronunciation_dictionary_utils.words_sorting import get_word_sort_key
 
 
 def __validate_mode(mode: str) -> Optional[str]:
@@ -30,9 +36,145 @@ def merge_dictionaries(dictionary: PronunciationDict, other_dictionary: Pronunci
     changed_anything = dictionary_extend(dictionary, other_dictionary)
   else:
     assert False
+  if changed_anything:
+    invalidate_dictionary(dictionary)
   return changed_anything
 
 
+# The pronunciations of each word in the order of the dictionaries which will be merged.
+MergeNode = ODType[Word, List[Pronunciations]]
+
+
+def merge_many(dictionary: PronunciationDict, other_dictionaries: Sequence[PronunciationDict], mode: str) -> bool:
+  """
+  Merges the other dictionaries one after another into `dictionary`; the result is the same as calling
+  `merge_dictionaries` for each of them in the given order. The other dictionaries are combined pairwise
+  in a tree before they are merged into `dictionary`.
+  """
+  if msg := validate_dictionary(dictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if not isinstance(other_dictionaries, (list, tuple)):
+    raise ValueError("Parameter 'other_dictionaries': Value needs of type 'list' or 'tuple'!")
+  for other_dictionary in other_dictionaries:
+    if msg := validate_dictionary(other_dictionary):
+      raise ValueError(f"Parameter 'other_dictionaries': {msg}")
+  if msg := __validate_mode(mode):
+    raise ValueError(f"Parameter 'mode': {msg}")
+
+  if len(other_dictionaries) == 0:
+    return False
+
+  nodes = [get_merge_node(other_dictionary) for other_dictionary in other_dictionaries]
+  while len(nodes) > 1:
+    combined_nodes = [
+      combine_merge_nodes(nodes[i], nodes[i + 1], mode)
+      for i in range(0, len(nodes) - 1, 2)
+    ]
+    if len(nodes) % 2 == 1:
+      combined_nodes.append(nodes[-1])
+    nodes = combined_nodes
+
+  changed_anything = apply_merge_node(dictionary, nodes[0], mode)
+  if changed_anything:
+    invalidate_dictionary(dictionary)
+  return changed_anything
+
+
+def get_merge_node(dictionary: PronunciationDict) -> MergeNode:
+  return OrderedDict(
+    (word, [pronunciations])
+    for word, pronunciations in dictionary.items()
+  )
+
+
+def combine_merge_nodes(node1: MergeNode, node2: MergeNode, mode: str) -> MergeNode:
+  """
+  Appends the pronunciations of `node2` to `node1`. New words are appended in the order of `node2`.
+  """
+  for word, pronunciations in node2.items():
+    if word not in node1:
+      node1[word] = pronunciations
+    elif mode != "add":
+      # only the first pronunciations of a word are relevant for "add"
+      node1[word].extend(pronunciations)
+  return node1
+
+
+def apply_merge_node(dictionary: PronunciationDict, node: MergeNode, mode: str) -> bool:
+  changed_anything = False
+  for word, pronunciations_list in node.items():
+    for pronunciations in pronunciations_list:
+      if word not in dictionary:
+        dictionary[word] = pronunciations
+        changed_anything = True
+      elif mode == "replace":
+        if dictionary[word] != pronunciations:
+          dictionary[word] = pronunciations
+          changed_anything = True
+      elif mode == "extend":
+        changed_anything |= merge_pronunciations(dictionary[word], pronunciations)
+  return changed_anything
+
+
+Entries = Iterable[Tuple[Word, Pronunciations]]
+
+
+def merge_sorted(dictionaries: Sequence[Entries], mode: str, descending: bool, consider_case: bool) -> Iterator[Tuple[Word, Pronunciations, bool]]:
+  """
+  Merges the entries of dictionaries which are sorted by word like `sort_words` does one word at a time,
+  i.e., only the current entry of each dictionary is kept in memory. The other dictionaries are merged
+  into the first one like `merge_dictionaries` does. Yields the resulting entries in sorted order and
+  whether each of them was changed compared to the first dictionary. Raises a ValueError if the
+  entries of a dictionary are not sorted.
+  """
+  if not isinstance(dictionaries, (list, tuple)):
+    raise ValueError("Parameter 'dictionaries': Value needs of type 'list' or 'tuple'!")
+  if len(dictionaries) == 0:
+    raise ValueError("Parameter 'dictionaries': At least one dictionary needs to be passed!")
+  if msg := __validate_mode(mode):
+    raise ValueError(f"Parameter 'mode': {msg}")
+  if msg := validate_type(descending, bool):
+    raise ValueError(f"Parameter 'descending': {msg}")
+  if msg := validate_type(consider_case, bool):
+    raise ValueError(f"Parameter 'consider_case': {msg}")
+
+  sort_key = get_word_sort_key(consider_case)
+  entries = (
+    get_checked_sorted_entries(dictionary, dictionary_nr, sort_key, descending)
+    for dictionary_nr, dictionary in enumerate(dictionaries)
+  )
+  # entries of the same word are ordered after the dictionaries
+  merged_entries = merge(*entries, key=lambda entry: sort_key(entry[0]), reverse=descending)
+  return merge_sorted_groups(merged_entries, mode)
+
+
+def get_checked_sorted_entries(dictionary: Entries, dictionary_nr: int, sort_key: Callable[[Word], Any], descending: bool) -> Iterator[Tuple[Word, int, Pronunciations]]:
+  previous_key = None
+  for word, pronunciations in dictionary:
+    key = sort_key(word)
+    if previous_key is not None:
+      is_sorted = key < previous_key if descending else previous_key < key
+      if not is_sorted:
+        raise ValueError(
+          f"Parameter 'dictionaries': Dictionary {dictionary_nr + 1} is not sorted (\"{word}\")!")
+    previous_key = key
+    yield word, dictionary_nr, pronunciations
+
+
+def merge_sorted_groups(merged_entries: Iterator[Tuple[Word, int, Pronunciations]], mode: str) -> Iterator[Tuple[Word, Pronunciations, bool]]:
+  for word, group in groupby(merged_entries, key=lambda entry: entry[0]):
+    dictionary: PronunciationDict = OrderedDict()
+    pronunciations_list = []
+    for _, dictionary_nr, pronunciations in group:
+      if dictionary_nr == 0:
+        dictionary[word] = pronunciations
+      else:
+        pronunciations_list.append(pronunciations)
+    node = OrderedDict(((word, pronunciations_list),))
+    changed_anything = apply_merge_node(dictionary, node, mode)
+    yield word, dictionary[word], changed_anything
+
+
 def dictionary_replace(dictionary1: PronunciationDict, dictionary2: PronunciationDict) -> bool:
   changed_anything = False
   for key, value in dictionary2.items():
@@ -0,0 +1,111 @@
+import re
+from typing import Any, List, Optional
+
+try:
+  from re import _constants as sre_constants
+  from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+  import sre_constants
+  import sre_parse
+
+# separator of the texts which are replaced at once; texts containing it are replaced one by one
+SEPARATOR = "\n"
+
+# categories of character sets which contain the separator
+SEPARATOR_CATEGORIES = (
+  sre_constants.CATEGORY_SPACE,
+  sre_constants.CATEGORY_NOT_DIGIT,
+  sre_constants.CATEGORY_NOT_WORD,
+  sre_constants.CATEGORY_LINEBREAK,
+)
+
+# positions which differ between separate texts and joined texts; `\B` doesn't match empty texts
+SEPARATOR_POSITIONS = (
+  sre_constants.AT_BEGINNING_STRING,
+  sre_constants.AT_END_STRING,
+  sre_constants.AT_NON_BOUNDARY,
+)
+
+
+class PatternReplacer():
+  """
+  Replaces all matches of a pattern in many texts at once: the texts are joined with a separator, the
+  pattern is applied once to the joined text and the result is split again. `^` and `$` match at the
+  start and end of each text. Patterns which could match the separator itself (or contain `\\A`, `\\Z` or
+  `\\B`) are applied to each text separately.
+  """
+
+  def __init__(self, pattern: re.Pattern, replace_with: str) -> None:
+    self.__pattern = pattern
+    self.__replace_with = replace_with
+    self.__joined_pattern: Optional[re.Pattern] = None
+    if isinstance(pattern.pattern, str) and not needs_separate_texts(pattern):
+      self.__joined_pattern = re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+
+  @property
+  def replaces_joined(self) -> bool:
+    return self.__joined_pattern is not None
+
+  def replace(self, text: str) -> str:
+    return self.__pattern.sub(self.__replace_with, text)
+
+  def replace_all(self, texts: List[str]) -> List[str]:
+    if self.__joined_pattern is not None and len(texts) > 0:
+      joined_text = SEPARATOR.join(texts)
+      if joined_text.count(SEPARATOR) == len(texts) - 1:
+        result = self.__joined_pattern.sub(self.__replace_with, joined_text).split(SEPARATOR)
+        # the replacement could contain the separator
+        if len(result) == len(texts):
+          return result
+    return [self.replace(text) for text in texts]
+
+
+def needs_separate_texts(pattern: re.Pattern) -> bool:
+  parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+  return subpattern_can_match_separator(parsed, bool(parsed.state.flags & re.DOTALL))
+
+
+def subpattern_can_match_separator(subpattern: Any, dotall: bool) -> bool:
+  separator = ord(SEPARATOR)
+  for op, av in subpattern:
+    if op == sre_constants.LITERAL and av == separator:
+      return True
+    if op == sre_constants.NOT_LITERAL and av != separator:
+      return True
+    if op == sre_constants.ANY and dotall:
+      return True
+    if op == sre_constants.IN and set_can_match_separator(av):
+      return True
+    if op == sre_constants.AT and av in SEPARATOR_POSITIONS:
+      return True
+    if op == sre_constants.SUBPATTERN:
+      _, add_flags, del_flags, group_subpattern = av
+      group_dotall = (dotall or bool(add_flags & re.DOTALL)) and not del_flags & re.DOTALL
+      if subpattern_can_match_separator(group_subpattern, group_dotall):
+        return True
+    elif any(subpattern_can_match_separator(part, dotall) for part in get_subpatterns(av)):
+      return True
+  return False
+
+
+def get_subpatterns(av: Any) -> List[Any]:
+  # e.g., branches, repetitions and lookarounds
+  if isinstance(av, sre_parse.SubPattern):
+    return [av]
+  if isinstance(av, (tuple, list)):
+    return [subpattern for part in av for subpattern in get_subpatterns(part)]
+  return []
+
+
+def set_can_match_separator(items: List[Any]) -> bool:
+  separator = ord(SEPARATOR)
+  for op, av in items:
+    if op == sre_constants.NEGATE:
+      return True
+    if op == sre_constants.LITERAL and av == separator:
+      return True
+    if op == sre_constants.RANGE and av[0] <= separator <= av[1]:
+      return True
+    if op == sre_constants.CATEGORY and av in SEPARATOR_CATEGORIES:
+      return True
+  return False
@@ -0,0 +1,64 @@
+from contextlib import nullcontext
+from typing import ContextManager, Optional
+
+from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict
+
+from pronunciation_dictionary_utils.executors import (Backend, Executor, create_executor,
+                                                      validate_backend)
+from pronunciation_dictionary_utils.validation import validate_mp_options
+
+
+class ProcessingSession():
+  """
+  Owns one executor (e.g., a worker pool) which can be shared across multiple library calls.
+  Workers of the process backend hold a copy of the last passed dictionary and are only
+  refreshed if another dictionary is passed or the dictionary was changed in the meantime.
+  Functions of this library which change a dictionary mark its copies in all sessions as
+  outdated; if the dictionary is changed outside of this library, `invalidate()` needs to be called.
+  """
+
+  def __init__(self, mp_options: MultiprocessingOptions, backend: Backend = "auto") -> None:
+    if msg := validate_mp_options(mp_options):
+      raise ValueError(f"Parameter 'mp_options': {msg}")
+    if msg := validate_backend(backend):
+      raise ValueError(f"Parameter 'backend': {msg}")
+    self.__mp_options = mp_options
+    self.__backend = backend
+    self.__executor = create_executor(backend, mp_options)
+
+  def __enter__(self) -> "ProcessingSession":
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
+    self.close()
+
+  @property
+  def mp_options(self) -> MultiprocessingOptions:
+    return self.__mp_options
+
+  @property
+  def backend(self) -> Backend:
+    return self.__backend
+
+  def invalidate(self) -> None:
+    self.__executor.invalidate()
+
+  def get_executor(self, dictionary: Optional[PronunciationDict] = None) -> Executor:
+    """
+    Returns the executor of the session. If a dictionary is passed, it is ensured that the workers
+    can access the current state of it.
+    """
+    self.__executor.prepare(dictionary)
+    return self.__executor
+
+  def close(self) -> None:
+    self.__executor.close()
+
+
+def use_session(session: Optional[ProcessingSession], mp_options: MultiprocessingOptions) -> ContextManager[ProcessingSession]:
+  """
+  Returns the passed session without closing it afterwards or a temporary session if none was passed.
+  """
+  if session is None:
+    return ProcessingSession(mp_options)
+  return nullcontext(session)
@@ -1,13 +1,17 @@
 from collections import OrderedDict
 from functools import partial
-from multiprocessing.pool import Pool
 from typing import List, Optional, Set, Tuple, Union
 
 from ordered_set import OrderedSet
 from pronunciation_dictionary import (MultiprocessingOptions, PronunciationDict, Pronunciations,
                                       Symbol, Word)
-from tqdm import tqdm
 
+from pronunciation_dictionary_utils.executors import get_process_lookup_dict, invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.symbol_inventory import (SymbolTable, apply_symbol_table,
+                                                             get_symbol_table_key, get_symbols)
+from pronunciation_dictionary_utils.symbol_replacement import get_symbol_replacer
+from pronunciation_dictionary_utils.transform_cache import get_changed_pronunciations_memoized
 from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
                                                        validate_type)
 
@@ -19,7 +23,7 @@ def __validate_symbol(symbol: str) -> Optional[str]:
   return None
 
 
-def map_symbols(dictionary: PronunciationDict, symbols: OrderedSet[Symbol], map_to: Union[List[Symbol], Symbol], partial_mapping: bool, mp_options: MultiprocessingOptions, silent: bool = False) -> Set[str]:
+def map_symbols(dictionary: PronunciationDict, symbols: OrderedSet[Symbol], map_to: Union[List[Symbol], Symbol], partial_mapping: bool, mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> Set[str]:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := validate_type(symbols, OrderedSet):
@@ -42,63 +46,44 @@ def map_symbols(dictionary: PronunciationDict, symbols: OrderedSet[Symbol], map_
         raise ValueError(f"Parameter 'map_to': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
+
+  with use_session(session, mp_options) as current_session:
+    inventory = get_symbols(dictionary, mp_options, current_session)
+    if partial_mapping:
+      assert isinstance(map_to, str)
+      table = compile_partial_mapping(inventory, symbols, map_to)
+    else:
+      assert isinstance(map_to, list)
+      table = compile_full_mapping(inventory, symbols, map_to)
 
-  if partial_mapping:
-    assert isinstance(map_to, str)
-    process_method = partial(
-      process_map_pronunciations_partial,
-      symbols=symbols,
-      map_symbol=map_to,
-    )
-  else:
-    assert isinstance(map_to, list)
-    process_method = partial(
-      process_map_pronunciations_full,
-      symbols=symbols,
-      mapping_symbols=map_to,
-    )
+    if len(table) == 0:
+      return set()
 
-  with Pool(
-    processes=mp_options.n_jobs,
-    initializer=__init_pool,
-    initargs=(dictionary,),
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
+    executor = current_session.get_executor(dictionary)
     all_words = OrderedSet(dictionary.keys())
-    iterator = tqdm(pool.imap(process_method, all_words, mp_options.chunksize),
-                    total=len(all_words), unit="words", disable=silent)
-    new_pronunciations_to_words = dict(iterator)
+    changed_entries = get_changed_pronunciations_memoized(
+      executor, partial(apply_symbol_table, table=table), get_symbol_table_key(table), all_words, mp_options.chunksize, False, silent)
 
   changed_words = set()
+  for word, new_pronunciations in changed_entries:
+    dictionary[word] = new_pronunciations
+    changed_words.add(word)
 
-  for word, new_pronunciations in new_pronunciations_to_words.items():
-    changed_pronunciations = new_pronunciations is not None
-    if changed_pronunciations:
-      dictionary[word] = new_pronunciations
-      changed_words.add(word)
+  if len(changed_words) > 0:
+    invalidate_dictionary(dictionary)
 
   return changed_words
 
 
-PROCESS_LOOKUP_DICT: PronunciationDict = None
-
-
-def __init_pool(lookup_dict: PronunciationDict) -> None:
-  global PROCESS_LOOKUP_DICT
-  PROCESS_LOOKUP_DICT = lookup_dict
-
-
 def replace_str(s: str, replace: OrderedSet[str], replace_with: str) -> str:
-  for r_str in replace:
-    if r_str in s:
-      s = s.replace(r_str, replace_with)
-  return s
+  replacer = get_symbol_replacer(tuple(replace), replace_with)
+  return replacer.replace(s)
 
 
 def process_map_pronunciations_partial(word: Word, symbols: OrderedSet[Symbol], map_symbol: Symbol) -> Tuple[Word, Optional[Pronunciations]]:
-  global PROCESS_LOOKUP_DICT
-  assert word in PROCESS_LOOKUP_DICT
-  pronunciations = PROCESS_LOOKUP_DICT[word]
+  pronunciations = get_process_lookup_dict()[word]
   new_pronunciations = map_pronunciations_partial(pronunciations, symbols, map_symbol)
   if new_pronunciations == pronunciations:
     del pronunciations
@@ -109,9 +94,7 @@ def process_map_pronunciations_partial(word: Word, symbols: OrderedSet[Symbol],
 
 
 def process_map_pronunciations_full(word: Word, symbols: OrderedSet[Symbol], mapping_symbols: List[Symbol]) -> Tuple[Word, Optional[Pronunciations]]:
-  global PROCESS_LOOKUP_DICT
-  assert word in PROCESS_LOOKUP_DICT
-  pronunciations = PROCESS_LOOKUP_DICT[word]
+  pronunciations = get_process_lookup_dict()[word]
   new_pronunciations = map_pronunciations_full(pronunciations, symbols, mapping_symbols)
   if new_pronunciations == pronunciations:
     del pronunciations
@@ -121,14 +104,39 @@ def process_map_pronunciations_full(word: Word, symbols: OrderedSet[Symbol], map
   return word, new_pronunciations
 
 
+def compile_partial_mapping(inventory: Set[Symbol], replace_symbols: OrderedSet[Symbol], map_symbol: Symbol) -> SymbolTable:
+  """
+  Returns the mapped symbol for each symbol of the inventory which contains any of the symbols.
+  """
+  replacer = get_symbol_replacer(tuple(replace_symbols), map_symbol)
+  table = {}
+  for symbol in inventory:
+    new_symbol = replacer.replace(symbol)
+    if new_symbol != symbol:
+      table[symbol] = (new_symbol,)
+  return table
+
+
+def compile_full_mapping(inventory: Set[Symbol], replace_symbols: OrderedSet[Symbol], mapping_symbols: List[Symbol]) -> SymbolTable:
+  """
+  Returns the mapping symbols for each symbol of the inventory which is one of the symbols.
+  """
+  return {
+    symbol: tuple(mapping_symbols)
+    for symbol in inventory
+    if symbol in replace_symbols and (symbol,) != tuple(mapping_symbols)
+  }
+
+
 def map_pronunciations_partial(pronunciations: Pronunciations, replace_symbols: OrderedSet[Symbol], map_symbol: Symbol) -> Pronunciations:
   assert len(pronunciations) > 0
   assert map_symbol != ""
+  replacer = get_symbol_replacer(tuple(replace_symbols), map_symbol)
   new_pronunciations = OrderedDict()
   for pronunciation, weight in pronunciations.items():
     assert len(pronunciation) > 0
     new_pronunciation = tuple(
-      replace_str(symbol, replace_symbols, map_symbol)
+      replacer.replace(symbol)
       for symbol in pronunciation
     )
     if new_pronunciation in new_pronunciations:
@@ -1,13 +1,19 @@
 from functools import partial
 from logging import getLogger
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 
 from ordered_set import OrderedSet
-from pronunciation_dictionary import MultiprocessingOptions, get_phoneme_set
+from pronunciation_dictionary import MultiprocessingOptions
 from pronunciation_dictionary.types import PronunciationDict
-from tqdm import tqdm
 
-from pronunciation_dictionary_utils import map_symbols
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.pronunciations_map_symbols import map_symbols
+from pronunciation_dictionary_utils.symbol_inventory import (SymbolTable, apply_symbol_table,
+                                                             get_symbol_table_key, get_symbols)
+from pronunciation_dictionary_utils.transform_cache import get_changed_pronunciations_memoized
+from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
+                                                       validate_type)
 
 
 def get_mappable_symbols(sounds_in_dictionary: Set[str], sounds_in_mappings: Set[str]) -> Set[str]:
@@ -27,7 +33,7 @@ def get_unmappable_symbols(sounds_in_dictionary: Set[str], sounds_in_mappings: S
 
 
 def apply_mapping_partial(dictionary: PronunciationDict, mappings: Dict[str, str], mappable_symbol: str,
-                          mp_options: 'MultiprocessingOptions') -> Set[str]:
+                          mp_options: 'MultiprocessingOptions', session: Optional[ProcessingSession] = None) -> Set[str]:
   """
   Applies partial mapping for a single mappable symbol. It returns a set of words whose pronunciations 
   have been changed. It enables mapping the symbol occuring within a longer symbol, e.g., passing the 
@@ -40,13 +46,13 @@ def apply_mapping_partial(dictionary: PronunciationDict, mappings: Dict[str, str
     raise Exception("Whitespaces in mappings aren't supported with partial mapping.")
 
   changed_words = map_symbols(dictionary, from_symbol, to_phonemes,
-                              True, mp_options, silent=True)
+                              True, mp_options, silent=True, session=session)
 
   return changed_words
 
 
 def apply_mapping_full(dictionary: PronunciationDict, mappings: Dict[str, str], mappable_symbol: str,
-                       mp_options: 'MultiprocessingOptions') -> Set[str]:
+                       mp_options: 'MultiprocessingOptions', session: Optional[ProcessingSession] = None) -> Set[str]:
   """
   Applies mapping for a single mappable symbol. It returns a set of words whose pronunciations have 
   been changed. It does not map the symbol occuring within a longer symbol e.g., passing the 
@@ -60,42 +66,93 @@ def apply_mapping_full(dictionary: PronunciationDict, mappings: Dict[str, str],
   to_phonemes = [p for p in to_phonemes if len(p) > 0]
 
   changed_words = map_symbols(dictionary, from_symbol, to_phonemes,
-                              False, mp_options, silent=True)
+                              False, mp_options, silent=True, session=session)
 
   return changed_words
 
 
+def compile_mappings(symbols: Set[str], mappings: Dict[str, str], partial_mapping: bool) -> SymbolTable:
+  """
+  Compiles the mappings into a table containing the resulting symbols for each of the passed symbols that
+  would be changed. The mappable symbols are applied ordered by their length (longest first) in the same
+  way as applying them one after another would do.
+  """
+  mappable_symbols = get_mappable_symbols(symbols, set(mappings.keys()))
+  sorted_mappable_symbols = OrderedSet(sorted(mappable_symbols, key=len, reverse=True))
+
+  if partial_mapping:
+    for mappable_symbol in sorted_mappable_symbols:
+      if " " in mappings[mappable_symbol]:
+        raise Exception("Whitespaces in mappings aren't supported with partial mapping.")
+
+  table = {}
+  for symbol in symbols:
+    if partial_mapping:
+      new_symbol = symbol
+      for mappable_symbol in sorted_mappable_symbols:
+        if mappable_symbol in new_symbol:
+          new_symbol = new_symbol.replace(mappable_symbol, mappings[mappable_symbol])
+      new_symbols = (new_symbol,)
+    else:
+      new_symbols = (symbol,)
+      for mappable_symbol in sorted_mappable_symbols:
+        to_phonemes = tuple(p for p in mappings[mappable_symbol].split(" ") if len(p) > 0)
+        new_symbols = tuple(
+          s
+          for old_symbol in new_symbols
+          for s in (to_phonemes if old_symbol == mappable_symbol else (old_symbol,))
+        )
+    if new_symbols != (symbol,):
+      table[symbol] = new_symbols
+  return table
+
+
 def map_symbols_dict(dictionary: PronunciationDict, mappings: Dict[str, str],
-                     partial_mapping: bool, mp_options: MultiprocessingOptions, silent: bool = False) -> Set[str]:
+                     partial_mapping: bool, mp_options: MultiprocessingOptions, silent: bool = False,
+                     session: Optional[ProcessingSession] = None) -> Set[str]:
   """
-  Identifies applicable mappings and triggers mapping them according to the specified method.
-  It returns a set of words whose pronunciations have been changed. 
+  Identifies applicable mappings, compiles them into one table and applies it to all pronunciations
+  in one pass. The symbols of the dictionary are collected in a separate pass beforehand because the
+  table is compiled from them. It returns a set of words whose pronunciations have been changed.
   """
   logger = getLogger(__name__)
-  unique_sounds_in_dictionary = get_phoneme_set(dictionary)
-  unique_sounds_in_mappings = set(mappings.keys())
+  if msg := validate_dictionary(dictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if msg := validate_mp_options(mp_options):
+    raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
-  mappable_symbols = get_mappable_symbols(unique_sounds_in_dictionary, unique_sounds_in_mappings)
-  unmappable_symbols = get_unmappable_symbols(
-    unique_sounds_in_dictionary, unique_sounds_in_mappings)
+  changed_words_total = set()
+  with use_session(session, mp_options) as current_session:
+    unique_sounds_in_dictionary = get_symbols(dictionary, mp_options, current_session)
+    unique_sounds_in_mappings = set(mappings.keys())
 
-  logger.info(f"Found {len(mappable_symbols)} applicable phoneme mappings.")
-  logger.info(f"Mapped phonemes in dictionary: {' '.join(sorted(mappable_symbols))}")
-  logger.info(f"Unmapped phonemes in dictionary: {' '.join(sorted(unmappable_symbols))}")
+    mappable_symbols = get_mappable_symbols(unique_sounds_in_dictionary, unique_sounds_in_mappings)
+    unmappable_symbols = get_unmappable_symbols(
+      unique_sounds_in_dictionary, unique_sounds_in_mappings)
 
-  changed_words_total = set()
-  if mappable_symbols:
-    mapping_method = partial(
-      apply_mapping_partial if partial_mapping else apply_mapping_full,
-      dictionary=dictionary,
-      mappings=mappings,
-      mp_options=mp_options
-    )
-
-    sorted_mappable_symbols = OrderedSet(sorted(mappable_symbols, key=len, reverse=True))
-
-    for mappable_symbol in tqdm(sorted_mappable_symbols, total=len(sorted_mappable_symbols), desc="Mapping", disable=silent):
-      changed_words = mapping_method(mappable_symbol=mappable_symbol)
-      changed_words_total |= changed_words
+    logger.info(f"Found {len(mappable_symbols)} applicable phoneme mappings.")
+    logger.info(f"Mapped phonemes in dictionary: {' '.join(sorted(mappable_symbols))}")
+    logger.info(f"Unmapped phonemes in dictionary: {' '.join(sorted(unmappable_symbols))}")
+
+    if not mappable_symbols:
+      return changed_words_total
+
+    table = compile_mappings(unique_sounds_in_dictionary, mappings, partial_mapping)
+    if len(table) == 0:
+      return changed_words_total
+
+    executor = current_session.get_executor(dictionary)
+    all_words = OrderedSet(dictionary.keys())
+    changed_entries = get_changed_pronunciations_memoized(
+      executor, partial(apply_symbol_table, table=table), get_symbol_table_key(table), all_words, mp_options.chunksize, False, silent, desc="Mapping")
+
+  for word, new_pronunciations in changed_entries:
+    dictionary[word] = new_pronunciations
+    changed_words_total.add(word)
+
+  if len(changed_words_total) > 0:
+    invalidate_dictionary(dictionary)
 
   return changed_words_total
@@ -1,31 +1,28 @@
 from collections import OrderedDict
 from functools import partial
-from multiprocessing.pool import Pool
-from typing import Generator, Iterable, Literal, Optional, Set, Tuple
+from typing import Generator, Iterable, List, Literal, Optional, Set, Tuple
 
 from ordered_set import OrderedSet
-from pronunciation_dictionary import (MultiprocessingOptions, PronunciationDict, Pronunciations,
-                                      Symbol, Word)
-from tqdm import tqdm
-
+from pronunciation_dictionary import (MultiprocessingOptions, Pronunciation, PronunciationDict,
+                                      Pronunciations, Symbol, Word)
+
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.symbol_inventory import (apply_symbol_table, get_symbol_table_key,
+                                                             get_symbols)
+from pronunciation_dictionary_utils.transform_cache import get_changed_pronunciations_memoized
 from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
-                                                       validate_type)
+                                                       validate_removal_mode, validate_type)
 
 DEFAULT_EMPTY_WEIGHT = 1
 
 
-def __validate_mode(mode: str) -> Optional[str]:
-  if mode not in ["all", "start", "end", "both"]:
-    return "Value needs to be 'all', 'start', 'end' or 'both'!"
-  return None
-
-
-def remove_symbols_from_pronunciations(dictionary: PronunciationDict, symbols: OrderedSet[Symbol], mode: str, keep_empty: bool, empty_symbol: Optional[Symbol], mp_options: MultiprocessingOptions, silent: bool = False) -> Tuple[OrderedSet[Word], int]:
+def remove_symbols_from_pronunciations(dictionary: PronunciationDict, symbols: OrderedSet[Symbol], mode: str, keep_empty: bool, empty_symbol: Optional[Symbol], mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> Tuple[OrderedSet[Word], int]:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := validate_type(symbols, OrderedSet):
     raise ValueError(f"Parameter 'symbols': {msg}")
-  if msg := __validate_mode(mode):
+  if msg := validate_removal_mode(mode):
     raise ValueError(f"Parameter 'mode': {msg}")
   if msg := validate_type(keep_empty, bool):
     raise ValueError(f"Parameter 'keep_empty': {msg}")
@@ -33,33 +30,37 @@ def remove_symbols_from_pronunciations(dictionary: PronunciationDict, symbols: O
     raise ValueError(f"Parameter 'empty_symbol': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
   if len(symbols) == 0:
     return OrderedSet(), 0
 
-  process_method = partial(
-    process_get_pronunciation,
-    symbols=symbols,
-    mode=mode,
-  )
+  with use_session(session, mp_options) as current_session:
+    removed_symbols = set(symbols) & get_symbols(dictionary, mp_options, current_session)
+    if len(removed_symbols) == 0:
+      return OrderedSet(), 0
 
-  with Pool(
-    processes=mp_options.n_jobs,
-    initializer=__init_pool_prepare_cache_mp,
-    initargs=(dictionary,),
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
+    if mode == "all":
+      table = {symbol: () for symbol in removed_symbols}
+      transform = partial(apply_symbol_table, table=table)
+      key = get_symbol_table_key(table)
+    else:
+      transform = partial(
+        remove_symbols_from_pronunciations_list,
+        symbols=removed_symbols,
+        mode=mode,
+      )
+      key = ("remove", tuple(sorted(removed_symbols)), mode)
+
+    executor = current_session.get_executor(dictionary)
     entries = OrderedSet(dictionary.keys())
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    pronunciations_to_i = list(tqdm(iterator, total=len(entries), unit="words", disable=silent))
+    changed_entries = get_changed_pronunciations_memoized(
+      executor, transform, key, entries, mp_options.chunksize, True, silent)
 
   changed_counter = 0
   removed_words = OrderedSet()
-  for word, new_pronunciations in pronunciations_to_i:
-    pronunciations_unchanged = new_pronunciations is None
-    if pronunciations_unchanged:
-      continue
-
+  for word, new_pronunciations in changed_entries:
     if len(new_pronunciations) == 0:
       if keep_empty:
         assert empty_symbol is not None
@@ -73,25 +74,10 @@ def remove_symbols_from_pronunciations(dictionary: PronunciationDict, symbols: O
       dictionary[word] = new_pronunciations
     changed_counter += 1
 
-  return removed_words, changed_counter
-
-
-process_lookup_dict: PronunciationDict = None
-
-
-def __init_pool_prepare_cache_mp(lookup_dict: PronunciationDict) -> None:
-  global process_lookup_dict
-  process_lookup_dict = lookup_dict
+  if changed_counter > 0:
+    invalidate_dictionary(dictionary)
 
-
-def process_get_pronunciation(word: Word, symbols: Set[Symbol], mode: str) -> Tuple[Word, Optional[Pronunciations]]:
-  global process_lookup_dict
-  assert word in process_lookup_dict
-  pronunciations = process_lookup_dict[word]
-  new_pronunciations = remove_symbols_from_pronunciations_entry(pronunciations, symbols, mode)
-  if new_pronunciations == pronunciations:
-    return word, None
-  return word, new_pronunciations
+  return removed_words, changed_counter
 
 
 def remove_symbols_start(symbols: Iterable[Symbol], remove: Set[Symbol]) -> Generator[Symbol, None, None]:
@@ -137,6 +123,14 @@ def remove_symbols_mode(symbols: Iterable[Symbol], remove: Set[Symbol], mode: Li
     assert False
 
 
+def remove_symbols_from_pronunciations_list(pronunciations: List[Pronunciation], symbols: Set[Symbol], mode: str) -> List[Pronunciation]:
+  return [
+    pronunciation if symbols.isdisjoint(pronunciation) else tuple(
+      remove_symbols_mode(pronunciation, symbols, mode))
+    for pronunciation in pronunciations
+  ]
+
+
 def remove_symbols_from_pronunciations_entry(pronunciations: Pronunciations, symbols: Set[Symbol], mode: str) -> Pronunciations:
   new_pronunciations = OrderedDict()
   changed_anything = False
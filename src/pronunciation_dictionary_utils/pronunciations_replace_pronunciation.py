@@ -1,14 +1,16 @@
 import re
 from collections import OrderedDict
 from functools import partial
-from multiprocessing.pool import Pool
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from ordered_set import OrderedSet
-from pronunciation_dictionary import (MultiprocessingOptions, PronunciationDict, Pronunciations,
-                                      Symbol, Word)
-from tqdm import tqdm
+from pronunciation_dictionary import (MultiprocessingOptions, Pronunciation, PronunciationDict,
+                                      Pronunciations, Symbol, Word)
 
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.pattern_replacement import PatternReplacer
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.transform_cache import get_changed_pronunciations_memoized
 from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
                                                        validate_type)
 
@@ -18,7 +20,7 @@ DEFAULT_EMPTY_WEIGHT = 1
 DEFAULT_EMPTY_WEIGHT = 1
 
 
-def replace_symbols_in_pronunciations(dictionary: PronunciationDict, text: str, replace_with: str, keep_empty: bool, empty_symbol: Optional[Symbol], mp_options: MultiprocessingOptions, silent: bool = False) -> Tuple[OrderedSet[Word], int]:
+def replace_symbols_in_pronunciations(dictionary: PronunciationDict, text: str, replace_with: str, keep_empty: bool, empty_symbol: Optional[Symbol], mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> Tuple[OrderedSet[Word], int]:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := validate_type(text, str):
@@ -31,35 +33,29 @@ def replace_symbols_in_pronunciations(dictionary: PronunciationDict, text: str,
     raise ValueError(f"Parameter 'empty_symbol': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
   if len(text) == 0:
     return OrderedSet(), 0
 
   pattern = re.compile(text)
 
-  process_method = partial(
-    process_get_pronunciation,
-    text=pattern,
-    replace_with=replace_with,
+  transform = partial(
+    replace_in_pronunciations_list,
+    replacer=PatternReplacer(pattern, replace_with),
   )
+  key = ("replace", pattern.pattern, pattern.flags, replace_with)
 
-  with Pool(
-    processes=mp_options.n_jobs,
-    initializer=__init_pool_prepare_cache_mp,
-    initargs=(dictionary,),
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
+  with use_session(session, mp_options) as current_session:
+    executor = current_session.get_executor(dictionary)
     entries = OrderedSet(dictionary.keys())
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    pronunciations_to_i = list(tqdm(iterator, total=len(entries), unit="words", disable=silent))
+    changed_entries = get_changed_pronunciations_memoized(
+      executor, transform, key, entries, mp_options.chunksize, True, silent)
 
   changed_counter = 0
   removed_words = OrderedSet()
-  for word, new_pronunciations in pronunciations_to_i:
-    pronunciations_unchanged = new_pronunciations is None
-    if pronunciations_unchanged:
-      continue
-
+  for word, new_pronunciations in changed_entries:
     if len(new_pronunciations) == 0:
       if keep_empty:
         assert empty_symbol is not None
@@ -73,25 +69,24 @@ def replace_symbols_in_pronunciations(dictionary: PronunciationDict, text: str,
       dictionary[word] = new_pronunciations
     changed_counter += 1
 
-  return removed_words, changed_counter
-
+  if changed_counter > 0:
+    invalidate_dictionary(dictionary)
 
-process_lookup_dict: PronunciationDict = None
-
-
-def __init_pool_prepare_cache_mp(lookup_dict: PronunciationDict) -> None:
-  global process_lookup_dict
-  process_lookup_dict = lookup_dict
+  return removed_words, changed_counter
 
 
-def process_get_pronunciation(word: Word, text: re.Pattern, replace_with: str) -> Tuple[Word, Optional[Pronunciations]]:
-  global process_lookup_dict
-  assert word in process_lookup_dict
-  pronunciations = process_lookup_dict[word]
-  new_pronunciations = replace_symbols_from_pronunciations_entry(pronunciations, text, replace_with)
-  if new_pronunciations == pronunciations:
-    return word, None
-  return word, new_pronunciations
+def replace_in_pronunciations_list(pronunciations: List[Pronunciation], replacer: PatternReplacer) -> List[Pronunciation]:
+  """
+  Replaces the matches in all pronunciations at once.
+  """
+  replaced_pronunciations = replacer.replace_all([
+    " ".join(pronunciation)
+    for pronunciation in pronunciations
+  ])
+  return [
+    tuple(x for x in phonemes_new.split(" ") if x != '')
+    for phonemes_new in replaced_pronunciations
+  ]
 
 
 def replace_symbols_from_pronunciations_entry(pronunciations: Pronunciations, pattern: re.Pattern, replace_with: str) -> Pronunciations:
@@ -1,17 +1,18 @@
 from collections import OrderedDict
 from functools import partial
-from multiprocessing.pool import Pool
 from typing import Optional, Tuple
 
 from ordered_set import OrderedSet
 from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict, Pronunciations, Word
-from tqdm import tqdm
 
+from pronunciation_dictionary_utils.chunk_processing import get_changed_pronunciations
+from pronunciation_dictionary_utils.executors import get_process_lookup_dict, invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
 from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
                                                        validate_type)
 
 
-def sort_pronunciations(dictionary: PronunciationDict, descending: bool, ignore_weight: bool, mp_options: MultiprocessingOptions, silent: bool = False) -> int:
+def sort_pronunciations(dictionary: PronunciationDict, descending: bool, ignore_weight: bool, mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> int:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := validate_type(descending, bool):
@@ -20,6 +21,8 @@ def sort_pronunciations(dictionary: PronunciationDict, descending: bool, ignore_
     raise ValueError(f"Parameter 'ignore_weight': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
   process_method = partial(
     process_sort_pronunciations,
@@ -27,40 +30,25 @@ def sort_pronunciations(dictionary: PronunciationDict, descending: bool, ignore_
     ignore_weight=ignore_weight,
   )
 
-  with Pool(
-    processes=mp_options.n_jobs,
-    initializer=__init_pool_prepare_cache_mp,
-    initargs=(dictionary,),
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
+  with use_session(session, mp_options) as current_session:
+    executor = current_session.get_executor(dictionary)
     entries = OrderedSet(dictionary.keys())
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    pronunciations_to_i = list(tqdm(iterator, total=len(entries), unit="words", disable=silent))
+    changed_entries = get_changed_pronunciations(
+      executor, process_method, entries, mp_options.chunksize, silent)
 
   changed_counter = 0
-  for word, new_pronunciations in pronunciations_to_i:
-    pronunciations_unchanged = new_pronunciations is None
-    if pronunciations_unchanged:
-      continue
-
+  for word, new_pronunciations in changed_entries:
     dictionary[word] = new_pronunciations
     changed_counter += 1
 
-  return changed_counter
-
+  if changed_counter > 0:
+    invalidate_dictionary(dictionary)
 
-process_lookup_dict: PronunciationDict = None
-
-
-def __init_pool_prepare_cache_mp(lookup_dict: PronunciationDict) -> None:
-  global process_lookup_dict
-  process_lookup_dict = lookup_dict
+  return changed_counter
 
 
 def process_sort_pronunciations(word: Word, descending: bool, ignore_weight: bool) -> Tuple[Word, Optional[Pronunciations]]:
-  global process_lookup_dict
-  assert word in process_lookup_dict
-  pronunciations = process_lookup_dict[word]
+  pronunciations = get_process_lookup_dict()[word]
   new_pronunciations = sort_pronunciations_entry(pronunciations, descending, ignore_weight)
   changed_anything = pronunciations != new_pronunciations
   if changed_anything:
@@ -0,0 +1,87 @@
+import numpy as np
+
+# A segment i consists of the elements [offsets[i], offsets[i + 1]) of a flat array.
+
+
+def get_offsets(counts: np.ndarray) -> np.ndarray:
+  offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+  np.cumsum(counts, out=offsets[1:])
+  return offsets
+
+
+def get_segment_reduction(ufunc: np.ufunc, values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  """
+  Reduces each segment with the ufunc; empty segments result in 0.
+  """
+  counts = np.diff(offsets)
+  non_empty = counts > 0
+  result = np.zeros(len(counts), dtype=values.dtype)
+  if np.any(non_empty):
+    # empty segments can be skipped because each reduction extends until the next start
+    result[non_empty] = ufunc.reduceat(values, offsets[:-1][non_empty])
+  return result
+
+
+def get_segment_sums(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  return get_segment_reduction(np.add, values, offsets)
+
+
+def get_segment_any(mask: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  return get_segment_sums(mask.astype(np.int64), offsets) > 0
+
+
+def get_segment_ids(offsets: np.ndarray) -> np.ndarray:
+  """
+  Returns the index of the segment for each element.
+  """
+  counts = np.diff(offsets)
+  return np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+
+
+def get_positions_in_segments(offsets: np.ndarray) -> np.ndarray:
+  """
+  Returns the position of each element within its segment.
+  """
+  counts = np.diff(offsets)
+  return np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], counts)
+
+
+def get_segment_first_position(mask: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  """
+  Returns the position of the first true value within each segment or the length of the segment if
+  there is none.
+  """
+  counts = np.diff(offsets)
+  positions = np.where(mask, get_positions_in_segments(offsets), np.repeat(counts, counts))
+  return get_segment_reduction(np.minimum, positions, offsets)
+
+
+def get_segment_argmax(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  """
+  Returns the position of the first maximum within each segment.
+  """
+  maxima = get_segment_reduction(np.maximum, values, offsets)
+  return get_segment_first_position(values == np.repeat(maxima, np.diff(offsets)), offsets)
+
+
+def get_segment_argmin(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  """
+  Returns the position of the first minimum within each segment.
+  """
+  minima = get_segment_reduction(np.minimum, values, offsets)
+  return get_segment_first_position(values == np.repeat(minima, np.diff(offsets)), offsets)
+
+
+def get_segment_cumulative_sums(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+  """
+  Returns the cumulative sums within each segment. The values are added one after another like
+  `itertools.accumulate` does, so the results are identical to the ones in Python.
+  """
+  result = values.copy()
+  counts = np.diff(offsets)
+  starts = offsets[:-1]
+  max_count = int(counts.max()) if len(counts) > 0 else 0
+  for position in range(1, max_count):
+    current = starts[counts > position] + position
+    result[current] = result[current - 1] + values[current]
+  return result
@@ -1,22 +1,23 @@
 from collections import OrderedDict
-from functools import partial
-from multiprocessing.pool import Pool
-from typing import Literal, Optional, Tuple
-
-from ordered_set import OrderedSet
-from pronunciation_dictionary import (MultiprocessingOptions, PronunciationDict, Pronunciations,
-                                      Word, get_first_pronunciation, get_last_pronunciation,
-                                      get_longest_pronunciation,
+from itertools import islice
+from typing import Literal, Optional
+
+import numpy as np
+from pronunciation_dictionary import (MultiprocessingOptions, Pronunciation, PronunciationDict,
+                                      Pronunciations, get_first_pronunciation,
+                                      get_last_pronunciation, get_longest_pronunciation,
                                       get_pronunciation_with_highest_weight,
                                       get_pronunciation_with_lowest_weight,
                                       get_random_pronunciation, get_shortest_pronunciation,
                                       get_weighted_pronunciation)
-from tqdm import tqdm
 
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciations
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+from pronunciation_dictionary_utils.segment_operations import get_segment_argmax, get_segment_argmin
 from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
-                                                       validate_seed)
-
-process_lookup_dict: PronunciationDict = None
+                                                       validate_seed, validate_type)
+from pronunciation_dictionary_utils.weight_engine import WeightTable, get_random_positions
 
 SelectionMode = Literal[
   "first",
@@ -30,7 +31,7 @@ SelectionMode = Literal[
 ]
 
 
-def __validate_mode(mode: str) -> Optional[str]:
+def validate_selection_mode(mode: str) -> Optional[str]:
   if mode not in [
     "first",
     "last",
@@ -45,55 +46,75 @@ def __validate_mode(mode: str) -> Optional[str]:
   return None
 
 
-def select_single_pronunciation(dictionary: PronunciationDict, mode: SelectionMode, seed: Optional[int], mp_options: MultiprocessingOptions, silent: bool = False) -> int:
+def select_single_pronunciation(dictionary: PronunciationDict, mode: SelectionMode, seed: Optional[int], mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> int:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
-  if msg := __validate_mode(mode):
+  if msg := validate_selection_mode(mode):
     raise ValueError(f"Parameter 'mode': {msg}")
   if seed is not None and (msg := validate_seed(seed)):
     raise ValueError(f"Parameter 'seed': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
-  process_method = partial(
-    process_merge,
-    mode=mode,
-    seed=seed,
-  )
-
-  with Pool(
-    processes=mp_options.n_jobs,
-    initializer=__init_pool_prepare_cache_mp,
-    initargs=(dictionary,),
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
-    entries = OrderedSet(dictionary.keys())
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    new_pronunciations_to_words = dict(tqdm(iterator, total=len(entries), unit="words", disable=silent))
+  weight_table = WeightTable.from_dictionary(dictionary)
+  counts = weight_table.counts
+  assert np.all(counts > 0)
 
-  changed_counter = 0
+  if mode == "first":
+    positions = np.zeros(len(counts), dtype=np.int64)
+  elif mode == "last":
+    positions = counts - 1
+  elif mode == "highest-weight":
+    positions = weight_table.get_argmax()
+  elif mode == "lowest-weight":
+    positions = weight_table.get_argmin()
+  elif mode in ("shortest", "longest"):
+    lengths = np.fromiter(
+      (len(pronunciation) for pronunciations in dictionary.values() for pronunciation in pronunciations),
+      dtype=np.int64, count=len(weight_table.weights),
+    )
+    if mode == "shortest":
+      positions = get_segment_argmin(lengths, weight_table.offsets)
+    else:
+      positions = get_segment_argmax(lengths, weight_table.offsets)
+  elif mode == "random":
+    positions = get_random_positions(counts, seed)
+  elif mode == "weighted":
+    positions = weight_table.sample(seed)
+  else:
+    assert False
 
-  for word, new_pronunciations in new_pronunciations_to_words.items():
-    changed_pronunciation = new_pronunciations is not None
-    if changed_pronunciation:
-      dictionary[word] = new_pronunciations
-      changed_counter += 1
+  changed_counter = 0
+  for index in np.flatnonzero(counts > 1).tolist():
+    word = weight_table.words[index]
+    pronunciations = dictionary[word]
+    pronunciation = get_nth_key(pronunciations, positions[index])
+    # the original weights keep their type (e.g., int)
+    dictionary[word] = OrderedDict((
+      (pronunciation, sum(pronunciations.values())),
+    ))
+    changed_counter += 1
+
+  if changed_counter > 0:
+    invalidate_dictionary(dictionary)
 
   return changed_counter
 
 
-def __init_pool_prepare_cache_mp(lookup_dict: PronunciationDict) -> None:
-  global process_lookup_dict
-  process_lookup_dict = lookup_dict
+def get_nth_key(pronunciations: Pronunciations, n: int) -> Pronunciation:
+  return next(islice(pronunciations.keys(), n, None))
 
 
-def process_merge(word: Word, mode: SelectionMode, seed: Optional[int]) -> Tuple[Word, Optional[Pronunciations]]:
-  global process_lookup_dict
-  assert word in process_lookup_dict
-  pronunciations = process_lookup_dict[word]
+def select_single_pronunciation_entry(pronunciations: Pronunciations, mode: SelectionMode, seed: Optional[int]) -> Pronunciations:
   assert len(pronunciations) > 0
   if len(pronunciations) == 1:
-    return word, None
+    return pronunciations
+
+  if isinstance(pronunciations, CompactPronunciations):
+    # the selection methods require an OrderedDict
+    pronunciations = pronunciations.to_pronunciations()
 
   if mode == "first":
     pronunciation = get_first_pronunciation(pronunciations)
@@ -118,4 +139,4 @@ def process_merge(word: Word, mode: SelectionMode, seed: Optional[int]) -> Tuple
   result = OrderedDict((
     (pronunciation, sum_weights),
   ))
-  return word, result
+  return result
@@ -1,11 +1,19 @@
 from collections import OrderedDict
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from typing import OrderedDict as ODType
 
 from ordered_set import OrderedSet
-from pronunciation_dictionary import PronunciationDict, Word
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
 
-from pronunciation_dictionary_utils.validation import validate_dictionary, validate_vocabulary
+from pronunciation_dictionary_utils.binary_dictionary import BinaryDictionary
+from pronunciation_dictionary_utils.case_indexed_dictionary import CaseIndexedPronunciationDict
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_type,
+                                                       validate_vocabulary)
+
+# approximate cost of looking up a word case-insensitively in the sorted words of a binary dictionary
+# compared to reading one word of it
+IGNORE_CASE_LOOKUP_COST = 200
 
 
 def validate_consider_case(consider_case: bool) -> Optional[str]:
@@ -19,7 +27,7 @@ def select_subset_dictionary(dictionary: PronunciationDict, vocabulary: OrderedS
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := validate_vocabulary(vocabulary):
     raise ValueError(f"Parameter 'vocabulary': {msg}")
-  if msg := validate_consider_case(dictionary):
+  if msg := validate_consider_case(consider_case):
     raise ValueError(f"Parameter 'consider_case': {msg}")
 
   if consider_case:
@@ -30,15 +38,8 @@ def select_subset_dictionary(dictionary: PronunciationDict, vocabulary: OrderedS
 
 
 def select_subset_dictionary_casing(dictionary: PronunciationDict, vocabulary: OrderedSet[Word]) -> OrderedSet[Word]:
-  existing_vocabulary = OrderedSet(dictionary.keys())
-  # copy_voc = vocabulary.intersection(existing_vocabulary)
-  remove_voc = existing_vocabulary.difference(vocabulary)
-  oov_voc = vocabulary.difference(existing_vocabulary)
-
-  for word in remove_voc:
-    assert word in dictionary
-    dictionary.pop(word)
-
+  oov_voc = OrderedSet(word for word in vocabulary if word not in dictionary)
+  retain_words(dictionary, [word for word in dictionary.keys() if word in vocabulary])
   return oov_voc
 
 
@@ -53,30 +54,150 @@ def get_mapping(words: Iterable[Word]) -> ODType[Word, OrderedSet[Word]]:
   return result
 
 
+def get_oov_words_ignore_casing(voc_word_map: ODType[Word, OrderedSet[Word]], dict_vocabulary: Set[Word]) -> OrderedSet[Word]:
+  return OrderedSet(
+    word
+    for word_lower, words in voc_word_map.items()
+    if word_lower not in dict_vocabulary
+    for word in words
+  )
+
+
 def select_subset_dictionary_ignore_casing(dictionary: PronunciationDict, vocabulary: OrderedSet[Word]) -> OrderedSet[Word]:
-  dict_word_map = get_mapping(dictionary.keys())
   voc_word_map = get_mapping(vocabulary)
+  if isinstance(dictionary, CaseIndexedPronunciationDict):
+    # only the words of the vocabulary are looked up
+    dict_vocabulary = {
+      word_lower
+      for word_lower in voc_word_map.keys()
+      if dictionary.contains_ignore_case(word_lower)
+    }
+    words = dictionary.sort_words(
+      word
+      for word_lower in dict_vocabulary
+      for word in dictionary.get_spellings(word_lower)
+    )
+  else:
+    dict_vocabulary = set()
+    words = []
+    for word in dictionary.keys():
+      word_lower = word.lower()
+      dict_vocabulary.add(word_lower)
+      if word_lower in voc_word_map:
+        words.append(word)
+
+  retain_words(dictionary, words)
+  return get_oov_words_ignore_casing(voc_word_map, dict_vocabulary)
+
+
+def retain_words(dictionary: PronunciationDict, words: List[Word]) -> None:
+  """
+  Removes all entries except the ones of `words` which need to be in the order of the dictionary.
+  """
+  if len(words) == len(dictionary):
+    return
+  # rebuilding is faster than removing the entries one by one if most of them are removed
+  entries = [(word, dictionary[word]) for word in words]
+  dictionary.clear()
+  dictionary.update(entries)
+  invalidate_dictionary(dictionary)
+
+
+def select_subset_entries(entries: Iterable[Tuple[Word, Pronunciations]], vocabulary: OrderedSet[Word], consider_case: bool) -> Tuple[PronunciationDict, OrderedSet[Word]]:
+  """
+  Like `select_subset_dictionary` but reads the entries of a dictionary one after another and keeps only
+  the selected ones, i.e., the memory depends on the size of the vocabulary instead of the dictionary.
+  Entries of the same word are combined like while loading a dictionary. Returns the selected entries
+  and the out-of-vocabulary words.
+  """
+  if msg := validate_vocabulary(vocabulary):
+    raise ValueError(f"Parameter 'vocabulary': {msg}")
+  if msg := validate_consider_case(consider_case):
+    raise ValueError(f"Parameter 'consider_case': {msg}")
 
-  dict_vocabulary = OrderedSet(dict_word_map.keys())
-  voc_vocabulary = OrderedSet(voc_word_map.keys())
+  voc_word_map = None if consider_case else get_mapping(vocabulary)
+  selected_vocabulary = vocabulary if consider_case else voc_word_map
+  found_vocabulary: Set[Word] = set()
+  result: PronunciationDict = OrderedDict()
+  for word, pronunciations in entries:
+    key = word if consider_case else word.lower()
+    if key not in selected_vocabulary:
+      continue
+    found_vocabulary.add(key)
+    if word not in result:
+      result[word] = pronunciations
+      continue
+    # the pronunciations of the entries are not changed
+    combined_pronunciations = OrderedDict(result[word])
+    for pronunciation, weight in pronunciations.items():
+      if pronunciation not in combined_pronunciations:
+        combined_pronunciations[pronunciation] = weight
+    result[word] = combined_pronunciations
 
-  unused_dict_voc = dict_vocabulary.difference(voc_vocabulary)
-  oov_voc = voc_vocabulary.difference(dict_vocabulary)
+  if consider_case:
+    oov_voc = OrderedSet(word for word in vocabulary if word not in found_vocabulary)
+  else:
+    oov_voc = get_oov_words_ignore_casing(voc_word_map, found_vocabulary)
+  return result, oov_voc
 
-  unused_dict_voc_actual = OrderedSet(
-    word
-    for word_lower in unused_dict_voc
-    for word in dict_word_map[word_lower]
-  )
 
-  oov_voc_actual = OrderedSet(
-    word
-    for word_lower in oov_voc
-    for word in voc_word_map[word_lower]
+def select_subset_binary_dictionary(dictionary: BinaryDictionary, vocabulary: OrderedSet[Word], consider_case: bool) -> Tuple[PronunciationDict, OrderedSet[Word]]:
+  """
+  Like `select_subset_dictionary` but decodes only the pronunciations of the selected words and returns
+  them as new dictionary together with the out-of-vocabulary words.
+  """
+  if msg := validate_type(dictionary, BinaryDictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if msg := validate_vocabulary(vocabulary):
+    raise ValueError(f"Parameter 'vocabulary': {msg}")
+  if msg := validate_consider_case(consider_case):
+    raise ValueError(f"Parameter 'consider_case': {msg}")
+
+  if consider_case:
+    indices, oov_voc = get_subset_indices_casing(dictionary, vocabulary)
+  else:
+    indices, oov_voc = get_subset_indices_ignore_casing(dictionary, vocabulary)
+
+  result = OrderedDict(
+    (dictionary.get_word(index), dictionary.get_pronunciations(index))
+    for index in indices
   )
+  return result, oov_voc
 
-  for word in unused_dict_voc_actual:
-    assert word in dictionary
-    dictionary.pop(word)
 
-  return oov_voc_actual
+def get_subset_indices_casing(dictionary: BinaryDictionary, vocabulary: OrderedSet[Word]) -> Tuple[List[int], OrderedSet[Word]]:
+  indices = []
+  oov_voc = OrderedSet()
+  for word in vocabulary:
+    index = dictionary.get_index(word)
+    if index is None:
+      oov_voc.add(word)
+    else:
+      indices.append(index)
+  # keep the order of the dictionary
+  indices.sort()
+  return indices, oov_voc
+
+
+def get_subset_indices_ignore_casing(dictionary: BinaryDictionary, vocabulary: OrderedSet[Word]) -> Tuple[List[int], OrderedSet[Word]]:
+  voc_word_map = get_mapping(vocabulary)
+  dict_vocabulary = set()
+  indices = []
+  if len(voc_word_map) * IGNORE_CASE_LOOKUP_COST >= len(dictionary):
+    # reading all words is faster than looking up each word of a large vocabulary
+    for index, word in enumerate(dictionary):
+      word_lower = word.lower()
+      dict_vocabulary.add(word_lower)
+      if word_lower in voc_word_map:
+        indices.append(index)
+    return indices, get_oov_words_ignore_casing(voc_word_map, dict_vocabulary)
+
+  # only the words of the vocabulary are looked up
+  for word_lower in voc_word_map.keys():
+    word_indices = dictionary.get_indices_ignore_case(word_lower)
+    if len(word_indices) > 0:
+      dict_vocabulary.add(word_lower)
+      indices.extend(word_indices)
+  # keep the order of the dictionary
+  indices.sort()
+  return indices, get_oov_words_ignore_casing(voc_word_map, dict_vocabulary)
@@ -0,0 +1,66 @@
+"""
+Operations which decide per symbol what to do with it (e.g., mapping or removing symbols) are computed
+once for each symbol of the inventory of the dictionary instead of once per occurrence. The resulting
+table is applied to the pronunciations with plain lookups.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from pronunciation_dictionary import (MultiprocessingOptions, Pronunciation, PronunciationDict,
+                                      Symbol, Word)
+
+from pronunciation_dictionary_utils.executors import get_process_lookup_dict
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+
+# symbol -> resulting symbols (empty if the symbol is removed); contains only the changed symbols
+SymbolTable = Dict[Symbol, Tuple[Symbol, ...]]
+
+
+def get_symbols(dictionary: PronunciationDict, mp_options: MultiprocessingOptions, session: Optional[ProcessingSession] = None) -> Set[str]:
+  """
+  Returns all symbols that occur in the pronunciations of the dictionary. The words are processed in chunks in parallel.
+  """
+  words = list(dictionary.keys())
+  chunks = (
+    words[i:i + mp_options.chunksize]
+    for i in range(0, len(words), mp_options.chunksize)
+  )
+  result = set()
+  with use_session(session, mp_options) as current_session:
+    executor = current_session.get_executor(dictionary)
+    for symbols in executor.imap(process_get_symbols, chunks, 1):
+      result |= symbols
+  return result
+
+
+def process_get_symbols(words: List[Word]) -> Set[str]:
+  lookup_dict = get_process_lookup_dict()
+  result = {
+    symbol
+    for word in words
+    for pronunciation in lookup_dict[word].keys()
+    for symbol in pronunciation
+  }
+  return result
+
+
+def get_symbol_table_key(table: SymbolTable) -> Tuple:
+  return ("symbol-table", tuple(sorted(table.items())))
+
+
+def apply_symbol_table(pronunciations: List[Pronunciation], table: SymbolTable) -> List[Pronunciation]:
+  """
+  Replaces each symbol which is contained in the table with its resulting symbols; pronunciations without
+  any of these symbols are returned unchanged.
+  """
+  result = []
+  for pronunciation in pronunciations:
+    if table.keys().isdisjoint(pronunciation):
+      result.append(pronunciation)
+    else:
+      result.append(tuple(
+        new_symbol
+        for symbol in pronunciation
+        for new_symbol in table.get(symbol, (symbol,))
+      ))
+  return result
@@ -0,0 +1,107 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+
+class AhoCorasickAutomaton():
+  """
+  Multi-pattern automaton which finds all occurrences of the patterns in a text in one scan.
+  """
+
+  def __init__(self, patterns: Iterable[str]) -> None:
+    self.__transitions: List[Dict[str, int]] = [{}]
+    self.__fail: List[int] = [0]
+    # lengths of all patterns that end in the state (incl. the ones reachable via fail links)
+    self.__outputs: List[Tuple[int, ...]] = [()]
+
+    for pattern in patterns:
+      assert len(pattern) > 0
+      self.__add_pattern(pattern)
+    self.__build_fail_links()
+
+  def __add_pattern(self, pattern: str) -> None:
+    state = 0
+    for char in pattern:
+      next_state = self.__transitions[state].get(char)
+      if next_state is None:
+        next_state = len(self.__transitions)
+        self.__transitions.append({})
+        self.__fail.append(0)
+        self.__outputs.append(())
+        self.__transitions[state][char] = next_state
+      state = next_state
+    if len(pattern) not in self.__outputs[state]:
+      self.__outputs[state] += (len(pattern),)
+
+  def __build_fail_links(self) -> None:
+    queue = deque(self.__transitions[0].values())
+    while queue:
+      state = queue.popleft()
+      for char, next_state in self.__transitions[state].items():
+        queue.append(next_state)
+        fail_state = self.__fail[state]
+        while fail_state != 0 and char not in self.__transitions[fail_state]:
+          fail_state = self.__fail[fail_state]
+        self.__fail[next_state] = self.__transitions[fail_state].get(char, 0)
+        self.__outputs[next_state] += self.__outputs[self.__fail[next_state]]
+
+  def find_longest_matches(self, text: str) -> Dict[int, int]:
+    """
+    Returns the length of the longest match for each start position at which a pattern occurs.
+    """
+    result: Dict[int, int] = {}
+    state = 0
+    for i, char in enumerate(text):
+      while state != 0 and char not in self.__transitions[state]:
+        state = self.__fail[state]
+      state = self.__transitions[state].get(char, 0)
+      for length in self.__outputs[state]:
+        start = i - length + 1
+        if result.get(start, 0) < length:
+          result[start] = length
+    return result
+
+  def replace(self, text: str, replace_with: str) -> str:
+    """
+    Replaces the leftmost-longest non-overlapping occurrences of the patterns.
+    """
+    matches = self.find_longest_matches(text)
+    if len(matches) == 0:
+      return text
+    parts = []
+    i = 0
+    while i < len(text):
+      length = matches.get(i)
+      if length is None:
+        parts.append(text[i])
+        i += 1
+      else:
+        parts.append(replace_with)
+        i += length
+    return "".join(parts)
+
+
+class SymbolReplacer():
+  """
+  Replaces the patterns within symbols and caches the result for each distinct symbol.
+  """
+
+  def __init__(self, patterns: Iterable[str], replace_with: str) -> None:
+    self.__automaton = AhoCorasickAutomaton(patterns)
+    self.__replace_with = replace_with
+    self.__cache: Dict[str, str] = {}
+
+  def replace(self, symbol: str) -> str:
+    result = self.__cache.get(symbol)
+    if result is None:
+      result = self.__automaton.replace(symbol, self.__replace_with)
+      self.__cache[symbol] = result
+    return result
+
+
+@lru_cache(maxsize=16)
+def get_symbol_replacer(patterns: Tuple[str, ...], replace_with: str) -> SymbolReplacer:
+  """
+  Returns one replacer per process for the same arguments so that its cache is kept across tasks.
+  """
+  return SymbolReplacer(patterns, replace_with)
@@ -0,0 +1,163 @@
+"""
+Per-worker memoization of transforms which change each pronunciation independently of its word, e.g.,
+mapping, removing or replacing symbols. Many words share the same pronunciations (homophones,
+inflected duplicates, casing variants), therefore each worker keeps the results of each transform in a
+bounded LRU cache which persists across chunks and calls.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import partial
+from itertools import chain
+from logging import getLogger
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from pronunciation_dictionary import Pronunciation, Pronunciations, Word
+from tqdm import tqdm
+
+from pronunciation_dictionary_utils.chunk_processing import (ChangedEntries, ChunkResult,
+                                                             decode_pronunciations,
+                                                             encode_changed_values,
+                                                             encode_pronunciations, get_chunks)
+from pronunciation_dictionary_utils.executors import Executor, get_process_lookup_dict
+
+# cached pronunciations per transform and worker
+CACHE_SIZE = 2 ** 16
+# cached transforms per worker
+MAX_CACHED_TRANSFORMS = 4
+
+# returns the new pronunciation for each of the passed pronunciations
+Transform = Callable[[List[Pronunciation]], List[Pronunciation]]
+
+# caches of the current worker (process or thread)
+worker_state = threading.local()
+
+
+class TransformCache():
+  """
+  LRU cache of the new pronunciations of one transform.
+  """
+
+  def __init__(self, maxsize: int) -> None:
+    assert maxsize > 0
+    self.__maxsize = maxsize
+    self.__results: Dict[Pronunciation, Pronunciation] = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def __len__(self) -> int:
+    return len(self.__results)
+
+  def transform_all(self, pronunciations: List[Pronunciation], transform: Transform) -> Dict[Pronunciation, Pronunciation]:
+    """
+    Returns the new pronunciation of each of the distinct `pronunciations`; only the pronunciations which
+    are not cached are passed to `transform`.
+    """
+    results = self.__results
+    new_pronunciations = {}
+    missing = []
+    for pronunciation in pronunciations:
+      new_pronunciation = results.get(pronunciation)
+      if new_pronunciation is None:
+        missing.append(pronunciation)
+      else:
+        results.move_to_end(pronunciation)
+        new_pronunciations[pronunciation] = new_pronunciation
+    self.hits += len(new_pronunciations)
+    self.misses += len(missing)
+
+    if len(missing) > 0:
+      transformed = transform(missing)
+      assert len(transformed) == len(missing)
+      for pronunciation, new_pronunciation in zip(missing, transformed):
+        results[pronunciation] = new_pronunciation
+        new_pronunciations[pronunciation] = new_pronunciation
+      while len(results) > self.__maxsize:
+        results.popitem(last=False)
+    return new_pronunciations
+
+
+def get_worker_cache(key: Hashable) -> TransformCache:
+  caches: Optional[Dict[Hashable, TransformCache]] = getattr(worker_state, "caches", None)
+  if caches is None:
+    caches = OrderedDict()
+    worker_state.caches = caches
+  cache = caches.get(key)
+  if cache is None:
+    cache = TransformCache(CACHE_SIZE)
+    caches[key] = cache
+    while len(caches) > MAX_CACHED_TRANSFORMS:
+      caches.popitem(last=False)
+  else:
+    caches.move_to_end(key)
+  return cache
+
+
+def get_new_pronunciations(pronunciations: Pronunciations, changed_pronunciations: Dict[Pronunciation, Pronunciation], remove_empty: bool) -> Optional[Pronunciations]:
+  if changed_pronunciations.keys().isdisjoint(pronunciations):
+    return None
+  new_pronunciations = OrderedDict()
+  for pronunciation, weight in pronunciations.items():
+    new_pronunciation = changed_pronunciations.get(pronunciation, pronunciation)
+    if remove_empty and len(new_pronunciation) == 0:
+      continue
+    if new_pronunciation in new_pronunciations:
+      new_pronunciations[new_pronunciation] += weight
+    else:
+      new_pronunciations[new_pronunciation] = weight
+  if new_pronunciations == pronunciations:
+    return None
+  return new_pronunciations
+
+
+def process_memoized_chunk(chunk: Tuple[int, List[Word]], transform: Transform, key: Hashable, remove_empty: bool) -> Tuple[Optional[ChunkResult], int, int]:
+  start, words = chunk
+  lookup_dict = get_process_lookup_dict()
+  entries = [lookup_dict[word] for word in words]
+  cache = get_worker_cache(key)
+  misses = cache.misses
+  new_pronunciation_of = cache.transform_all(
+    list(dict.fromkeys(chain.from_iterable(entries))), transform)
+  misses = cache.misses - misses
+  lookups = sum(len(pronunciations) for pronunciations in entries)
+  changed_pronunciations = {
+    pronunciation: new_pronunciation
+    for pronunciation, new_pronunciation in new_pronunciation_of.items()
+    if new_pronunciation != pronunciation
+  }
+  new_entries = [
+    get_new_pronunciations(pronunciations, changed_pronunciations, remove_empty)
+    for pronunciations in entries
+  ]
+  return encode_changed_values(start, new_entries, encode_pronunciations), lookups - misses, misses
+
+
+def get_changed_pronunciations_memoized(executor: Executor, transform: Transform, key: Hashable, words: Sequence[Word], chunksize: int, remove_empty: bool, silent: bool, desc: Optional[str] = None) -> ChangedEntries:
+  """
+  Applies `transform` to the pronunciations of the words; `key` identifies the transform incl. its
+  parameters. Each worker transforms each distinct pronunciation only once (as long as it is cached).
+  Pronunciations which become empty are removed if `remove_empty` is true. The number of cache hits and
+  misses is logged at the end.
+  """
+  process_method = partial(
+    process_memoized_chunk,
+    transform=transform,
+    key=key,
+    remove_empty=remove_empty,
+  )
+  results = []
+  hits = 0
+  misses = 0
+  with tqdm(total=len(words), unit="words", desc=desc, disable=silent) as progress_bar:
+    for result, chunk_hits, chunk_misses in executor.imap(process_method, get_chunks(words, chunksize), 1):
+      if result is not None:
+        results.append(result)
+      hits += chunk_hits
+      misses += chunk_misses
+      progress_bar.update(min(chunksize, progress_bar.total - progress_bar.n))
+
+  if hits + misses > 0:
+    logger = getLogger(__name__)
+    log = logger.debug if silent else logger.info
+    log(f"Transformed {misses} of {hits + misses} pronunciation(s); {hits} were cached ({hits / (hits + misses) * 100:.2f}% hit rate).")
+  return ChangedEntries(words, results, decode_pronunciations)
@@ -4,6 +4,9 @@ from typing import Any, Optional
 from ordered_set import OrderedSet
 from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict, Pronunciations, Word
 
+from pronunciation_dictionary_utils.compact_dictionary import (CompactPronunciationDict,
+                                                               CompactPronunciations)
+
 
 class ValidationError():
   # pylint: disable=no-self-use
@@ -25,7 +28,9 @@ def validate_vocabulary(vocabulary: OrderedSet[Word]) -> Optional[str]:
 
 
 def validate_dictionary(dictionary: PronunciationDict) -> Optional[str]:
-  return validate_type(dictionary, OrderedDict)
+  if not isinstance(dictionary, (OrderedDict, CompactPronunciationDict)):
+    return "Value needs of type 'OrderedDict' or 'CompactPronunciationDict'!"
+  return None
 
 
 def validate_mp_options(mp_options: MultiprocessingOptions) -> Optional[str]:
@@ -44,6 +49,18 @@ def validate_seed(seed: int) -> Optional[str]:
   return None
 
 
+def validate_positive_integer(value: int) -> Optional[str]:
+  if not (isinstance(value, int) and value > 0):
+    return "Value needs to be a positive integer!"
+  return None
+
+
+def validate_removal_mode(mode: str) -> Optional[str]:
+  if mode not in ["all", "start", "end", "both"]:
+    return "Value needs to be 'all', 'start', 'end' or 'both'!"
+  return None
+
+
 def validate_type(obj: Any, t: type) -> Optional[str]:
   if not isinstance(obj, t):
     return f"Value needs of type '{t.__name__}'!"
@@ -51,8 +68,8 @@ def validate_type(obj: Any, t: type) -> Optional[str]:
 
 
 def validate_pronunciations(pronunciations: Pronunciations) -> Optional[str]:
-  if msg := validate_type(pronunciations, OrderedDict):
-    return msg
+  if not isinstance(pronunciations, (OrderedDict, CompactPronunciations)):
+    return "Value needs of type 'OrderedDict' or 'CompactPronunciations'!"
   if not len(pronunciations) > 0:
     return "At least one pronunciation is required!"
   return None
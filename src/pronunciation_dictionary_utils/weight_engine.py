@@ -0,0 +1,116 @@
+import random
+from itertools import chain
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pronunciation_dictionary import PronunciationDict, Word
+
+from pronunciation_dictionary_utils.segment_operations import (get_offsets,
+                                                               get_positions_in_segments,
+                                                               get_segment_any,
+                                                               get_segment_argmax,
+                                                               get_segment_argmin,
+                                                               get_segment_cumulative_sums,
+                                                               get_segment_sums)
+
+
+class WeightTable():
+  """
+  Weights of all pronunciations of a dictionary in one flat array; the weights of word i are in
+  [offsets[i], offsets[i + 1]).
+  """
+
+  def __init__(self, words: List[Word], offsets: np.ndarray, weights: np.ndarray) -> None:
+    assert len(offsets) == len(words) + 1
+    self.words = words
+    self.offsets = offsets
+    self.weights = weights
+
+  @classmethod
+  def from_dictionary(cls, dictionary: PronunciationDict) -> "WeightTable":
+    counts = np.fromiter(
+      (len(pronunciations) for pronunciations in dictionary.values()),
+      dtype=np.int64, count=len(dictionary),
+    )
+    offsets = get_offsets(counts)
+    weights = np.fromiter(
+      chain.from_iterable(pronunciations.values() for pronunciations in dictionary.values()),
+      dtype=np.float64, count=int(offsets[-1]),
+    )
+    return cls(list(dictionary.keys()), offsets, weights)
+
+  @property
+  def counts(self) -> np.ndarray:
+    return np.diff(self.offsets)
+
+  def get_sums(self) -> np.ndarray:
+    """
+    Returns the sum of the weights of each word; the weights are added in the same order as `sum` does.
+    """
+    cumulative_sums = get_segment_cumulative_sums(self.weights, self.offsets)
+    counts = self.counts
+    non_empty = counts > 0
+    sums = np.zeros(len(counts))
+    sums[non_empty] = cumulative_sums[self.offsets[1:][non_empty] - 1]
+    return sums
+
+  def get_normalized_weights(self, ignore_zero_sums: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the weights divided by the sum of the weights of their word and whether each word changed.
+    Words whose weights sum up to zero are kept if `ignore_zero_sums` is set, otherwise an error is raised.
+    """
+    sums = np.repeat(self.get_sums(), self.counts)
+    divisible = sums != 0
+    if not ignore_zero_sums and not np.all(divisible):
+      raise ZeroDivisionError("float division by zero")
+    new_weights = self.weights.copy()
+    np.divide(self.weights, sums, out=new_weights, where=divisible)
+    changed_words = get_segment_any(new_weights != self.weights, self.offsets)
+    return new_weights, changed_words
+
+  def get_argmax(self) -> np.ndarray:
+    return get_segment_argmax(self.weights, self.offsets)
+
+  def get_argmin(self) -> np.ndarray:
+    return get_segment_argmin(self.weights, self.offsets)
+
+  def sample(self, seed: Optional[int]) -> np.ndarray:
+    """
+    Draws one position per word with probabilities proportional to the weights. With a seed, the result
+    is identical to calling `random.seed(seed)` and `random.choices(..., weights, k=1)` for each word.
+    """
+    counts = self.counts
+    if seed is None:
+      uniforms = get_unseeded_generator().random(len(counts))
+    else:
+      uniforms = np.full(len(counts), random.Random(seed).random())
+    cumulative_sums = get_segment_cumulative_sums(self.weights, self.offsets)
+    totals = self.get_sums()
+    if np.any(totals[counts > 0] <= 0):
+      raise ValueError("Total of weights must be greater than zero")
+    if not np.all(np.isfinite(totals)):
+      raise ValueError("Total of weights must be finite")
+    thresholds = np.repeat(uniforms * totals, counts)
+    # like bisect_right on the cumulative sums in [0, count - 1)
+    positions = get_positions_in_segments(self.offsets)
+    below = (cumulative_sums <= thresholds) & (positions < np.repeat(counts - 1, counts))
+    return get_segment_sums(below.astype(np.int64), self.offsets)
+
+
+def get_unseeded_generator() -> np.random.Generator:
+  # derived from the global random state so that `random.seed` still makes the results reproducible
+  return np.random.default_rng(random.getrandbits(64))
+
+
+def get_random_positions(counts: np.ndarray, seed: Optional[int]) -> np.ndarray:
+  """
+  Draws one position per count. With a seed, the result is identical to calling `random.seed(seed)` and
+  `random.choice(...)` for each count.
+  """
+  if seed is None:
+    return get_unseeded_generator().integers(0, np.maximum(counts, 1))
+  result = np.zeros(len(counts), dtype=np.int64)
+  for count in np.unique(counts).tolist():
+    if count > 0:
+      result[counts == count] = random.Random(seed).choice(range(count))
+  return result
@@ -1,64 +1,38 @@
 from collections import OrderedDict
-from functools import partial
-from multiprocessing.pool import Pool
-from typing import Optional, Tuple
+from typing import Optional
 
-from ordered_set import OrderedSet
-from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict, Pronunciations, Word
-from tqdm import tqdm
+import numpy as np
+from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict, Pronunciations
 
-from pronunciation_dictionary_utils.validation import validate_dictionary, validate_mp_options
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
+                                                       validate_type)
+from pronunciation_dictionary_utils.weight_engine import WeightTable
 
 
-def normalize_weights(dictionary: PronunciationDict, mp_options: MultiprocessingOptions, silent: bool = False) -> int:
+def normalize_weights(dictionary: PronunciationDict, mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> int:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
-  process_method = partial(
-    process_normalize_weights,
-  )
-
-  with Pool(
-    processes=mp_options.n_jobs,
-    initializer=__init_pool_prepare_cache_mp,
-    initargs=(dictionary,),
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
-    entries = OrderedSet(dictionary.keys())
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    pronunciations_to_i = list(tqdm(iterator, total=len(entries), unit="words", disable=silent))
+  weight_table = WeightTable.from_dictionary(dictionary)
+  new_weights, changed_words = weight_table.get_normalized_weights(ignore_zero_sums=True)
 
   changed_counter = 0
-  for word, new_pronunciations in pronunciations_to_i:
-    pronunciations_unchanged = new_pronunciations is None
-    if pronunciations_unchanged:
-      continue
-
-    dictionary[word] = new_pronunciations
+  for index in np.flatnonzero(changed_words).tolist():
+    word = weight_table.words[index]
+    start, end = weight_table.offsets[index], weight_table.offsets[index + 1]
+    dictionary[word] = OrderedDict(zip(dictionary[word].keys(), new_weights[start:end].tolist()))
     changed_counter += 1
 
-  return changed_counter
-
-
-process_lookup_dict: PronunciationDict = None
+  if changed_counter > 0:
+    invalidate_dictionary(dictionary)
 
-
-def __init_pool_prepare_cache_mp(lookup_dict: PronunciationDict) -> None:
-  global process_lookup_dict
-  process_lookup_dict = lookup_dict
-
-
-def process_normalize_weights(word: Word) -> Tuple[Word, Optional[Pronunciations]]:
-  global process_lookup_dict
-  assert word in process_lookup_dict
-  pronunciations = process_lookup_dict[word]
-  new_pronunciations = normalize_pronunciations_weights_entry(pronunciations)
-  changed_anything = pronunciations != new_pronunciations
-  if changed_anything:
-    return word, new_pronunciations
-  return word, None
+  return changed_counter
 
 
 def normalize_pronunciations_weights_entry(pronunciations: Pronunciations) -> Pronunciations:
@@ -0,0 +1,112 @@
+import unicodedata
+from typing import Any, List, Literal, Optional, Tuple
+
+from pronunciation_dictionary import Word
+
+NORMALIZATION_FORMS = ("NFC", "NFD", "NFKC", "NFKD")
+CASING_MODES = ("lower", "upper", "casefold")
+
+# separator of the words of a chunk; words of dictionaries and vocabularies can't contain it because
+# they are read line by line
+CHUNK_SEPARATOR = "\n"
+
+# steps that don't depend on the words being separate, i.e., they can be applied to joined words
+JOINABLE_STEPS = ("translate", "normalize", "lower", "upper", "casefold")
+
+
+def validate_normalization_form(form: str) -> Optional[str]:
+  if form not in NORMALIZATION_FORMS:
+    return "Value needs to be 'NFC', 'NFD', 'NFKC' or 'NFKD'!"
+  return None
+
+
+class WordNormalizer():
+  """
+  Chain of steps that change words, e.g., the removal of symbols (via a `str.translate` table),
+  Unicode normalization and casing. The chain is applied either to single words or to chunks of words,
+  which are joined and transformed at once as far as possible.
+  """
+
+  def __init__(self) -> None:
+    self.__steps: List[Tuple[str, Any]] = []
+
+  def __len__(self) -> int:
+    return len(self.__steps)
+
+  def remove_symbols(self, symbols: str, mode: Literal["all", "start", "end", "both"]) -> "WordNormalizer":
+    if symbols == "":
+      return self
+    if mode == "all":
+      table = str.maketrans("", "", symbols)
+      joined_table = dict(table)
+      joined_table.pop(ord(CHUNK_SEPARATOR), None)
+      self.__steps.append(("translate", (table, joined_table)))
+    elif mode == "start":
+      self.__steps.append(("lstrip", symbols))
+    elif mode == "end":
+      self.__steps.append(("rstrip", symbols))
+    elif mode == "both":
+      self.__steps.append(("strip", symbols))
+    else:
+      assert False
+    return self
+
+  def normalize_unicode(self, form: Literal["NFC", "NFD", "NFKC", "NFKD"]) -> "WordNormalizer":
+    assert form in NORMALIZATION_FORMS
+    self.__steps.append(("normalize", form))
+    return self
+
+  def change_casing(self, mode: Literal["lower", "upper", "casefold"]) -> "WordNormalizer":
+    assert mode in CASING_MODES
+    self.__steps.append((mode, None))
+    return self
+
+  def normalize(self, word: Word) -> Word:
+    for step in self.__steps:
+      word = apply_step(word, step, False)
+    return word
+
+  def normalize_words(self, words: List[Word]) -> List[Word]:
+    """
+    Returns the normalized words; steps which can be applied to the joined words are applied to all words
+    at once.
+    """
+    if len(words) == 0:
+      return []
+    text = CHUNK_SEPARATOR.join(words)
+    if text.count(CHUNK_SEPARATOR) != len(words) - 1:
+      return [self.normalize(word) for word in words]
+
+    new_words: Optional[List[Word]] = None
+    for step in self.__steps:
+      name, argument = step
+      if name in JOINABLE_STEPS:
+        if new_words is not None:
+          text = CHUNK_SEPARATOR.join(new_words)
+          new_words = None
+        text = apply_step(text, step, True)
+      else:
+        if new_words is None:
+          new_words = text.split(CHUNK_SEPARATOR)
+        new_words = [getattr(word, name)(argument) for word in new_words]
+    if new_words is None:
+      new_words = text.split(CHUNK_SEPARATOR)
+
+    if len(new_words) != len(words):
+      return [self.normalize(word) for word in words]
+    return new_words
+
+
+def apply_step(text: str, step: Tuple[str, Any], joined: bool) -> str:
+  name, argument = step
+  if name == "translate":
+    table, joined_table = argument
+    return text.translate(joined_table if joined else table)
+  if name == "normalize":
+    return unicodedata.normalize(argument, text)
+  if name in ("lower", "upper", "casefold"):
+    return getattr(text, name)()
+  if name in ("lstrip", "rstrip", "strip"):
+    assert not joined
+    return getattr(text, name)(argument)
+  assert False
@@ -1,71 +1,58 @@
-from collections import OrderedDict
-from functools import partial
-from multiprocessing.pool import Pool
-from typing import Literal, Optional, Tuple
+from typing import Optional, Tuple
 
 from ordered_set import OrderedSet
 from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict, Word
-from tqdm import tqdm
 
-from pronunciation_dictionary_utils.common import merge_pronunciations
-from pronunciation_dictionary_utils.validation import validate_dictionary
+from pronunciation_dictionary_utils.case_indexed_dictionary import CaseIndexedPronunciationDict
+from pronunciation_dictionary_utils.chunk_processing import get_changed_words_of_chunks
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.key_rewriting import rewrite_words
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.validation import validate_dictionary, validate_type
+from pronunciation_dictionary_utils.word_normalization import (CASING_MODES, WordNormalizer,
+                                                               validate_normalization_form)
 
 
 def __validate_mode(mode: str) -> Optional[str]:
-  if mode not in ["lower", "upper"]:
+  if mode not in CASING_MODES:
     return "Invalid value!"
   return None
 
 
-def change_word_casing(dictionary: PronunciationDict, mode: str, mp_options: MultiprocessingOptions, silent: bool = False) -> int:
+def change_word_casing(dictionary: PronunciationDict, mode: str, mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None, unicode_form: Optional[str] = None) -> Tuple[OrderedSet[Word], OrderedSet[Word]]:
+  """
+  Changes the casing of all words (`mode`: "lower", "upper" or "casefold"); the words can be normalized to
+  the Unicode normalization form `unicode_form` beforehand.
+  """
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := __validate_mode(mode):
     raise ValueError(f"Parameter 'mode': {msg}")
-
-  process_method = partial(
-    __process_change_casing,
-    mode=mode,
-  )
-
-  with Pool(
-    processes=mp_options.n_jobs,
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
-    iterator = pool.imap(process_method, dictionary.keys(), mp_options.chunksize)
-    new_words_to_words = dict(tqdm(iterator, total=len(dictionary), unit="words", disable=silent))
-
-  new_words = OrderedDict((
-    (k, new_word)
-    for k in dictionary.keys()
-    if (new_word := new_words_to_words[k])
-  ))
-
-  del new_words_to_words
-
-  created_words = OrderedSet()
-
-  for word, new_word in new_words.items():
-    popped_pronunciations = dictionary.pop(word)
-    if new_word in dictionary:
-      existing_pronunciations = dictionary[new_word]
-      merge_pronunciations(existing_pronunciations, popped_pronunciations)
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
+  if unicode_form is not None and (msg := validate_normalization_form(unicode_form)):
+    raise ValueError(f"Parameter 'unicode_form': {msg}")
+
+  normalizer = WordNormalizer()
+  if unicode_form is not None:
+    normalizer.normalize_unicode(unicode_form)
+  normalizer.change_casing(mode)
+
+  with use_session(session, mp_options) as current_session:
+    executor = current_session.get_executor()
+    if mode == "lower" and unicode_form is None and isinstance(dictionary, CaseIndexedPronunciationDict):
+      # only the words which are not in lower-case change
+      changed_words = (
+        (word, word.lower())
+        for word in dictionary.get_cased_words()
+      )
     else:
-      created_words.add(new_word)
-      dictionary[new_word] = popped_pronunciations
-
-  removed_words = OrderedSet(new_words.keys())
-  return removed_words, created_words
+      changed_words = get_changed_words_of_chunks(
+        executor, normalizer.normalize_words, list(dictionary.keys()), mp_options.chunksize, silent)
+    removed_words, created_words, _ = rewrite_words(
+      dictionary, changed_words, current_session, mp_options.chunksize, silent)
 
+  if len(removed_words) > 0:
+    invalidate_dictionary(dictionary)
 
-def __process_change_casing(word: Word, mode: Literal["upper", "lower"]) -> Tuple[Word, Optional[Word]]:
-  if mode == "upper":
-    new_word = word.upper()
-  elif mode == "lower":
-    new_word = word.lower()
-  else:
-    assert False
-
-  if new_word != word:
-    return word, new_word
-  return word, None
+  return removed_words, created_words
@@ -1,19 +1,15 @@
-from functools import partial
-from multiprocessing.pool import Pool
-from typing import Literal, Optional, Tuple
+from typing import Optional, Tuple
 
 from ordered_set import OrderedSet
 from pronunciation_dictionary import MultiprocessingOptions, PronunciationDict, Word
-from tqdm import tqdm
 
-from pronunciation_dictionary_utils.common import merge_pronunciations
-from pronunciation_dictionary_utils.validation import validate_dictionary, validate_mp_options
-
-
-def __validate_mode(mode: str) -> Optional[str]:
-  if mode not in ["all", "start", "end", "both"]:
-    return "Value needs to be 'all', 'start', 'end' or 'both'!"
-  return None
+from pronunciation_dictionary_utils.chunk_processing import get_changed_words_of_chunks
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.key_rewriting import rewrite_words
+from pronunciation_dictionary_utils.processing_session import ProcessingSession, use_session
+from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_mp_options,
+                                                       validate_removal_mode, validate_type)
+from pronunciation_dictionary_utils.word_normalization import WordNormalizer
 
 
 def __validate_symbols(symbols: str) -> Optional[str]:
@@ -22,70 +18,33 @@ def __validate_symbols(symbols: str) -> Optional[str]:
   return None
 
 
-def remove_symbols_from_words(dictionary: PronunciationDict, symbols: str, mode: str, mp_options: MultiprocessingOptions, silent: bool = False) -> Tuple[OrderedSet[Word], OrderedSet[Word]]:
+def remove_symbols_from_words(dictionary: PronunciationDict, symbols: str, mode: str, mp_options: MultiprocessingOptions, silent: bool = False, session: Optional[ProcessingSession] = None) -> Tuple[OrderedSet[Word], OrderedSet[Word]]:
   if msg := validate_dictionary(dictionary):
     raise ValueError(f"Parameter 'dictionary': {msg}")
   if msg := __validate_symbols(symbols):
     raise ValueError(f"Parameter 'symbols': {msg}")
-  if msg := __validate_mode(mode):
+  if msg := validate_removal_mode(mode):
     raise ValueError(f"Parameter 'mode': {msg}")
   if msg := validate_mp_options(mp_options):
     raise ValueError(f"Parameter 'mp_options': {msg}")
+  if session is not None and (msg := validate_type(session, ProcessingSession)):
+    raise ValueError(f"Parameter 'session': {msg}")
 
   if symbols == "":
     return OrderedSet(), 0
 
-  process_method = partial(
-    process_get_word,
-    symbols=symbols,
-    mode=mode,
-  )
+  normalizer = WordNormalizer().remove_symbols(symbols, mode)
 
-  with Pool(
-    processes=mp_options.n_jobs,
-    maxtasksperchild=mp_options.maxtasksperchild,
-  ) as pool:
+  with use_session(session, mp_options) as current_session:
+    executor = current_session.get_executor()
     entries = OrderedSet(dictionary.keys())
-    iterator = pool.imap(process_method, entries, mp_options.chunksize)
-    new_words_to_words = dict(tqdm(iterator, total=len(entries), unit="words", disable=silent))
+    changed_words = get_changed_words_of_chunks(
+      executor, normalizer.normalize_words, entries, mp_options.chunksize, silent)
+    removed_words, _, removed_words_entirely = rewrite_words(
+      dictionary, changed_words, current_session, mp_options.chunksize, silent)
 
-  removed_words_entirely = OrderedSet()
-  removed_words = OrderedSet()
-  all_words_in_order = OrderedSet(dictionary.keys())
-  for word in all_words_in_order:
-    new_word = new_words_to_words[word]
-    changed_word = new_word is not None
-    if changed_word:
-      popped_pronunciations = dictionary.pop(word)
-      if new_word in dictionary:
-        existing_pronunciations = dictionary[new_word]
-        merge_pronunciations(existing_pronunciations, popped_pronunciations)
-      else:
-        if new_word == "":
-          removed_words_entirely.add(word)
-        else:
-          dictionary[new_word] = popped_pronunciations
-      removed_words.add(word)
+  if len(removed_words) > 0:
+    invalidate_dictionary(dictionary)
 
   return removed_words_entirely, removed_words
 
-
-def process_get_word(word: Word, symbols: str, mode: Literal["all", "start", "end", "both"]) -> Tuple[Word, Optional[Word]]:
-  if mode == "all":
-    new_word = "".join(
-      symbol
-      for symbol in word
-      if symbol not in symbols
-    )
-  elif mode == "start":
-    new_word = word.lstrip(symbols)
-  elif mode == "end":
-    new_word = word.rstrip(symbols)
-  elif mode == "both":
-    new_word = word.strip(symbols)
-  else:
-    assert False
-
-  if new_word != word:
-    return word, new_word
-  return word, None
@@ -1,8 +1,22 @@
+import locale
+import marshal
 from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from heapq import merge
+from itertools import groupby, islice
+from operator import itemgetter
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import IO, Any, Callable, Generator, Iterable, Iterator, List, Optional, Tuple
 
-from pronunciation_dictionary import PronunciationDict
+from pronunciation_dictionary import PronunciationDict, Pronunciations, Word
 
-from pronunciation_dictionary_utils.validation import validate_dictionary, validate_type
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciationDict
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.validation import (validate_dictionary, validate_positive_integer,
+                                                       validate_type)
+
+Entry = Tuple[Word, Pronunciations]
 
 
 def sort_words(dictionary: PronunciationDict, descending: bool, consider_case: bool) -> PronunciationDict:
@@ -14,9 +28,152 @@ def sort_words(dictionary: PronunciationDict, descending: bool, consider_case: b
     raise ValueError(f"Parameter 'consider_case': {msg}")
 
   words = dictionary.keys()
-  sorted_words = sorted(words, reverse=descending,
-                        key=lambda w: w if consider_case else (w.lower(), w))
-  result = OrderedDict((
-    (word, dictionary[word]) for word in sorted_words
-  ))
+  sorted_words = sorted(words, reverse=descending, key=get_word_sort_key(consider_case))
+  entries = ((word, dictionary[word]) for word in sorted_words)
+  if isinstance(dictionary, CompactPronunciationDict):
+    return CompactPronunciationDict(entries)
+  result = OrderedDict(entries)
   return result
+
+
+def sort_words_in_place(dictionary: PronunciationDict, descending: bool, consider_case: bool, locale_name: Optional[str] = None) -> bool:
+  """
+  Sorts the dictionary like `sort_words` but reorders the entries of the dictionary itself instead of
+  creating a copy. With `locale_name` the words are compared by their collation keys of that locale
+  (`locale.strxfrm`); words with equal collation keys are ordered by themselves. Returns whether the
+  order changed.
+  """
+  if msg := validate_dictionary(dictionary):
+    raise ValueError(f"Parameter 'dictionary': {msg}")
+  if msg := validate_type(descending, bool):
+    raise ValueError(f"Parameter 'descending': {msg}")
+  if msg := validate_type(consider_case, bool):
+    raise ValueError(f"Parameter 'consider_case': {msg}")
+  if locale_name is not None and (msg := validate_type(locale_name, str)):
+    raise ValueError(f"Parameter 'locale_name': {msg}")
+
+  sorted_words = list(dictionary.keys())
+  # each key is computed once; the second sort is stable, i.e., words with equal keys stay sorted
+  sorted_words.sort(reverse=descending)
+  if locale_name is not None:
+    with use_collation_locale(locale_name):
+      sorted_words.sort(key=get_collation_sort_key(consider_case), reverse=descending)
+  elif not consider_case:
+    sorted_words.sort(key=str.lower, reverse=descending)
+
+  if sorted_words == list(dictionary.keys()):
+    return False
+  move_to_end = dictionary.move_to_end
+  for word in sorted_words:
+    move_to_end(word)
+  invalidate_dictionary(dictionary)
+  return True
+
+
+@contextmanager
+def use_collation_locale(locale_name: str) -> Generator[None, None, None]:
+  previous_locale_name = locale.setlocale(locale.LC_COLLATE)
+  try:
+    locale.setlocale(locale.LC_COLLATE, locale_name)
+  except locale.Error as error:
+    raise ValueError(f"Parameter 'locale_name': Locale \"{locale_name}\" is not available!") from error
+  try:
+    yield
+  finally:
+    locale.setlocale(locale.LC_COLLATE, previous_locale_name)
+
+
+def get_collation_sort_key(consider_case: bool) -> Callable[[Word], str]:
+  if consider_case:
+    return locale.strxfrm
+  return get_uncased_collation_sort_key
+
+
+def get_uncased_collation_sort_key(word: Word) -> str:
+  return locale.strxfrm(word.lower())
+
+
+def get_word_sort_key(consider_case: bool) -> Callable[[Word], Any]:
+  if consider_case:
+    return get_cased_sort_key
+  return get_uncased_sort_key
+
+
+def get_cased_sort_key(word: Word) -> Word:
+  return word
+
+
+def get_uncased_sort_key(word: Word) -> Any:
+  return word.lower(), word
+
+
+def sort_words_external(entries: Iterable[Entry], descending: bool, consider_case: bool, run_size: int, directory: Optional[Path] = None) -> Iterator[Entry]:
+  """
+  Sorts the entries like `sort_words` while keeping at most `run_size` entries in memory. The entries are
+  sorted in runs of `run_size` entries which are written to temporary files in `directory` (default: the
+  temporary directory of the system) and merged afterwards. Entries of the same word are combined like
+  while loading a dictionary, i.e., pronunciations which already exist are ignored.
+  """
+  if msg := validate_type(descending, bool):
+    raise ValueError(f"Parameter 'descending': {msg}")
+  if msg := validate_type(consider_case, bool):
+    raise ValueError(f"Parameter 'consider_case': {msg}")
+  if msg := validate_positive_integer(run_size):
+    raise ValueError(f"Parameter 'run_size': {msg}")
+  if directory is not None and (msg := validate_type(directory, Path)):
+    raise ValueError(f"Parameter 'directory': {msg}")
+
+  sort_key = get_word_sort_key(consider_case)
+  return combine_entries_of_same_word(
+    iterate_sorted_runs(iter(entries), descending, lambda entry: sort_key(entry[0]), run_size, directory))
+
+
+def iterate_sorted_runs(entries: Iterator[Entry], descending: bool, entry_key: Callable[[Entry], Any], run_size: int, directory: Optional[Path]) -> Iterator[Entry]:
+  run = list(islice(entries, run_size))
+  run.sort(key=entry_key, reverse=descending)
+  if len(run) < run_size:
+    # everything fits into memory
+    yield from run
+    return
+
+  with TemporaryDirectory(prefix="sort-words-", dir=directory) as tmp_dir, ExitStack() as stack:
+    run_paths: List[Path] = []
+    while len(run) > 0:
+      run_path = Path(tmp_dir) / f"{len(run_paths)}.run"
+      write_run(run, run_path)
+      run_paths.append(run_path)
+      run = list(islice(entries, run_size))
+      run.sort(key=entry_key, reverse=descending)
+    del run
+
+    runs = [
+      read_run(stack.enter_context(run_path.open("rb")))
+      for run_path in run_paths
+    ]
+    # entries of the same word are ordered after the runs, i.e., after their position in the input
+    yield from merge(*runs, key=entry_key, reverse=descending)
+
+
+def write_run(run: List[Entry], path: Path) -> None:
+  with path.open("wb") as file:
+    for word, pronunciations in run:
+      marshal.dump((word, tuple(pronunciations.items())), file)
+
+
+def read_run(file: IO[bytes]) -> Iterator[Entry]:
+  while True:
+    try:
+      word, pronunciations = marshal.load(file)
+    except EOFError:
+      return
+    yield word, OrderedDict(pronunciations)
+
+
+def combine_entries_of_same_word(entries: Iterator[Entry]) -> Iterator[Entry]:
+  for word, group in groupby(entries, key=itemgetter(0)):
+    _, pronunciations = next(group)
+    for _, other_pronunciations in group:
+      for pronunciation, weight in other_pronunciations.items():
+        if pronunciation not in pronunciations:
+          pronunciations[pronunciation] = weight
+    yield word, pronunciations
@@ -1,5 +1,6 @@
 import argparse
 import codecs
+import re
 from argparse import ArgumentParser, ArgumentTypeError
 from functools import partial
 from multiprocessing import cpu_count
@@ -8,8 +9,10 @@ from typing import Callable, List, Optional, TypeVar
 
 from ordered_set import OrderedSet
 
-from pronunciation_dictionary_utils_cli.globals import (DEFAULT_CHUNKSIZE, DEFAULT_ENCODING,
-                                                        DEFAULT_MAXTASKSPERCHILD, DEFAULT_N_JOBS)
+from pronunciation_dictionary_utils.executors import BACKENDS
+from pronunciation_dictionary_utils_cli.globals import (DEFAULT_BACKEND, DEFAULT_CHUNKSIZE,
+                                                        DEFAULT_ENCODING, DEFAULT_MAXTASKSPERCHILD,
+                                                        DEFAULT_N_JOBS, DEFAULT_STREAM_BATCH_SIZE)
 
 T = TypeVar("T")
 
@@ -19,6 +22,7 @@ def add_mp_group(parser: ArgumentParser) -> None:
   add_n_jobs_argument(mp_group)
   add_chunksize_argument(mp_group)
   add_maxtaskperchild_argument(mp_group)
+  add_backend_argument(mp_group)
 
 
 def add_io_group(parser: ArgumentParser) -> None:
@@ -62,6 +66,14 @@ def add_deserialization_group(parser: ArgumentParser) -> None:
                      help="consider weights")
 
 
+def add_stream_group(parser: ArgumentParser) -> None:
+  group = parser.add_argument_group('streaming arguments')
+  group.add_argument("-s", "--stream", action="store_true",
+                     help="read, process and write the dictionary in batches of words instead of loading it completely; all lines of a word need to be consecutive")
+  group.add_argument("-sb", "--stream-batch-size", type=parse_positive_integer, metavar="COUNT",
+                     help="amount of words per batch if stream", default=DEFAULT_STREAM_BATCH_SIZE)
+
+
 def add_encoding_argument(parser: ArgumentParser, short_var: str, variable: str, help_str: str) -> None:
   parser.add_argument(short_var, variable, type=parse_codec, metavar='CODEC',
                       help=help_str + "; see all available codecs at https://docs.python.org/3.8/library/codecs.html#standard-encodings", default=DEFAULT_ENCODING)
@@ -82,6 +94,11 @@ def add_maxtaskperchild_argument(parser: ArgumentParser) -> None:
                       help="amount of tasks per child", default=DEFAULT_MAXTASKSPERCHILD)
 
 
+def add_backend_argument(parser: ArgumentParser) -> None:
+  parser.add_argument("-b", "--backend", type=str, choices=BACKENDS, metavar="BACKEND",
+                      help="backend to process the entries: inline = serial in the current process; thread = thread pool; process = process pool; auto = choose depending on the amount of work", default=DEFAULT_BACKEND)
+
+
 class ConvertToOrderedSetAction(argparse._StoreAction):
   def __call__(self, parser: argparse.ArgumentParser, namespace: argparse.Namespace, values: Optional[List], option_string: Optional[str] = None):
     if values is not None:
@@ -155,6 +172,15 @@ def parse_non_empty_or_whitespace(value: str) -> str:
   return value
 
 
+def parse_regex(value: str) -> str:
+  value = parse_non_empty(value)
+  try:
+    re.compile(value)
+  except re.error as error:
+    raise ArgumentTypeError("Value needs to be a valid regular expression!") from error
+  return value
+
+
 def parse_float(value: str) -> float:
   value = parse_required(value)
   try:
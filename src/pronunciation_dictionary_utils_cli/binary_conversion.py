@@ -0,0 +1,42 @@
+from argparse import ArgumentParser, Namespace
+from logging import Logger
+
+from pronunciation_dictionary import DeserializationOptions, MultiprocessingOptions
+
+from pronunciation_dictionary_utils import save_binary_dict
+from pronunciation_dictionary_utils_cli.argparse_helper import (add_deserialization_group,
+                                                                add_mp_group, parse_existing_file,
+                                                                parse_path)
+from pronunciation_dictionary_utils_cli.io import try_load_dict
+
+
+def get_binary_conversion_parser(parser: ArgumentParser):
+  parser.description = "Convert dictionary into the binary format which is memory-mapped on reading, i.e., lookups only decode the entries they access. The commands `extract` and `export-vocabulary` accept binary dictionaries as input."
+  parser.add_argument("dictionary", metavar='DICTIONARY',
+                      type=parse_existing_file, help="dictionary file")
+  parser.add_argument("output", metavar='OUTPUT', type=parse_path, help="binary dictionary file")
+  add_deserialization_group(parser)
+  add_mp_group(parser)
+  return convert_to_binary_ns
+
+
+def convert_to_binary_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
+  lp_options = DeserializationOptions(
+      ns.consider_comments, ns.consider_numbers, ns.consider_pronunciation_comments, ns.consider_weights)
+  mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
+
+  dictionary_instance = try_load_dict(
+    ns.dictionary, ns.deserialization_encoding, lp_options, mp_options, logger)
+  if dictionary_instance is None:
+    return False
+
+  try:
+    save_binary_dict(dictionary_instance, ns.output)
+  except Exception as ex:
+    logger.debug(ex)
+    logger.error(f"Binary dictionary \"{ns.output.absolute()}\" couldn't be written.")
+    return False
+
+  logger.info(
+    f"Written binary dictionary containing {len(dictionary_instance)} word(s) to: \"{ns.output.absolute()}\".")
+  return True
@@ -12,6 +12,8 @@ from time import perf_counter
 from typing import Callable, Generator, List, Tuple
 
 from pronunciation_dictionary_utils_cli.argparse_helper import get_optional, parse_path
+from pronunciation_dictionary_utils_cli.binary_conversion import get_binary_conversion_parser
+from pronunciation_dictionary_utils_cli.dict_cache import configure_cache
 from pronunciation_dictionary_utils_cli.formatting_adjustment import get_formatting_parser
 from pronunciation_dictionary_utils_cli.logging_configuration import (configure_root_logger,
                                                                       get_file_logger,
@@ -20,6 +22,7 @@ from pronunciation_dictionary_utils_cli.logging_configuration import (configure_
 from pronunciation_dictionary_utils_cli.merging import get_merging_parser
 from pronunciation_dictionary_utils_cli.phoneme_set_extraction import \
   get_phoneme_set_extraction_parser
+from pronunciation_dictionary_utils_cli.pipeline import get_pipeline_parser
 from pronunciation_dictionary_utils_cli.pronunciations_map_symbols import \
   get_pronunciations_map_symbols_parser
 # nat: new functionality
@@ -27,6 +30,8 @@ from pronunciation_dictionary_utils_cli.pronunciations_map_symbols_json import \
   get_pronunciations_map_symbols_json_parser
 from pronunciation_dictionary_utils_cli.pronunciations_remove_symbols import \
   get_pronunciations_remove_symbols_parser
+from pronunciation_dictionary_utils_cli.pronunciations_replace_symbols import \
+  get_pronunciations_replace_symbols_parser
 from pronunciation_dictionary_utils_cli.pronunciations_sorting import \
   get_pronunciations_sorting_parser
 from pronunciation_dictionary_utils_cli.single_pronunciation_selection import \
@@ -82,17 +87,21 @@ def get_parsers() -> Generator[Tuple[str, str, Callable], None, None]:
      get_vocabulary_remove_symbols_parser),
     ("remove-symbols-from-pronunciations", "remove phonemes/symbols from pronunciations",
      get_pronunciations_remove_symbols_parser),
+    ("replace-in-pronunciations", "replace regular expression matches in pronunciations",
+     get_pronunciations_replace_symbols_parser),
     ("remove-symbols-from-words", "remove characters/symbols from words",
      get_words_remove_symbols_parser),
     ("change-formatting", "change formatting of dictionaries",
      get_formatting_parser),
     ("select-single-pronunciation", "select single pronunciation",
      get_single_pronunciation_selection_parser),
-    ("change-word-casing", "transform all words to upper- or lower-case",
+    ("change-word-casing", "transform all words to upper- or lower-case or case-fold them",
      get_words_casing_adjustment_parser),
     ("sort-words", "sort dictionary after words", get_words_sorting_parser),
     ("sort-pronunciations", "sort dictionary pronunciations", get_pronunciations_sorting_parser),
     ("normalize-weights", "normalize pronunciation weights for each word", get_weights_normalization_parser),
+    ("pipeline", "apply multiple steps to a dictionary while loading and saving it only once", get_pipeline_parser),
+    ("convert-to-binary", "convert dictionary into a memory-mapped binary format", get_binary_conversion_parser),
   )
 
 
@@ -118,6 +127,9 @@ def _init_parser():
                                nargs="?", const=None, help="path to write the log", default=default_log_path)
     logging_group.add_argument("--debug", action="store_true",
                                help="include debugging information in log")
+    cache_group = method_parser.add_argument_group("cache arguments")
+    cache_group.add_argument("--cache-dir", type=parse_path, metavar="DIR",
+                             help="directory to cache parsed dictionaries in a binary format to speed up loading them again if they weren't changed in the meantime; the least recently used entries are removed if the cache exceeds 2 GiB", default=None)
 
   return main_parser
 
@@ -148,6 +160,7 @@ def parse_args(args: List[str]) -> None:
 
   invoke_handler: Callable[..., bool] = getattr(ns, INVOKE_HANDLER_VAR)
   delattr(ns, INVOKE_HANDLER_VAR)
+  configure_cache(ns.cache_dir)
   log_to_file = ns.log is not None
   if log_to_file:
     log_level = logging.DEBUG if (local_debugging or ns.debug) else logging.INFO
@@ -0,0 +1,148 @@
+"""
+On-disk cache of parsed dictionaries. Each dictionary file is cached once per encoding and
+deserialization options; the cache is only used if path, size, modification time and content hash of
+the file are unchanged. The entries are stored with `marshal` which can't execute code while loading.
+If the cache grows larger than `MAX_CACHE_SIZE`, the least recently used entries are removed.
+"""
+
+import gc
+import marshal
+import os
+import struct
+from collections import OrderedDict
+from dataclasses import astuple
+from hashlib import blake2b, sha256
+from logging import Logger
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Optional, Tuple
+
+from pronunciation_dictionary import DeserializationOptions, PronunciationDict
+
+CACHE_FORMAT = b"PDUCACHE1"
+HEADER_SIZE = struct.Struct("<Q")
+HASH_BLOCK_SIZE = 1024 * 1024
+CACHE_SUFFIX = ".cache"
+MAX_CACHE_SIZE = 2 * 1024 * 1024 * 1024
+
+# path, size, modification time, content hash, encoding, deserialization options
+CacheKey = Tuple[str, int, int, str, str, Tuple[bool, ...]]
+
+cache_dir: Optional[Path] = None
+
+
+def configure_cache(directory: Optional[Path]) -> None:
+  """
+  Sets the directory of the cache; None disables the cache.
+  """
+  global cache_dir
+  cache_dir = directory
+
+
+def get_cache_dir() -> Optional[Path]:
+  return cache_dir
+
+
+def get_content_hash(path: Path) -> str:
+  content_hash = blake2b(digest_size=32)
+  with path.open("rb") as file:
+    while block := file.read(HASH_BLOCK_SIZE):
+      content_hash.update(block)
+  return content_hash.hexdigest()
+
+
+def get_cache_key(path: Path, encoding: str, options: DeserializationOptions) -> CacheKey:
+  stat = path.stat()
+  return (
+    str(path.absolute()),
+    stat.st_size,
+    stat.st_mtime_ns,
+    get_content_hash(path),
+    encoding,
+    astuple(options),
+  )
+
+
+def get_cache_path(directory: Path, key: CacheKey) -> Path:
+  # one cache file per dictionary, encoding and options; outdated versions are overwritten
+  path, _, _, _, encoding, options = key
+  name = sha256(repr((path, encoding, options)).encode("UTF-8")).hexdigest()
+  return directory / f"{name}{CACHE_SUFFIX}"
+
+
+def try_load_cached_dict(directory: Path, key: CacheKey, logger: Logger) -> Optional[PronunciationDict]:
+  cache_path = get_cache_path(directory, key)
+  if not cache_path.is_file():
+    return None
+  gc_was_enabled = gc.isenabled()
+  # creating millions of objects would otherwise trigger the garbage collection repeatedly
+  gc.disable()
+  try:
+    with cache_path.open("rb") as file:
+      if file.read(len(CACHE_FORMAT)) != CACHE_FORMAT:
+        return None
+      header_size, = HEADER_SIZE.unpack(file.read(HEADER_SIZE.size))
+      cached_key = marshal.loads(file.read(header_size))
+      if cached_key != key:
+        return None
+      entries = marshal.loads(file.read())
+    result = OrderedDict([
+      (word, OrderedDict(pronunciations))
+      for word, pronunciations in entries
+    ])
+    # marks the entry as recently used
+    os.utime(cache_path)
+  except Exception as ex:
+    logger.debug(ex)
+    return None
+  finally:
+    if gc_was_enabled:
+      gc.enable()
+  return result
+
+
+def try_save_cached_dict(dictionary: PronunciationDict, directory: Path, key: CacheKey, logger: Logger) -> bool:
+  cache_path = get_cache_path(directory, key)
+  tmp_path: Optional[Path] = None
+  try:
+    directory.mkdir(parents=True, exist_ok=True)
+    header = marshal.dumps(key)
+    entries = marshal.dumps(tuple(
+      (word, tuple(pronunciations.items()))
+      for word, pronunciations in dictionary.items()
+    ))
+    with NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False) as file:
+      tmp_path = Path(file.name)
+      file.write(CACHE_FORMAT)
+      file.write(HEADER_SIZE.pack(len(header)))
+      file.write(header)
+      file.write(entries)
+    os.replace(tmp_path, cache_path)
+  except Exception as ex:
+    logger.debug(ex)
+    if tmp_path is not None and tmp_path.exists():
+      tmp_path.unlink()
+    return False
+  evict_cached_dicts(directory, MAX_CACHE_SIZE, logger)
+  return True
+
+
+def evict_cached_dicts(directory: Path, max_size: int, logger: Logger) -> None:
+  """
+  Removes the least recently used entries until the entries take at most `max_size` bytes. The most
+  recently used entry is always kept.
+  """
+  try:
+    entries = [
+      (path, path.stat())
+      for path in directory.glob(f"*{CACHE_SUFFIX}")
+    ]
+    entries.sort(key=lambda entry: entry[1].st_mtime_ns, reverse=True)
+    total_size = 0
+    for index, (path, stat) in enumerate(entries):
+      total_size += stat.st_size
+      if index > 0 and total_size > max_size:
+        path.unlink()
+        logger.debug(f"Removed cache entry \"{path.absolute()}\".")
+  except Exception as ex:
+    logger.debug(ex)
@@ -4,3 +4,6 @@ DEFAULT_ENCODING = "UTF-8"
 DEFAULT_N_JOBS = cpu_count()
 DEFAULT_CHUNKSIZE = 1000
 DEFAULT_MAXTASKSPERCHILD = None
+DEFAULT_BACKEND = "auto"
+DEFAULT_STREAM_BATCH_SIZE = 100000
+DEFAULT_RUN_SIZE = 100000
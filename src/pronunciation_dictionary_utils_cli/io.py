@@ -1,10 +1,24 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from logging import Logger, getLogger
 from pathlib import Path
-from typing import Optional
+from shutil import copymode
+from tempfile import NamedTemporaryFile
+from typing import Callable, Generator, Iterable, List, Optional, Tuple
 
+from ordered_set import OrderedSet
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
-                                      PronunciationDict, SerializationOptions, load_dict, save_dict)
+                                      PronunciationDict, Pronunciations, SerializationOptions, Word,
+                                      deserialize, load_dict, save_dict, serialize)
 
+from pronunciation_dictionary_utils import EntryOperator, ProcessingSession, apply_entry_operators
+from pronunciation_dictionary_utils_cli.dict_cache import (get_cache_dir, get_cache_key,
+                                                           try_load_cached_dict,
+                                                           try_save_cached_dict)
+from pronunciation_dictionary_utils_cli.globals import DEFAULT_STREAM_BATCH_SIZE
 from pronunciation_dictionary_utils_cli.logging_configuration import get_file_logger
 
 
@@ -18,15 +32,178 @@ def try_save_dict(pronunciation_dict: PronunciationDict, path: Path, encoding: s
   return True
 
 
-def try_load_dict(path: Path, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, logger: Logger) -> Optional[PronunciationDict]:
+def log_deserialization_to(flogger: Logger) -> None:
   # Output logs to file
   pdict_logger = getLogger("pronunciation_dictionary.deserialization")
-  pdict_logger.parent = get_file_logger()
+  pdict_logger.parent = flogger
+
+
+def try_load_dict(path: Path, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, logger: Logger) -> Optional[PronunciationDict]:
+  log_deserialization_to(get_file_logger())
+
+  load_method = partial(load_dict, mp_options=mp_options)
+  return try_load_dict_cached(path, encoding, options, load_method, get_cache_dir(), logger)
+
+
+def try_load_dict_cached(path: Path, encoding: str, options: DeserializationOptions, load_method: Callable[[Path, str, DeserializationOptions], PronunciationDict], cache_dir: Optional[Path], logger: Logger) -> Optional[PronunciationDict]:
+  cache_key = None
+  if cache_dir is not None:
+    try:
+      cache_key = get_cache_key(path, encoding, options)
+    except Exception as ex:
+      logger.debug(ex)
+    else:
+      result = try_load_cached_dict(cache_dir, cache_key, logger)
+      if result is not None:
+        logger.debug(f"Loaded dictionary \"{path.absolute()}\" from cache.")
+        return result
 
   try:
-    result = load_dict(path, encoding, options, mp_options)
+    result = load_method(path, encoding, options)
   except Exception as ex:
     logger.debug(ex)
     logger.error(f"Dictionary \"{path.absolute()}\" couldn't be read.")
     return None
+
+  if cache_key is not None and not try_save_cached_dict(result, cache_dir, cache_key, logger):
+    logger.debug(f"Dictionary \"{path.absolute()}\" couldn't be cached.")
   return result
+
+
+def try_load_dicts(paths: List[Path], encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, logger: Logger) -> Optional[List[PronunciationDict]]:
+  """
+  Loads the dictionaries at the same time, each one in a separate process. Returns None if any
+  dictionary couldn't be loaded.
+  """
+  if mp_options.n_jobs == 1 or len(paths) == 1:
+    results = []
+    for path in paths:
+      result = try_load_dict(path, encoding, options, mp_options, logger)
+      if result is None:
+        return None
+      results.append(result)
+    return results
+
+  process_method = partial(
+    process_try_load_dict,
+    encoding=encoding,
+    options=options,
+    mp_options=MultiprocessingOptions(1, mp_options.maxtasksperchild, mp_options.chunksize),
+    cache_dir=get_cache_dir(),
+  )
+
+  # in contrast to the workers of a `Pool`, these workers can start the process which parses a dictionary
+  with ProcessPoolExecutor(max_workers=min(mp_options.n_jobs, len(paths))) as executor:
+    results = list(executor.map(process_method, paths))
+
+  if any(result is None for result in results):
+    return None
+  return results
+
+
+def process_try_load_dict(path: Path, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, cache_dir: Optional[Path]) -> Optional[PronunciationDict]:
+  log_deserialization_to(get_file_logger())
+  load_method = partial(load_dict, mp_options=mp_options)
+  return try_load_dict_cached(path, encoding, options, load_method, cache_dir, getLogger(__name__))
+
+
+def iterate_dict_batches(path: Path, encoding: str, options: DeserializationOptions, batch_size: int, mp_options: MultiprocessingOptions, flogger: Logger) -> Generator[PronunciationDict, None, None]:
+  """
+  Reads the dictionary in parts of `batch_size` lines which are deserialized one after another and
+  yields them as parts of about `batch_size` words. The last word of a part is moved into the next
+  part, i.e., consecutive lines of a word are always in the same part.
+  """
+  log_deserialization_to(flogger)
+
+  last_entry: Optional[Tuple[Word, Pronunciations]] = None
+  with path.open("r", encoding=encoding) as file:
+    lines = (line for raw_line in file for line in raw_line.splitlines())
+    while batch_lines := list(islice(lines, batch_size)):
+      batch = deserialize(batch_lines, options, mp_options)
+      if last_entry is not None:
+        word, pronunciations = last_entry
+        if word in batch:
+          # the first pronunciation of a word is kept like in `deserialize`
+          for pronunciation, weight in batch[word].items():
+            if pronunciation not in pronunciations:
+              pronunciations[pronunciation] = weight
+        batch[word] = pronunciations
+        batch.move_to_end(word, last=False)
+      if len(batch) == 0:
+        continue
+      last_entry = batch.popitem(last=True)
+      if len(batch) > 0:
+        yield batch
+  if last_entry is not None:
+    yield OrderedDict((last_entry,))
+
+
+def iterate_dict_entries(path: Path, encoding: str, options: DeserializationOptions, mp_options: MultiprocessingOptions, flogger: Logger) -> Generator[Tuple[Word, Pronunciations], None, None]:
+  """
+  Reads the dictionary in parts and yields one entry per word; lines of a word need to be consecutive.
+  """
+  for batch in iterate_dict_batches(path, encoding, options, DEFAULT_STREAM_BATCH_SIZE, mp_options, flogger):
+    yield from batch.items()
+
+
+def try_process_dict_streamed(path: Path, encoding: str, lp_options: DeserializationOptions, s_options: SerializationOptions, batch_size: int, operator: EntryOperator, session: ProcessingSession, logger: Logger, flogger: Logger) -> Optional[Tuple[int, OrderedSet[Word]]]:
+  """
+  Applies `operator` to each entry of the dictionary which is read in parts of about `batch_size` words;
+  all parts are processed by the workers of `session`. The result is written to a temporary file which
+  replaces the dictionary afterwards if anything was changed. Returns the amount of changed words and
+  the words which were removed because no pronunciations were left or None if the dictionary couldn't
+  be processed.
+  """
+  removed_words: OrderedSet[Word] = OrderedSet()
+
+  def process_batch(batch: PronunciationDict) -> int:
+    changed_batch_words, removed_batch_words = apply_entry_operators(
+      batch, [operator], session.mp_options, silent=True, session=session, transfer_entries=True)
+    removed_words.update(removed_batch_words)
+    return len(changed_batch_words)
+
+  batches = (
+    (batch, process_batch(batch))
+    for batch in iterate_dict_batches(path, encoding, lp_options, batch_size, session.mp_options, flogger)
+  )
+  changed_counter = try_replace_dict_streamed(path, encoding, s_options, batches, logger)
+  if changed_counter is None:
+    return None
+  return changed_counter, removed_words
+
+
+def try_replace_dict_streamed(path: Path, encoding: str, s_options: SerializationOptions, batches: Iterable[Tuple[PronunciationDict, int]], logger: Logger) -> Optional[int]:
+  """
+  Writes the parts of a dictionary together with their amount of changed words to a temporary file which
+  replaces the dictionary afterwards if anything was changed. Returns the total amount of changed words
+  or None if the dictionary couldn't be processed.
+  """
+  tmp_file = NamedTemporaryFile(
+    "w", encoding=encoding, dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+  tmp_path = Path(tmp_file.name)
+  changed_counter = 0
+  try:
+    with tmp_file:
+      is_first_line = True
+      for batch, batch_changed_counter in batches:
+        changed_counter += batch_changed_counter
+        for line in serialize(batch, s_options):
+          if not is_first_line:
+            tmp_file.write("\n")
+          tmp_file.write(line)
+          is_first_line = False
+    if changed_counter > 0:
+      copymode(path, tmp_path)
+      os.replace(tmp_path, path)
+  except ValueError as ex:
+    # e.g., unsorted input
+    logger.error(f"Dictionary \"{path.absolute()}\" couldn't be processed: {ex}")
+    return None
+  except Exception as ex:
+    logger.debug(ex)
+    logger.error(f"Dictionary \"{path.absolute()}\" couldn't be processed.")
+    return None
+  finally:
+    if tmp_path.exists():
+      tmp_path.unlink()
+  return changed_counter
@@ -1,14 +1,16 @@
 from argparse import ArgumentParser, Namespace
+from collections import OrderedDict
 from logging import Logger
 
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import merge_dictionaries
+from pronunciation_dictionary_utils import merge_many, merge_sorted
 from pronunciation_dictionary_utils_cli.argparse_helper import (ConvertToOrderedSetAction,
                                                                 add_io_group, add_mp_group,
                                                                 parse_existing_file)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (iterate_dict_entries, try_load_dicts,
+                                                   try_replace_dict_streamed, try_save_dict)
 
 
 def get_merging_parser(parser: ArgumentParser):
@@ -19,6 +21,13 @@ def get_merging_parser(parser: ArgumentParser):
                       help="dictionary files that should be merged to DICTIONARY", action=ConvertToOrderedSetAction)
   parser.add_argument("--duplicate-handling", type=str, metavar="MODE",
                       choices=["add", "extend", "replace"], help="sets how existing pronunciations should be handled: add = add missing pronunciations; extend = add missing pronunciations and extend existing ones; replace: add missing pronunciations and replace existing ones.", default="extend")
+  sorted_group = parser.add_argument_group("sorted input arguments")
+  sorted_group.add_argument("--sorted", action="store_true",
+                            help="all dictionaries are sorted by word (see sort-words); merge them word by word while reading them, i.e., without loading them into memory; the result is sorted, too")
+  sorted_group.add_argument("-d", "--descending", action="store_true",
+                            help="dictionaries are sorted descending")
+  sorted_group.add_argument("-co", "--consider-case", action="store_true",
+                            help="dictionaries are sorted considering casing")
   add_io_group(parser)
   add_mp_group(parser)
   return merge_dictionary_files_ns
@@ -33,17 +42,17 @@ def merge_dictionary_files_ns(ns: Namespace, logger: Logger, flogger: Logger) ->
 
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
-  resulting_dictionary = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
-  if resulting_dictionary is None:
+  if ns.sorted:
+    return merge_sorted_dictionary_files(ns, lp_options, s_options, mp_options, logger, flogger)
+
+  # all dictionaries are parsed at the same time
+  dictionaries = try_load_dicts(
+    [ns.dictionary, *ns.dictionaries], ns.encoding, lp_options, mp_options, logger)
+  if dictionaries is None:
     return False
 
-  changed_anything = False
-  for dictionary in ns.dictionaries:
-    dictionary_instance = try_load_dict(dictionary, ns.encoding, lp_options, mp_options, logger)
-    if dictionary_instance is None:
-      return False
-    changed_anything |= merge_dictionaries(
-      resulting_dictionary, dictionary_instance, ns.duplicate_handling)
+  resulting_dictionary, *other_dictionaries = dictionaries
+  changed_anything = merge_many(resulting_dictionary, other_dictionaries, ns.duplicate_handling)
 
   if not changed_anything:
     logger.info("Didn't change anything.")
@@ -56,3 +65,27 @@ def merge_dictionary_files_ns(ns: Namespace, logger: Logger, flogger: Logger) ->
 
   logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
   return True
+
+
+def merge_sorted_dictionary_files(ns: Namespace, lp_options: DeserializationOptions, s_options: SerializationOptions, mp_options: MultiprocessingOptions, logger: Logger, flogger: Logger) -> bool:
+  dictionaries = [
+    iterate_dict_entries(path, ns.encoding, lp_options, mp_options, flogger)
+    for path in [ns.dictionary, *ns.dictionaries]
+  ]
+  merged_entries = merge_sorted(dictionaries, ns.duplicate_handling, ns.descending, ns.consider_case)
+  batches = (
+    (OrderedDict(((word, pronunciations),)), int(changed))
+    for word, pronunciations, changed in merged_entries
+  )
+  changed_counter = try_replace_dict_streamed(
+    ns.dictionary, ns.encoding, s_options, batches, logger)
+  if changed_counter is None:
+    return False
+
+  if changed_counter == 0:
+    logger.info("Didn't change anything.")
+    return True
+
+  logger.info(f"Changed {changed_counter} word(s).")
+  logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
+  return True
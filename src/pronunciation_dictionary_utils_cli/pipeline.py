@@ -0,0 +1,258 @@
+"""
+The module applies multiple steps to a dictionary which is loaded and saved only once.
+
+Example steps file (JSON):
+{
+  "steps": [
+    { "command": "remove-symbols-from-words", "symbols": "'-", "mode": "both" },
+    { "command": "change-word-casing", "mode": "lower" },
+    { "command": "select-single-pronunciation", "mode": "first" },
+    { "command": "sort-words" }
+  ]
+}
+
+The same steps in TOML:
+[[steps]]
+command = "remove-symbols-from-words"
+symbols = "'-"
+...
+"""
+
+import json
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass
+from inspect import signature
+from logging import Logger
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
+                                      PronunciationDict, SerializationOptions)
+
+from pronunciation_dictionary_utils import (ProcessingSession, change_word_casing, map_symbols,
+                                            map_symbols_dict, normalize_weights,
+                                            remove_symbols_from_pronunciations,
+                                            remove_symbols_from_words,
+                                            replace_symbols_in_pronunciations,
+                                            select_single_pronunciation, sort_pronunciations,
+                                            sort_words_in_place)
+from pronunciation_dictionary_utils_cli.argparse_helper import (add_encoding_argument, add_io_group,
+                                                                add_mp_group, parse_existing_file)
+from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.pronunciations_map_symbols_json import try_load_mappings
+
+try:
+  import tomllib
+except ImportError:
+  try:
+    import tomli as tomllib
+  except ImportError:
+    tomllib = None
+
+
+@dataclass()
+class StepContext():
+  mp_options: MultiprocessingOptions
+  session: ProcessingSession
+  steps_dir: Path
+  logger: Logger
+  flogger: Logger
+
+
+# Each step returns the resulting dictionary and whether it changed anything.
+StepResult = Tuple[PronunciationDict, bool]
+
+
+def get_symbols_str(symbols: Union[str, List[str]]) -> str:
+  if isinstance(symbols, list):
+    return ''.join(symbols)
+  return symbols
+
+
+def step_remove_symbols_from_words(dictionary: PronunciationDict, context: StepContext, symbols: Union[str, List[str]], mode: str = "both") -> StepResult:
+  removed_words_entirely, removed_words = remove_symbols_from_words(
+    dictionary, get_symbols_str(symbols), mode, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Renamed {len(removed_words)} word(s).")
+  if len(removed_words_entirely) > 0:
+    context.logger.warning(f"{len(removed_words_entirely)} words were removed entirely.")
+  return dictionary, len(removed_words) > 0
+
+
+def step_change_word_casing(dictionary: PronunciationDict, context: StepContext, mode: str, unicode_form: Optional[str] = None) -> StepResult:
+  removed_words, created_words = change_word_casing(
+    dictionary, mode, context.mp_options, silent=False, session=context.session, unicode_form=unicode_form)
+  context.logger.info(f"Replaced {len(removed_words)} with {len(created_words)} word spelling(s).")
+  return dictionary, len(removed_words) > 0
+
+
+def step_map_symbols_in_pronunciations(dictionary: PronunciationDict, context: StepContext, from_symbols: List[str], to_symbol: str, partial_mapping: bool = False) -> StepResult:
+  map_to = to_symbol if partial_mapping else [to_symbol]
+  changed_words = map_symbols(
+    dictionary, OrderedSet(from_symbols), map_to, partial_mapping, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed pronunciations of {len(changed_words)} word(s).")
+  return dictionary, len(changed_words) > 0
+
+
+def step_map_symbols_in_pronunciations_json(dictionary: PronunciationDict, context: StepContext, mapping: str, partial_mapping: bool = False, mapping_encoding: str = "UTF-8") -> StepResult:
+  mappings = try_load_mappings(context.flogger, context.steps_dir / mapping, mapping_encoding)
+  if mappings is None:
+    raise ValueError(f"Mapping \"{mapping}\" couldn't be loaded!")
+  changed_words = map_symbols_dict(
+    dictionary, mappings, partial_mapping, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed pronunciations of {len(changed_words)} word(s).")
+  return dictionary, len(changed_words) > 0
+
+
+def step_remove_symbols_from_pronunciations(dictionary: PronunciationDict, context: StepContext, symbols: List[str], mode: str = "both", keep_empty: bool = False, empty_symbol: Optional[str] = "sil") -> StepResult:
+  removed_words, changed_counter = remove_symbols_from_pronunciations(
+    dictionary, OrderedSet(symbols), mode, keep_empty, empty_symbol, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+  if len(removed_words) > 0:
+    context.logger.warning(f"{len(removed_words)} words were removed.")
+  return dictionary, changed_counter > 0
+
+
+def step_replace_in_pronunciations(dictionary: PronunciationDict, context: StepContext, pattern: str, replacement: str, keep_empty: bool = False, empty_symbol: Optional[str] = "sil") -> StepResult:
+  removed_words, changed_counter = replace_symbols_in_pronunciations(
+    dictionary, pattern, replacement, keep_empty, empty_symbol, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+  if len(removed_words) > 0:
+    context.logger.warning(f"{len(removed_words)} words were removed.")
+  return dictionary, changed_counter > 0
+
+
+def step_select_single_pronunciation(dictionary: PronunciationDict, context: StepContext, mode: str = "first", seed: Optional[int] = None) -> StepResult:
+  changed_counter = select_single_pronunciation(
+    dictionary, mode, seed, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+  return dictionary, changed_counter > 0
+
+
+def step_sort_pronunciations(dictionary: PronunciationDict, context: StepContext, descending: bool = False, ignore_weight: bool = False) -> StepResult:
+  changed_counter = sort_pronunciations(
+    dictionary, descending, ignore_weight, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+  return dictionary, changed_counter > 0
+
+
+def step_normalize_weights(dictionary: PronunciationDict, context: StepContext) -> StepResult:
+  changed_counter = normalize_weights(
+    dictionary, context.mp_options, silent=False, session=context.session)
+  context.logger.info(f"Changed weights of {changed_counter} word(s).")
+  return dictionary, changed_counter > 0
+
+
+def step_sort_words(dictionary: PronunciationDict, context: StepContext, descending: bool = False, consider_case: bool = False, locale: Optional[str] = None) -> StepResult:
+  changed_anything = sort_words_in_place(dictionary, descending, consider_case, locale)
+  return dictionary, changed_anything
+
+
+STEPS: Dict[str, Callable[..., StepResult]] = {
+  "remove-symbols-from-words": step_remove_symbols_from_words,
+  "change-word-casing": step_change_word_casing,
+  "map-symbols-in-pronunciations": step_map_symbols_in_pronunciations,
+  "map-symbols-in-pronunciations-json": step_map_symbols_in_pronunciations_json,
+  "remove-symbols-from-pronunciations": step_remove_symbols_from_pronunciations,
+  "replace-in-pronunciations": step_replace_in_pronunciations,
+  "select-single-pronunciation": step_select_single_pronunciation,
+  "sort-pronunciations": step_sort_pronunciations,
+  "normalize-weights": step_normalize_weights,
+  "sort-words": step_sort_words,
+}
+
+
+def get_pipeline_parser(parser: ArgumentParser):
+  parser.description = "Apply multiple steps to the dictionary while loading and saving it only once. The steps are read from a JSON or TOML (*.toml) file containing a list \"steps\"; each step consists of a \"command\" and its parameters, e.g., { \"command\": \"select-single-pronunciation\", \"mode\": \"first\" }. Available commands: " + ", ".join(STEPS.keys()) + "."
+  parser.add_argument("dictionary", metavar='DICTIONARY',
+                      type=parse_existing_file, help="dictionary file")
+  parser.add_argument("steps", metavar='STEPS',
+                      type=parse_existing_file, help="file containing the steps")
+  add_encoding_argument(parser, "-se", "--steps-encoding", "encoding of steps file")
+  add_io_group(parser)
+  add_mp_group(parser)
+  return run_pipeline_ns
+
+
+def load_steps(path: Path, encoding: str) -> Any:
+  content = path.read_text(encoding)
+  if path.suffix.lower() == ".toml":
+    if tomllib is None:
+      raise ValueError("Reading TOML requires Python 3.11 or the package 'tomli'!")
+    return tomllib.loads(content)
+  return json.loads(content)
+
+
+def get_invalid_steps_msg(steps: Any) -> Optional[str]:
+  if not isinstance(steps, dict) or not isinstance(steps.get("steps"), list):
+    return "A list \"steps\" is required!"
+  for step_nr, step in enumerate(steps["steps"], start=1):
+    if not isinstance(step, dict):
+      return f"Step {step_nr}: Step needs to be a table/object!"
+    parameters = dict(step)
+    command = parameters.pop("command", None)
+    if command not in STEPS:
+      return f"Step {step_nr}: Command \"{command}\" is not available!"
+    try:
+      signature(STEPS[command]).bind(None, None, **parameters)
+    except TypeError as error:
+      return f"Step {step_nr}: Invalid parameters for command \"{command}\" ({error})!"
+  return None
+
+
+def run_pipeline_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
+  lp_options = DeserializationOptions(
+      ns.consider_comments, ns.consider_numbers, ns.consider_pronunciation_comments, ns.consider_weights)
+  mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
+  s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
+
+  try:
+    steps = load_steps(ns.steps, ns.steps_encoding)
+  except Exception as ex:
+    logger.debug(ex)
+    logger.error(f"Steps \"{ns.steps.absolute()}\" couldn't be read.")
+    return False
+
+  if msg := get_invalid_steps_msg(steps):
+    logger.error(msg)
+    return False
+
+  start = perf_counter()
+  dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
+  if dictionary_instance is None:
+    return False
+  logger.info(f"Loaded dictionary containing {len(dictionary_instance)} entries in {perf_counter() - start:.2f}s.")
+
+  changed_anything = False
+  with ProcessingSession(mp_options, ns.backend) as session:
+    context = StepContext(mp_options, session, ns.steps.parent, logger, flogger)
+    for step_nr, step in enumerate(steps["steps"], start=1):
+      parameters = dict(step)
+      command = parameters.pop("command")
+      logger.info(f"Step {step_nr}/{len(steps['steps'])}: {command}")
+      start = perf_counter()
+      try:
+        dictionary_instance, changed_step = STEPS[command](dictionary_instance, context, **parameters)
+      except (ValueError, OSError) as ex:
+        logger.debug(ex)
+        logger.error(f"Step {step_nr} ({command}) failed: {ex}")
+        return False
+      except Exception as ex:
+        flogger.exception(ex)
+        logger.error(f"Step {step_nr} ({command}) failed unexpectedly: {type(ex).__name__}: {ex}")
+        return False
+      changed_anything |= changed_step
+      logger.info(f"Step {step_nr} ({command}) took {perf_counter() - start:.2f}s.")
+
+  if not changed_anything:
+    logger.info("Didn't change anything.")
+    return True
+
+  start = perf_counter()
+  success = try_save_dict(dictionary_instance, ns.dictionary, ns.encoding, s_options, logger)
+  if not success:
+    return False
+
+  logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\" in {perf_counter() - start:.2f}s.")
+  return True
@@ -4,12 +4,14 @@ from logging import Logger
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import map_symbols
+from pronunciation_dictionary_utils import ProcessingSession, get_map_symbols_operator, map_symbols
 from pronunciation_dictionary_utils_cli.argparse_helper import (ConvertToOrderedSetAction,
                                                                 add_io_group, add_mp_group,
+                                                                add_stream_group,
                                                                 parse_existing_file,
                                                                 parse_non_empty_or_whitespace)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (try_load_dict, try_process_dict_streamed,
+                                                   try_save_dict)
 
 DEFAULT_EMPTY_WEIGHT = 1.0
 
@@ -26,6 +28,7 @@ def get_pronunciations_map_symbols_parser(parser: ArgumentParser):
                       help="map symbols inside a symbol; useful when mapping the same vowel having different tones or stress within one operation")
   add_io_group(parser)
   add_mp_group(parser)
+  add_stream_group(parser)
   return map_symbols_in_pronunciations_ns
 
 
@@ -36,13 +39,30 @@ def map_symbols_in_pronunciations_ns(ns: Namespace, logger: Logger, flogger: Log
 
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
+  to_symbol = ns.to_symbol if ns.partial_mapping else [ns.to_symbol]
+
+  if ns.stream:
+    operator = get_map_symbols_operator(ns.from_symbols, to_symbol, ns.partial_mapping)
+    with ProcessingSession(mp_options, ns.backend) as session:
+      result = try_process_dict_streamed(
+        ns.dictionary, ns.encoding, lp_options, s_options, ns.stream_batch_size, operator, session, logger, flogger)
+    if result is None:
+      return False
+    changed_counter, _ = result
+    if changed_counter == 0:
+      logger.info("Didn't change anything.")
+      return True
+    logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+    logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\"")
+    return True
+
   dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
   if dictionary_instance is None:
     return False
 
-  to_symbol = ns.to_symbol if ns.partial_mapping else [ns.to_symbol]
-  changed_words = map_symbols(
-    dictionary_instance, ns.from_symbols, to_symbol, ns.partial_mapping, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    changed_words = map_symbols(
+      dictionary_instance, ns.from_symbols, to_symbol, ns.partial_mapping, mp_options, silent=False, session=session)
 
   if len(changed_words) == 0:
     logger.info("Didn't change anything.")
@@ -22,6 +22,7 @@ from typing import Dict, Optional
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
+from pronunciation_dictionary_utils import ProcessingSession
 from pronunciation_dictionary_utils.pronunciations_map_symbols_dict import map_symbols_dict
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_encoding_argument, add_io_group,
                                                                 add_mp_group, parse_existing_file)
@@ -84,8 +85,9 @@ def map_symbols_in_pronunciations_ns(ns: Namespace, logger: Logger, flogger: Log
     return False
   logger.info(f"Loaded mapping containing {len(mappings)} entries.")
 
-  changed_words_total = map_symbols_dict(
-    dictionary_instance, mappings, ns.partial_mapping, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    changed_words_total = map_symbols_dict(
+      dictionary_instance, mappings, ns.partial_mapping, mp_options, silent=False, session=session)
 
   if len(changed_words_total) == 0:
     logger.info("Didn't change anything.")
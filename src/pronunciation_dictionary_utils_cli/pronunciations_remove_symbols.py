@@ -6,13 +6,16 @@ from tempfile import gettempdir
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import remove_symbols_from_pronunciations
+from pronunciation_dictionary_utils import (ProcessingSession, get_remove_symbols_operator,
+                                            remove_symbols_from_pronunciations)
 from pronunciation_dictionary_utils_cli.argparse_helper import (ConvertToOrderedSetAction,
                                                                 add_io_group, add_mp_group,
-                                                                get_optional, parse_existing_file,
+                                                                add_stream_group, get_optional,
+                                                                parse_existing_file,
                                                                 parse_non_empty_or_whitespace,
                                                                 parse_path)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (try_load_dict, try_process_dict_streamed,
+                                                   try_save_dict)
 
 DEFAULT_EMPTY_WEIGHT = 1
 
@@ -34,6 +37,7 @@ def get_pronunciations_remove_symbols_parser(parser: ArgumentParser):
                       help="write removed words (i.e., words that had no pronunciation anymore) to this file", default=default_removed_out)
   add_io_group(parser)
   add_mp_group(parser)
+  add_stream_group(parser)
   return remove_symbols_from_pronunciations_ns
 
 
@@ -48,12 +52,22 @@ def remove_symbols_from_pronunciations_ns(ns: Namespace, logger: Logger, flogger
 
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
-  dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
-  if dictionary_instance is None:
-    return False
+  if ns.stream:
+    operator = get_remove_symbols_operator(ns.symbols, ns.mode, ns.keep_empty, ns.empty_symbol)
+    with ProcessingSession(mp_options, ns.backend) as session:
+      result = try_process_dict_streamed(
+        ns.dictionary, ns.encoding, lp_options, s_options, ns.stream_batch_size, operator, session, logger, flogger)
+    if result is None:
+      return False
+    changed_counter, removed_words = result
+  else:
+    dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
+    if dictionary_instance is None:
+      return False
 
-  removed_words, changed_counter = remove_symbols_from_pronunciations(
-    dictionary_instance, ns.symbols, ns.mode, ns.keep_empty, ns.empty_symbol, mp_options, silent=False)
+    with ProcessingSession(mp_options, ns.backend) as session:
+      removed_words, changed_counter = remove_symbols_from_pronunciations(
+        dictionary_instance, ns.symbols, ns.mode, ns.keep_empty, ns.empty_symbol, mp_options, silent=False, session=session)
 
   if changed_counter == 0:
     logger.info("Didn't change anything.")
@@ -61,9 +75,10 @@ def remove_symbols_from_pronunciations_ns(ns: Namespace, logger: Logger, flogger
 
   logger.info(f"Changed pronunciations of {changed_counter} word(s).")
 
-  success = try_save_dict(dictionary_instance, ns.dictionary, ns.encoding, s_options, logger)
-  if not success:
-    return False
+  if not ns.stream:
+    success = try_save_dict(dictionary_instance, ns.dictionary, ns.encoding, s_options, logger)
+    if not success:
+      return False
 
   logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\"")
 
@@ -0,0 +1,96 @@
+from argparse import ArgumentParser, Namespace
+from logging import Logger
+from pathlib import Path
+from tempfile import gettempdir
+
+from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
+                                      SerializationOptions)
+
+from pronunciation_dictionary_utils import (ProcessingSession, get_replace_symbols_operator,
+                                            replace_symbols_in_pronunciations)
+from pronunciation_dictionary_utils_cli.argparse_helper import (add_io_group, add_mp_group,
+                                                                add_stream_group, get_optional,
+                                                                parse_existing_file,
+                                                                parse_non_empty_or_whitespace,
+                                                                parse_path, parse_regex)
+from pronunciation_dictionary_utils_cli.io import (try_load_dict, try_process_dict_streamed,
+                                                   try_save_dict)
+
+
+def get_pronunciations_replace_symbols_parser(parser: ArgumentParser):
+  default_removed_out = Path(gettempdir()) / "removed-words.txt"
+  parser.description = "Replace all matches of a regular expression in the pronunciations. The symbols of each pronunciation are joined with a space beforehand and split at spaces afterwards."
+  parser.add_argument("dictionary", metavar='DICTIONARY',
+                      type=parse_existing_file, help="dictionary file")
+  parser.add_argument("pattern", type=parse_regex, metavar='PATTERN',
+                      help="regular expression which is searched in the pronunciations, e.g., \"^AH0\"")
+  parser.add_argument("replacement", type=str, metavar='REPLACEMENT',
+                      help="replace the matches with this text; backreferences like \"\\1\" are supported")
+  parser.add_argument("-k", "--keep-empty", action="store_true",
+                      help="if a pronunciation will be empty after replacement, keep the corresponding word in the dictionary and assign the value of empty-symbol")
+  parser.add_argument("-es", "--empty-symbol", metavar="SYMBOL", type=get_optional(parse_non_empty_or_whitespace),
+                      help="if keep-empty: assign this symbol to the word where no pronunciations result because of the replacement", default="sil")
+  parser.add_argument("-ro", "--removed-out", metavar="PATH", type=get_optional(parse_path),
+                      help="write removed words (i.e., words that had no pronunciation anymore) to this file", default=default_removed_out)
+  add_io_group(parser)
+  add_mp_group(parser)
+  add_stream_group(parser)
+  return replace_symbols_in_pronunciations_ns
+
+
+def replace_symbols_in_pronunciations_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
+  if ns.keep_empty and ns.empty_symbol is None:
+    logger.error("An empty symbol needs to be supplied if keep-empty is true!")
+    return False
+
+  lp_options = DeserializationOptions(
+      ns.consider_comments, ns.consider_numbers, ns.consider_pronunciation_comments, ns.consider_weights)
+  mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
+
+  s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
+
+  if ns.stream:
+    operator = get_replace_symbols_operator(ns.pattern, ns.replacement, ns.keep_empty, ns.empty_symbol)
+    with ProcessingSession(mp_options, ns.backend) as session:
+      result = try_process_dict_streamed(
+        ns.dictionary, ns.encoding, lp_options, s_options, ns.stream_batch_size, operator, session, logger, flogger)
+    if result is None:
+      return False
+    changed_counter, removed_words = result
+  else:
+    dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
+    if dictionary_instance is None:
+      return False
+
+    with ProcessingSession(mp_options, ns.backend) as session:
+      removed_words, changed_counter = replace_symbols_in_pronunciations(
+        dictionary_instance, ns.pattern, ns.replacement, ns.keep_empty, ns.empty_symbol, mp_options, silent=False, session=session)
+
+  if changed_counter == 0:
+    logger.info("Didn't change anything.")
+    return True
+
+  logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+
+  if not ns.stream:
+    success = try_save_dict(dictionary_instance, ns.dictionary, ns.encoding, s_options, logger)
+    if not success:
+      return False
+
+  logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\"")
+
+  if len(removed_words) > 0:
+    logger.warning(f"{len(removed_words)} words were removed.")
+    if ns.removed_out is not None:
+      content = "\n".join(removed_words)
+      ns.removed_out.parent.mkdir(parents=True, exist_ok=True)
+      try:
+        ns.removed_out.write_text(content, "UTF-8")
+      except Exception as ex:
+        logger.debug(ex)
+        logger.error("Removed words output couldn't be created!")
+        return False
+      logger.info(f"Written removed words to: \"{ns.removed_out.absolute()}\".")
+  else:
+    logger.info("No words were removed.")
+  return True
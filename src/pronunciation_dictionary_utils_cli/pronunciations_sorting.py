@@ -4,10 +4,13 @@ from logging import Logger
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import sort_pronunciations
+from pronunciation_dictionary_utils import (ProcessingSession, get_sort_pronunciations_operator,
+                                            sort_pronunciations)
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_io_group, add_mp_group,
+                                                                add_stream_group,
                                                                 parse_existing_file)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (try_load_dict, try_process_dict_streamed,
+                                                   try_save_dict)
 
 
 def get_pronunciations_sorting_parser(parser: ArgumentParser):
@@ -20,6 +23,7 @@ def get_pronunciations_sorting_parser(parser: ArgumentParser):
                       help="ignore weights in sorting")
   add_io_group(parser)
   add_mp_group(parser)
+  add_stream_group(parser)
   return sort_pronunciations_ns
 
 
@@ -30,12 +34,27 @@ def sort_pronunciations_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bo
   mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
+  if ns.stream:
+    operator = get_sort_pronunciations_operator(ns.descending, ns.ignore_weight)
+    with ProcessingSession(mp_options, ns.backend) as session:
+      result = try_process_dict_streamed(
+        ns.dictionary, ns.encoding, lp_options, s_options, ns.stream_batch_size, operator, session, logger, flogger)
+    if result is None:
+      return False
+    changed_counter, _ = result
+    if changed_counter == 0:
+      logger.info("Didn't change anything.")
+      return True
+    logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
+    return True
+
   dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
   if dictionary_instance is None:
     return False
 
-  changed_counter = sort_pronunciations(
-    dictionary_instance, ns.descending, ns.ignore_weight, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    changed_counter = sort_pronunciations(
+      dictionary_instance, ns.descending, ns.ignore_weight, mp_options, silent=False, session=session)
 
   changed_anything = changed_counter > 0
 
@@ -4,11 +4,15 @@ from logging import Logger
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import select_single_pronunciation
+from pronunciation_dictionary_utils import (ProcessingSession,
+                                            get_select_single_pronunciation_operator,
+                                            select_single_pronunciation)
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_io_group, add_mp_group,
-                                                                get_optional, parse_existing_file,
+                                                                add_stream_group, get_optional,
+                                                                parse_existing_file,
                                                                 parse_non_negative_integer)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (try_load_dict, try_process_dict_streamed,
+                                                   try_save_dict)
 
 
 def get_single_pronunciation_selection_parser(parser: ArgumentParser):
@@ -21,6 +25,7 @@ def get_single_pronunciation_selection_parser(parser: ArgumentParser):
                       metavar="SEED", help="custom seed if mode is random or weight", default=None)
   add_io_group(parser)
   add_mp_group(parser)
+  add_stream_group(parser)
   return remove_multiple_pronunciations_ns
 
 
@@ -31,12 +36,28 @@ def remove_multiple_pronunciations_ns(ns: Namespace, logger: Logger, flogger: Lo
 
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
+  if ns.stream:
+    operator = get_select_single_pronunciation_operator(ns.mode, ns.seed)
+    with ProcessingSession(mp_options, ns.backend) as session:
+      result = try_process_dict_streamed(
+        ns.dictionary, ns.encoding, lp_options, s_options, ns.stream_batch_size, operator, session, logger, flogger)
+    if result is None:
+      return False
+    changed_counter, _ = result
+    if changed_counter == 0:
+      logger.info("Didn't change anything.")
+      return True
+    logger.info(f"Changed pronunciations of {changed_counter} word(s).")
+    logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
+    return True
+
   dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
   if dictionary_instance is None:
     return False
 
-  changed_counter = select_single_pronunciation(
-    dictionary_instance, ns.mode, ns.seed, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    changed_counter = select_single_pronunciation(
+      dictionary_instance, ns.mode, ns.seed, mp_options, silent=False, session=session)
 
   if changed_counter == 0:
     logger.info("Didn't change anything.")
@@ -8,18 +8,21 @@ from ordered_set import OrderedSet
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import select_subset_dictionary
+from pronunciation_dictionary_utils import (BinaryDictionary, is_binary_dict,
+                                            select_subset_binary_dictionary,
+                                            select_subset_dictionary, select_subset_entries)
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_encoding_argument, add_io_group,
                                                                 add_mp_group, get_optional,
                                                                 parse_existing_file, parse_path)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (iterate_dict_entries, try_load_dict,
+                                                   try_save_dict)
 
 
 def get_subset_extraction_parser(parser: ArgumentParser):
   parser.description = "Extract subset of dictionary."
   default_oov_out = Path(gettempdir()) / "oov.txt"
   parser.add_argument("dictionary", metavar='DICTIONARY',
-                      type=parse_existing_file, help="dictionary file")
+                      type=parse_existing_file, help="dictionary file (text or binary format)")
   parser.add_argument("vocabulary", metavar='VOCABULARY',
                       type=parse_existing_file, help="vocabulary that should be extracted")
   parser.add_argument("output_dictionary", metavar='OUTPUT-DICTIONARY',
@@ -29,6 +32,8 @@ def get_subset_extraction_parser(parser: ArgumentParser):
                       help="write out-of-vocabulary (OOV) words (i.e., words that did not exist in the dictionary) to this file (encoding will be the same as the one from the vocabulary file)", default=default_oov_out)
   parser.add_argument("--consider-case", action="store_true",
                       help="only extract entries matching the exact casing of the vocabulary")
+  parser.add_argument("-s", "--stream", action="store_true",
+                      help="read the dictionary line by line and keep only the entries of the vocabulary, i.e., the dictionary is never loaded completely")
   add_io_group(parser)
   add_mp_group(parser)
   return extract_subset_ns
@@ -48,15 +53,30 @@ def extract_subset_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
 
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
-  dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
-  if dictionary_instance is None:
-    return False
-  logger.info(f"Parsed dictionary containing {len(dictionary_instance)} words.")
-
   vocabulary = OrderedSet(vocabulary_content.splitlines())
   logger.info(f"Parsed vocabulary containing {len(vocabulary)} words.")
 
-  oov_voc = select_subset_dictionary(dictionary_instance, vocabulary, ns.consider_case)
+  if is_binary_dict(ns.dictionary):
+    # only the selected entries are decoded
+    with BinaryDictionary(ns.dictionary) as binary_dictionary:
+      logger.info(f"Opened binary dictionary containing {len(binary_dictionary)} words.")
+      dictionary_instance, oov_voc = select_subset_binary_dictionary(
+        binary_dictionary, vocabulary, ns.consider_case)
+  elif ns.stream:
+    entries = iterate_dict_entries(ns.dictionary, ns.encoding, lp_options, mp_options, flogger)
+    try:
+      dictionary_instance, oov_voc = select_subset_entries(entries, vocabulary, ns.consider_case)
+    except Exception as ex:
+      logger.debug(ex)
+      logger.error(f"Dictionary \"{ns.dictionary.absolute()}\" couldn't be read.")
+      return False
+  else:
+    dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
+    if dictionary_instance is None:
+      return False
+    logger.info(f"Parsed dictionary containing {len(dictionary_instance)} words.")
+
+    oov_voc = select_subset_dictionary(dictionary_instance, vocabulary, ns.consider_case)
 
   if len(dictionary_instance) == 0:
     logger.info("The target dictionary is empty! Skipped saving.")
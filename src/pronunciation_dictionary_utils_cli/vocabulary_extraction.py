@@ -6,6 +6,7 @@ from typing import cast
 from ordered_set import OrderedSet
 from pronunciation_dictionary import DeserializationOptions, MultiprocessingOptions
 
+from pronunciation_dictionary_utils import BinaryDictionary, is_binary_dict
 from pronunciation_dictionary_utils_cli.argparse_helper import (ConvertToOrderedSetAction,
                                                                 add_deserialization_group,
                                                                 add_encoding_argument, add_mp_group,
@@ -16,7 +17,7 @@ from pronunciation_dictionary_utils_cli.io import try_load_dict
 def get_vocabulary_extraction_parser(parser: ArgumentParser):
   parser.description = "Export vocabulary (i.e., words that are contained in the dictionaries)."
   parser.add_argument("dictionaries", metavar='DICTIONARY', type=parse_existing_file, nargs="+",
-                      help="dictionary files", action=ConvertToOrderedSetAction)
+                      help="dictionary files (text or binary format)", action=ConvertToOrderedSetAction)
   parser.add_argument("output", metavar="OUTPUT-VOCABULARY", type=parse_path,
                       help="output vocabulary to this file")
   add_encoding_argument(parser, "-e", "--output-encoding", "encoding of the vocabulary file")
@@ -36,6 +37,12 @@ def get_vocabulary_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
 
   total_vocabulary = OrderedSet()
   for dictionary_path in ns.dictionaries:
+    if is_binary_dict(dictionary_path):
+      # only the words are decoded
+      with BinaryDictionary(dictionary_path) as binary_dictionary:
+        total_vocabulary.update(binary_dictionary)
+      continue
+
     dictionary_instance = try_load_dict(
       dictionary_path, ns.deserialization_encoding, lp_options, mp_options, logger)
     if dictionary_instance is None:
@@ -7,6 +7,7 @@ from typing import cast
 from ordered_set import OrderedSet
 from pronunciation_dictionary import MultiprocessingOptions
 
+from pronunciation_dictionary_utils import ProcessingSession
 from pronunciation_dictionary_utils.vocabulary_remove_symbols import remove_symbols_from_vocabulary
 from pronunciation_dictionary_utils_cli.argparse_helper import (ConvertToOrderedSetAction,
                                                                 add_encoding_argument, add_mp_group,
@@ -47,8 +48,9 @@ def remove_symbols_from_words_ns(ns: Namespace, logger: Logger, flogger: Logger)
 
   mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
 
-  removed_words_entirely, changed_words = remove_symbols_from_vocabulary(
-    vocabulary, symbols_str, ns.mode, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    removed_words_entirely, changed_words = remove_symbols_from_vocabulary(
+      vocabulary, symbols_str, ns.mode, mp_options, silent=False, session=session)
 
   if len(changed_words) == 0:
     logger.info("Didn't change anything.")
@@ -4,10 +4,13 @@ from logging import Logger
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import normalize_weights
+from pronunciation_dictionary_utils import (ProcessingSession, get_normalize_weights_operator,
+                                            normalize_weights)
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_io_group, add_mp_group,
+                                                                add_stream_group,
                                                                 parse_existing_file)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+from pronunciation_dictionary_utils_cli.io import (try_load_dict, try_process_dict_streamed,
+                                                   try_save_dict)
 
 
 def get_weights_normalization_parser(parser: ArgumentParser):
@@ -16,6 +19,7 @@ def get_weights_normalization_parser(parser: ArgumentParser):
                       type=parse_existing_file, help="dictionary file")
   add_io_group(parser)
   add_mp_group(parser)
+  add_stream_group(parser)
   return normalize_weights_ns
 
 
@@ -26,11 +30,26 @@ def normalize_weights_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool
   mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
+  if ns.stream:
+    operator = get_normalize_weights_operator()
+    with ProcessingSession(mp_options, ns.backend) as session:
+      result = try_process_dict_streamed(
+        ns.dictionary, ns.encoding, lp_options, s_options, ns.stream_batch_size, operator, session, logger, flogger)
+    if result is None:
+      return False
+    changed_counter, _ = result
+    if changed_counter == 0:
+      logger.info("Didn't change anything.")
+      return True
+    logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
+    return True
+
   dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
   if dictionary_instance is None:
     return False
 
-  changed_counter = normalize_weights(dictionary_instance, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    changed_counter = normalize_weights(dictionary_instance, mp_options, silent=False, session=session)
 
   changed_anything = changed_counter > 0
 
@@ -4,7 +4,7 @@ from logging import Logger
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import change_word_casing
+from pronunciation_dictionary_utils import ProcessingSession, change_word_casing
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_io_group, add_mp_group,
                                                                 parse_existing_file)
 from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
@@ -14,8 +14,10 @@ def get_words_casing_adjustment_parser(parser: ArgumentParser):
   parser.description = "Adjust casing of words in dictionary."
   parser.add_argument("dictionary", metavar='DICTIONARY',
                       type=parse_existing_file, help="dictionary file")
-  parser.add_argument("mode", metavar="MODE", type=str, choices=["lower", "upper"],
+  parser.add_argument("mode", metavar="MODE", type=str, choices=["lower", "upper", "casefold"],
                       help="mode to change the casing")
+  parser.add_argument("-u", "--unicode-form", metavar="FORM", type=str, choices=["NFC", "NFD", "NFKC", "NFKD"],
+                      help="normalize the words to this Unicode normalization form before changing the casing", default=None)
   add_io_group(parser)
   add_mp_group(parser)
   return change_casing_ns
@@ -32,7 +34,9 @@ def change_casing_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
   if dictionary_instance is None:
     return False
 
-  removed_words, created_words = change_word_casing(dictionary_instance, ns.mode, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    removed_words, created_words = change_word_casing(
+      dictionary_instance, ns.mode, mp_options, silent=False, session=session, unicode_form=ns.unicode_form)
 
   if len(removed_words) == 0:
     logger.info("Didn't change anything.")
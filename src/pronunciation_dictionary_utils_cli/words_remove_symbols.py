@@ -6,7 +6,7 @@ from tempfile import gettempdir
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
                                       SerializationOptions)
 
-from pronunciation_dictionary_utils import remove_symbols_from_words
+from pronunciation_dictionary_utils import ProcessingSession, remove_symbols_from_words
 from pronunciation_dictionary_utils_cli.argparse_helper import (ConvertToOrderedSetAction,
                                                                 add_io_group, add_mp_group,
                                                                 get_optional, parse_existing_file,
@@ -46,8 +46,9 @@ def remove_symbols_from_words_ns(ns: Namespace, logger: Logger, flogger: Logger)
   if dictionary_instance is None:
     return False
 
-  removed_words_entirely, removed_words = remove_symbols_from_words(
-    dictionary_instance, symbols_str, ns.mode, mp_options, silent=False)
+  with ProcessingSession(mp_options, ns.backend) as session:
+    removed_words_entirely, removed_words = remove_symbols_from_words(
+      dictionary_instance, symbols_str, ns.mode, mp_options, silent=False, session=session)
 
   if len(removed_words) == 0:
     logger.info("Didn't change anything.")
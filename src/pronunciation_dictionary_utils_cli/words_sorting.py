@@ -1,13 +1,20 @@
 from argparse import ArgumentParser, Namespace
+from collections import OrderedDict
 from logging import Logger
+from typing import Iterable, Iterator, Tuple
 
 from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
-                                      SerializationOptions)
+                                      Pronunciations, SerializationOptions, Word)
 
-from pronunciation_dictionary_utils import sort_words
+from pronunciation_dictionary_utils import sort_words_external, sort_words_in_place
+from pronunciation_dictionary_utils.words_sorting import get_word_sort_key
 from pronunciation_dictionary_utils_cli.argparse_helper import (add_io_group, add_mp_group,
-                                                                parse_existing_file)
-from pronunciation_dictionary_utils_cli.io import try_load_dict, try_save_dict
+                                                                get_optional, parse_existing_file,
+                                                                parse_non_empty,
+                                                                parse_positive_integer)
+from pronunciation_dictionary_utils_cli.globals import DEFAULT_RUN_SIZE
+from pronunciation_dictionary_utils_cli.io import (iterate_dict_entries, try_load_dict,
+                                                   try_replace_dict_streamed, try_save_dict)
 
 
 def get_words_sorting_parser(parser: ArgumentParser):
@@ -16,6 +23,13 @@ def get_words_sorting_parser(parser: ArgumentParser):
                       type=parse_existing_file, help="dictionary file")
   parser.add_argument("-d", "--descending", action="store_true", help="sort descending")
   parser.add_argument("-co", "--consider-case", action="store_true", help="consider casing")
+  parser.add_argument("-l", "--locale", type=get_optional(parse_non_empty), metavar="LOCALE",
+                      help="sort words by the collation of this locale, e.g., \"de_DE.UTF-8\" (not in combination with --external)", default=None)
+  external_group = parser.add_argument_group("external sorting arguments")
+  external_group.add_argument("-x", "--external", action="store_true",
+                              help="sort the dictionary while reading it in sorted runs of RUN-SIZE words which are written to temporary files and merged afterwards, i.e., dictionaries larger than the available memory can be sorted")
+  external_group.add_argument("-rs", "--run-size", type=parse_positive_integer, metavar="RUN-SIZE",
+                              help="amount of words which are sorted in memory", default=DEFAULT_RUN_SIZE)
   add_io_group(parser)
   add_mp_group(parser)
   return sort_words_ns
@@ -28,22 +42,72 @@ def sort_words_ns(ns: Namespace, logger: Logger, flogger: Logger) -> bool:
   mp_options = MultiprocessingOptions(ns.n_jobs, ns.maxtasksperchild, ns.chunksize)
   s_options = SerializationOptions(ns.parts_sep, ns.consider_numbers, ns.consider_weights)
 
+  if ns.external:
+    if ns.locale is not None:
+      logger.error("Sorting by locale is not supported in combination with --external!")
+      return False
+    return sort_words_external_ns(ns, lp_options, s_options, mp_options, logger, flogger)
+
   dictionary_instance = try_load_dict(ns.dictionary, ns.encoding, lp_options, mp_options, logger)
   if dictionary_instance is None:
     return False
 
-  new_dictionary = sort_words(dictionary_instance, ns.descending, ns.consider_case)
-
-  changed_anything = new_dictionary != dictionary_instance
+  try:
+    changed_anything = sort_words_in_place(
+      dictionary_instance, ns.descending, ns.consider_case, ns.locale)
+  except ValueError as error:
+    logger.error(error)
+    return False
 
   if not changed_anything:
     logger.info("Didn't change anything.")
     return True
 
-  success = try_save_dict(new_dictionary, ns.dictionary, ns.encoding, s_options, logger)
+  success = try_save_dict(dictionary_instance, ns.dictionary, ns.encoding, s_options, logger)
   if not success:
     return False
 
   logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
 
   return True
+
+
+class SortedInputCheck():
+  """
+  Passes the entries through and remembers whether they were already sorted.
+  """
+
+  def __init__(self, descending: bool, consider_case: bool) -> None:
+    self.__descending = descending
+    self.__sort_key = get_word_sort_key(consider_case)
+    self.is_sorted = True
+
+  def check(self, entries: Iterable[Tuple[Word, Pronunciations]]) -> Iterator[Tuple[Word, Pronunciations]]:
+    previous_key = None
+    for word, pronunciations in entries:
+      key = self.__sort_key(word)
+      if previous_key is not None:
+        self.is_sorted &= key < previous_key if self.__descending else previous_key < key
+      previous_key = key
+      yield word, pronunciations
+
+
+def sort_words_external_ns(ns: Namespace, lp_options: DeserializationOptions, s_options: SerializationOptions, mp_options: MultiprocessingOptions, logger: Logger, flogger: Logger) -> bool:
+  input_check = SortedInputCheck(ns.descending, ns.consider_case)
+  entries = input_check.check(iterate_dict_entries(ns.dictionary, ns.encoding, lp_options, mp_options, flogger))
+  sorted_entries = sort_words_external(entries, ns.descending, ns.consider_case, ns.run_size)
+  # all entries are read before the first sorted entry is returned
+  batches = (
+    (OrderedDict(((word, pronunciations),)), int(not input_check.is_sorted))
+    for word, pronunciations in sorted_entries
+  )
+  changed_counter = try_replace_dict_streamed(ns.dictionary, ns.encoding, s_options, batches, logger)
+  if changed_counter is None:
+    return False
+
+  if changed_counter == 0:
+    logger.info("Didn't change anything.")
+    return True
+
+  logger.info(f"Written dictionary to: \"{ns.dictionary.absolute()}\".")
+  return True
@@ -0,0 +1,23 @@
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary_utils.binary_dictionary import BinaryDictionary, save_binary_dict
+
+
+def test_reads_little_endian_file_on_big_endian_system(tmp_path: Path, monkeypatch):
+  dictionary = OrderedDict()
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  dictionary["A"] = OrderedDict((
+    (("a",), 0.5),
+  ))
+  path = tmp_path / "dict.bin"
+  save_binary_dict(dictionary, path)
+  monkeypatch.setattr(sys, "byteorder", "big")
+
+  with BinaryDictionary(path) as binary_dictionary:
+    assert binary_dictionary.to_dict() == dictionary
+    assert binary_dictionary["A"] == dictionary["A"]
+    assert [word for word, _ in binary_dictionary.iterate_range()] == ["A", "c"]
@@ -0,0 +1,38 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary_utils.binary_dictionary import BinaryDictionary, save_binary_dict
+
+
+def test_returns_indices_of_all_spellings_in_dictionary_order(tmp_path: Path):
+  dictionary = OrderedDict()
+  for word in ("Ab", "b", "ab", "abc", "AB", "aB", "ac"):
+    dictionary[word] = OrderedDict((
+      (("a",), 1.0),
+    ))
+  path = tmp_path / "dict.bin"
+  save_binary_dict(dictionary, path)
+
+  with BinaryDictionary(path) as binary_dictionary:
+    assert binary_dictionary.get_indices_ignore_case("ab") == [0, 2, 4, 5]
+    assert binary_dictionary.get_indices_ignore_case("aB") == [0, 2, 4, 5]
+    assert binary_dictionary.get_indices_ignore_case("abcd") == []
+    assert binary_dictionary.get_indices_ignore_case("x") == []
+
+
+def test_is_equal_to_comparing_lower_case_forms(tmp_path: Path):
+  # contains the Kelvin sign and the capital sharp s
+  words = ["\u212aa", "Ka", "ka", "STRAẞE", "straße", "STRASSE", "İs", "i̇s", "Is",
+           "ΟΔΟΣ", "οδος", "οδοσ", "Ås", "ås", "ÅS"]
+  dictionary = OrderedDict()
+  for word in words:
+    dictionary[word] = OrderedDict((
+      (("a",), 1.0),
+    ))
+  path = tmp_path / "dict.bin"
+  save_binary_dict(dictionary, path)
+
+  with BinaryDictionary(path) as binary_dictionary:
+    for word in words:
+      expected = [index for index, other in enumerate(words) if other.lower() == word.lower()]
+      assert binary_dictionary.get_indices_ignore_case(word) == expected
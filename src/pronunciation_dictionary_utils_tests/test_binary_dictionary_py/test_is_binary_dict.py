@@ -0,0 +1,10 @@
+from pathlib import Path
+
+from pronunciation_dictionary_utils.binary_dictionary import is_binary_dict
+
+
+def test_text_file__returns_false(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a", "UTF-8")
+
+  assert not is_binary_dict(path)
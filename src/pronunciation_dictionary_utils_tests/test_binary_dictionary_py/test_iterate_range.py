@@ -0,0 +1,32 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary_utils.binary_dictionary import BinaryDictionary, save_binary_dict
+
+
+def test_returns_sorted_entries_in_range(tmp_path: Path):
+  dictionary = OrderedDict()
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  dictionary["A"] = OrderedDict((
+    (("a",), 0.5),
+    (("a", "ʃ"), 3.0),
+  ))
+  dictionary["äb"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["a"] = OrderedDict((
+    (("x",), 2.0),
+  ))
+  path = tmp_path / "dict.bin"
+  save_binary_dict(dictionary, path)
+
+  with BinaryDictionary(path) as binary_dictionary:
+    assert [word for word, _ in binary_dictionary.iterate_range()] == ["A", "a", "c", "äb"]
+    assert list(binary_dictionary.iterate_range("a", "d")) == [
+      ("a", dictionary["a"]),
+      ("c", dictionary["c"]),
+    ]
+    assert [word for word, _ in binary_dictionary.iterate_range("b")] == ["c", "äb"]
+    assert [word for word, _ in binary_dictionary.iterate_range(stop="a")] == ["A"]
@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary_utils.binary_dictionary import (BinaryDictionary, is_binary_dict,
+                                                              save_binary_dict)
+
+
+def test_save_and_open__returns_same_dictionary(tmp_path: Path):
+  dictionary = OrderedDict()
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  dictionary["A"] = OrderedDict((
+    (("a",), 0.5),
+    (("a", "ʃ"), 3.0),
+  ))
+  dictionary["äb"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["a"] = OrderedDict((
+    (("x",), 2.0),
+  ))
+  path = tmp_path / "dict.bin"
+
+  save_binary_dict(dictionary, path)
+
+  assert is_binary_dict(path)
+  with BinaryDictionary(path) as binary_dictionary:
+    assert len(binary_dictionary) == 4
+    assert list(binary_dictionary) == ["c", "A", "äb", "a"]
+    assert binary_dictionary["A"] == dictionary["A"]
+    assert "äb" in binary_dictionary
+    assert "b" not in binary_dictionary
+    assert binary_dictionary.get_index("a") == 3
+    assert binary_dictionary.get_index("b") is None
+    assert binary_dictionary.to_dict() == dictionary
+
+
+def test_empty_dictionary(tmp_path: Path):
+  path = tmp_path / "dict.bin"
+
+  save_binary_dict(OrderedDict(), path)
+
+  with BinaryDictionary(path) as binary_dictionary:
+    assert len(binary_dictionary) == 0
+    assert list(binary_dictionary.iterate_range()) == []
+    assert "a" not in binary_dictionary
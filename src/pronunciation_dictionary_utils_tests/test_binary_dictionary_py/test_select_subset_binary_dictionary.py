@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils import subset_extraction
+from pronunciation_dictionary_utils.binary_dictionary import BinaryDictionary, save_binary_dict
+from pronunciation_dictionary_utils.subset_extraction import (select_subset_binary_dictionary,
+                                                              select_subset_dictionary)
+
+
+def test_is_equal_to_select_subset_dictionary(tmp_path: Path):
+  dictionary = OrderedDict()
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  dictionary["A"] = OrderedDict((
+    (("a",), 0.5),
+    (("a", "ʃ"), 3.0),
+  ))
+  dictionary["äb"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["a"] = OrderedDict((
+    (("x",), 2.0),
+  ))
+  path = tmp_path / "dict.bin"
+  save_binary_dict(dictionary, path)
+  vocabulary = OrderedSet(("x", "a", "ÄB", "c", "y"))
+
+  with BinaryDictionary(path) as binary_dictionary:
+    for consider_case in (True, False):
+      expected_dictionary = deepcopy(dictionary)
+      expected_oov = select_subset_dictionary(expected_dictionary, vocabulary, consider_case)
+
+      result, oov = select_subset_binary_dictionary(binary_dictionary, vocabulary, consider_case)
+
+      assert list(result.items()) == list(expected_dictionary.items())
+      assert list(oov) == list(expected_oov)
+
+
+def test_lookup_and_scan_ignoring_casing_are_equal(tmp_path: Path, monkeypatch):
+  dictionary = OrderedDict()
+  for word in ("b", "Ab", "ab", "ΟΔΟΣ", "aB", "c", "Ka", "ka", "STRAẞE"):
+    dictionary[word] = OrderedDict((
+      (("a",), 1.0),
+    ))
+  path = tmp_path / "dict.bin"
+  save_binary_dict(dictionary, path)
+  vocabulary = OrderedSet(("AB", "x", "οδος", "KA", "c", "straße", "X"))
+
+  with BinaryDictionary(path) as binary_dictionary:
+    monkeypatch.setattr(subset_extraction, "IGNORE_CASE_LOOKUP_COST", 0)
+    lookup_result, lookup_oov = select_subset_binary_dictionary(binary_dictionary, vocabulary, False)
+    monkeypatch.setattr(subset_extraction, "IGNORE_CASE_LOOKUP_COST", len(dictionary))
+    scan_result, scan_oov = select_subset_binary_dictionary(binary_dictionary, vocabulary, False)
+
+  assert list(lookup_result.keys()) == ["Ab", "ab", "ΟΔΟΣ", "aB", "c", "Ka", "ka", "STRAẞE"]
+  assert list(lookup_oov) == ["x", "X"]
+  assert list(lookup_result.items()) == list(scan_result.items())
+  assert list(lookup_oov) == list(scan_oov)
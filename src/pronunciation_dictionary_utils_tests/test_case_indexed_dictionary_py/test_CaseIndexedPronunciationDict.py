@@ -0,0 +1,80 @@
+import pickle
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.case_indexed_dictionary import CaseIndexedPronunciationDict
+
+
+def test_init__indexes_spellings():
+  entries = OrderedDict()
+  entries["Abc"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  entries["x"] = OrderedDict((
+    (("x",), 1.0),
+  ))
+  entries["abc"] = OrderedDict((
+    (("b",), 2.0),
+  ))
+  entries["ABC"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+
+  dictionary = CaseIndexedPronunciationDict(entries)
+
+  assert dictionary == entries
+  assert dictionary.get_spellings("aBc") == OrderedSet(["Abc", "abc", "ABC"])
+  assert dictionary.get_spellings("y") == OrderedSet()
+  assert dictionary.get_cased_words() == ["Abc", "ABC"]
+  assert dictionary.contains_ignore_case("X")
+
+
+def test_changes__update_index():
+  dictionary = CaseIndexedPronunciationDict()
+  dictionary["Abc"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["x"] = OrderedDict((
+    (("x",), 1.0),
+  ))
+  dictionary["abc"] = OrderedDict((
+    (("b",), 2.0),
+  ))
+  dictionary["ABC"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+
+  del dictionary["Abc"]
+  dictionary.pop("x")
+  dictionary["Abc"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary.move_to_end("ABC", last=False)
+
+  assert dictionary.get_spellings("abc") == OrderedSet(["ABC", "abc", "Abc"])
+  assert dictionary.get_cased_words() == ["ABC", "Abc"]
+  assert not dictionary.contains_ignore_case("x")
+
+  dictionary.clear()
+
+  assert dictionary.get_spellings("abc") == OrderedSet()
+  assert dictionary.get_cased_words() == []
+
+
+def test_pickle__keeps_index():
+  dictionary = CaseIndexedPronunciationDict()
+  dictionary["Abc"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["abc"] = OrderedDict((
+    (("b",), 2.0),
+  ))
+  dictionary["ABC"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+
+  result = pickle.loads(pickle.dumps(dictionary))
+
+  assert result == dictionary
+  assert result.get_spellings("abc") == OrderedSet(["Abc", "abc", "ABC"])
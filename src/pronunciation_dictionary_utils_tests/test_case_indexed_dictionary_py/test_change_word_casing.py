@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from copy import deepcopy
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.case_indexed_dictionary import CaseIndexedPronunciationDict
+from pronunciation_dictionary_utils.words_casing_adjustment import change_word_casing
+
+
+def test_lower__returns_same_as_plain_dictionary():
+  expected = OrderedDict()
+  expected["Abc"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  expected["x"] = OrderedDict((
+    (("x",), 1.0),
+  ))
+  expected["abc"] = OrderedDict((
+    (("b",), 2.0),
+  ))
+  expected["ABC"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+  dictionary = CaseIndexedPronunciationDict(deepcopy(expected))
+  mp_options = MultiprocessingOptions(1, None, 100)
+
+  result = change_word_casing(dictionary, "lower", mp_options)
+  expected_result = change_word_casing(expected, "lower", mp_options)
+
+  assert result == expected_result
+  assert list(dictionary.items()) == list(expected.items())
+  assert dictionary.get_spellings("abc") == OrderedSet(["abc"])
+  assert dictionary.get_cased_words() == []
@@ -0,0 +1,32 @@
+from collections import OrderedDict
+from copy import deepcopy
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.case_indexed_dictionary import CaseIndexedPronunciationDict
+from pronunciation_dictionary_utils.subset_extraction import select_subset_dictionary
+
+
+def test_ignore_casing__returns_same_as_plain_dictionary():
+  expected = OrderedDict()
+  expected["Abc"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  expected["x"] = OrderedDict((
+    (("x",), 1.0),
+  ))
+  expected["abc"] = OrderedDict((
+    (("b",), 2.0),
+  ))
+  expected["ABC"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+  dictionary = CaseIndexedPronunciationDict(deepcopy(expected))
+
+  result = select_subset_dictionary(dictionary, OrderedSet(["aBC", "y"]), False)
+  expected_result = select_subset_dictionary(expected, OrderedSet(["aBC", "y"]), False)
+
+  assert result == expected_result == OrderedSet(["y"])
+  assert list(dictionary.items()) == list(expected.items())
+  assert dictionary.get_spellings("abc") == OrderedSet(["Abc", "abc", "ABC"])
+  assert not dictionary.contains_ignore_case("x")
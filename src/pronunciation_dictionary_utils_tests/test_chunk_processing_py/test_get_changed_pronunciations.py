@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pytest
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions, Pronunciations, Word
+
+from pronunciation_dictionary_utils.chunk_processing import get_changed_pronunciations
+from pronunciation_dictionary_utils.executors import get_process_lookup_dict
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+def double_weights_of_words_with_x(word: Word) -> Tuple[Word, Optional[Pronunciations]]:
+  if "x" not in word:
+    return word, None
+  pronunciations = get_process_lookup_dict()[word]
+  return word, OrderedDict((pronunciation, weight * 2) for pronunciation, weight in pronunciations.items())
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 7, 100])
+def test_equals_per_entry_transport(backend: str, chunksize: int):
+  dictionary = OrderedDict()
+  for word in ("ax", "b", "c", "dx", "ex", "f", "g", "h", "ix", "j"):
+    dictionary[word] = OrderedDict((
+      ((word,), 1.0),
+      (("y",), 0.5),
+    ))
+  words = OrderedSet(dictionary.keys())
+
+  with ProcessingSession(MultiprocessingOptions(2, None, chunksize), backend) as session:
+    executor = session.get_executor(dictionary)
+    result = get_changed_pronunciations(
+      executor, double_weights_of_words_with_x, words, chunksize, silent=True)
+    per_entry_result = [
+      (word, new_pronunciations)
+      for word, new_pronunciations in executor.imap(double_weights_of_words_with_x, words, 1)
+      if new_pronunciations is not None
+    ]
+
+  assert len(result) == 4
+  assert list(result) == per_entry_result
+  assert [word for word, _ in result] == ["ax", "dx", "ex", "ix"]
+  assert all(isinstance(pronunciations, OrderedDict) for _, pronunciations in result)
+  assert list(result)[1] == ("dx", OrderedDict(((("dx",), 2.0), (("y",), 1.0))))
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_nothing_changed__returns_no_entries(backend: str):
+  dictionary = OrderedDict()
+  for word in ("a", "b", "c"):
+    dictionary[word] = OrderedDict((
+      ((word,), 1.0),
+    ))
+  words = OrderedSet(dictionary.keys())
+
+  with ProcessingSession(MultiprocessingOptions(2, None, 2), backend) as session:
+    executor = session.get_executor(dictionary)
+    result = get_changed_pronunciations(
+      executor, double_weights_of_words_with_x, words, 2, silent=True)
+
+  assert len(result) == 0
+  assert list(result) == []
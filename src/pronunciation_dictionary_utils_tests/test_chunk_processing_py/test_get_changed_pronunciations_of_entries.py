@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Optional
+
+import pytest
+from pronunciation_dictionary import MultiprocessingOptions, Pronunciations
+
+from pronunciation_dictionary_utils.chunk_processing import get_changed_pronunciations_of_entries
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+def remove_x(pronunciations: Pronunciations) -> Optional[Pronunciations]:
+  new_pronunciations = OrderedDict(
+    (tuple(symbol for symbol in pronunciation if symbol != "x"), weight)
+    for pronunciation, weight in pronunciations.items()
+  )
+  if new_pronunciations == pronunciations:
+    return None
+  return new_pronunciations
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 100])
+def test_returns_changed_entries_in_order(backend: str, chunksize: int):
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "x"), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  dictionary["d"] = OrderedDict((
+    (("x", "d"), 1.0),
+    (("d", "d"), 2.0),
+  ))
+  dictionary["e"] = OrderedDict((
+    (("e",), 1.0),
+  ))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, chunksize), backend) as session:
+    executor = session.get_executor()
+    result = get_changed_pronunciations_of_entries(executor, remove_x, dictionary, chunksize, silent=True)
+
+  assert len(result) == 2
+  assert list(result) == [
+    ("a", OrderedDict(((("a",), 1.0),))),
+    ("d", OrderedDict(((("d",), 1.0), (("d", "d"), 2.0)))),
+  ]
@@ -0,0 +1,52 @@
+from typing import Optional, Tuple
+
+import pytest
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions, Word
+
+from pronunciation_dictionary_utils.chunk_processing import (get_changed_words,
+                                                             get_changed_words_of_chunks)
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+def get_upper_word(word: Word) -> Tuple[Word, Optional[Word]]:
+  new_word = word.upper()
+  if new_word == word:
+    return word, None
+  return word, new_word
+
+
+def get_upper_words(words: list) -> list:
+  return [word.upper() for word in words]
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 100])
+def test_equals_per_entry_transport(backend: str, chunksize: int):
+  words = OrderedSet(("a", "B", "C", "d", "E", "f", "G"))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, chunksize), backend) as session:
+    executor = session.get_executor()
+    result = get_changed_words(executor, get_upper_word, words, chunksize, silent=True)
+    per_entry_result = [
+      (word, new_word)
+      for word, new_word in executor.imap(get_upper_word, words, 1)
+      if new_word is not None
+    ]
+
+  assert len(result) == 3
+  assert list(result) == per_entry_result
+  assert list(result) == [("a", "A"), ("d", "D"), ("f", "F")]
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 100])
+def test_of_chunks__equals_per_entry_transport(backend: str, chunksize: int):
+  words = OrderedSet(("a", "B", "C", "d", "E", "f", "G"))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, chunksize), backend) as session:
+    executor = session.get_executor()
+    result = get_changed_words_of_chunks(executor, get_upper_words, words, chunksize, silent=True)
+
+  assert len(result) == 3
+  assert list(result) == [("a", "A"), ("d", "D"), ("f", "F")]
@@ -0,0 +1,34 @@
+from array import array
+from typing import Optional, Tuple
+
+from pronunciation_dictionary import Word
+
+from pronunciation_dictionary_utils.chunk_processing import (ChangedEntries, decode_word,
+                                                             encode_word, process_chunk)
+
+
+def get_upper_word(word: Word) -> Tuple[Word, Optional[Word]]:
+  new_word = word.upper()
+  if new_word == word:
+    return word, None
+  return word, new_word
+
+
+def test_nothing_changed__returns_none():
+  result = process_chunk((3, ["A", "B"]), get_upper_word, encode_word)
+
+  assert result is None
+
+
+def test_returns_only_changed_entries():
+  result = process_chunk((3, ["A", "b", "C", "d"]), get_upper_word, encode_word)
+
+  start, encoded_indices, _ = result
+  indices = array("I")
+  indices.frombytes(encoded_indices)
+  assert start == 3
+  assert list(indices) == [1, 3]
+  assert list(ChangedEntries(["x", "y", "z", "A", "b", "C", "d"], [result], decode_word)) == [
+    ("b", "B"),
+    ("d", "D"),
+  ]
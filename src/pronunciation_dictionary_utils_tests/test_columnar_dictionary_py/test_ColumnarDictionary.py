@@ -0,0 +1,37 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.columnar_dictionary import ColumnarDictionary
+
+
+def test_conversion():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+    (("x", "a"), 1.0),
+  ))
+
+  result = ColumnarDictionary.from_pronunciation_dict(dictionary).to_pronunciation_dict()
+
+  assert result == dictionary
+
+
+def test_get_symbol_id_adds_unknown_symbols_once():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  assert columnar_dictionary.get_symbol_id("b") == 1
+  assert columnar_dictionary.find_symbol_id("x") is None
+  assert columnar_dictionary.get_symbol_id("x") == 2
+  assert columnar_dictionary.get_symbol_id("x") == 2
+  assert columnar_dictionary.find_symbol_id("x") == 2
+  assert columnar_dictionary.symbols == ["a", "b", "x"]
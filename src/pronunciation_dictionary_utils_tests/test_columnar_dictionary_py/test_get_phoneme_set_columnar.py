@@ -0,0 +1,20 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.columnar_dictionary import (ColumnarDictionary,
+                                                                get_phoneme_set_columnar)
+
+
+def test_component():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+    (("x", "a"), 1.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  result = get_phoneme_set_columnar(columnar_dictionary)
+
+  assert result == {"a", "b", "c", "x"}
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.columnar_dictionary import (ColumnarDictionary,
+                                                                map_symbols_columnar)
+
+
+def test_merges_duplicates():
+  dictionary = OrderedDict()
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+    (("x", "a"), 1.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  changed_words = map_symbols_columnar(columnar_dictionary, OrderedSet(("x",)), ["c"])
+
+  assert changed_words == {"c"}
+  assert columnar_dictionary.to_pronunciation_dict()["c"] == OrderedDict((
+    (("c", "a"), 3.0),
+  ))
+
+
+def test_multiple_symbols():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  changed_words = map_symbols_columnar(columnar_dictionary, OrderedSet(("a",)), ["d", "e"])
+
+  assert changed_words == {"a", "c"}
+  result = columnar_dictionary.to_pronunciation_dict()
+  assert result["a"] == OrderedDict(((("d", "e", "b"), 1.0),))
+  assert result["b"] == OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+  ))
+  assert result["c"] == OrderedDict(((("c", "d", "e"), 2.0),))
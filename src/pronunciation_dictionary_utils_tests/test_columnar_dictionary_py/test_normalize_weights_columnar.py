@@ -0,0 +1,28 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.columnar_dictionary import (ColumnarDictionary,
+                                                                normalize_weights_columnar)
+
+
+def test_component():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+    (("x", "a"), 1.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  changed_counter = normalize_weights_columnar(columnar_dictionary)
+
+  assert changed_counter == 2
+  assert columnar_dictionary.to_pronunciation_dict()["b"] == OrderedDict((
+    (("b",), 0.25),
+    (("c",), 0.75),
+  ))
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.columnar_dictionary import (ColumnarDictionary,
+                                                                remove_symbols_from_pronunciations_columnar)
+
+
+def test_removes_empty_words():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+    (("x", "a"), 1.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  removed_words, changed_counter = remove_symbols_from_pronunciations_columnar(
+    columnar_dictionary, OrderedSet(("b", "c")), False, None)
+
+  assert removed_words == OrderedSet(("b",))
+  assert changed_counter == 3
+  assert columnar_dictionary.to_pronunciation_dict() == OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+    ("c", OrderedDict(((("a",), 2.0), (("x", "a"), 1.0)))),
+  ))
+
+
+def test_keep_empty():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a", "b"), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c", "a"), 2.0),
+  ))
+  columnar_dictionary = ColumnarDictionary.from_pronunciation_dict(dictionary)
+
+  removed_words, changed_counter = remove_symbols_from_pronunciations_columnar(
+    columnar_dictionary, OrderedSet(("b", "c")), True, "?")
+
+  assert removed_words == OrderedSet()
+  assert changed_counter == 3
+  assert columnar_dictionary.to_pronunciation_dict()["b"] == OrderedDict(((("?",), 1),))
@@ -0,0 +1,47 @@
+import pickle
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.compact_dictionary import (CompactPronunciationDict,
+                                                               CompactPronunciations)
+
+
+def test_component():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b", "ʃ"), 1),
+    (("c",), 3),
+  ))
+
+  result = CompactPronunciationDict(dictionary)
+
+  assert isinstance(result["b"], CompactPronunciations)
+  assert list(result.keys()) == ["a", "b"]
+  assert list(result["b"].items()) == [(("b", "ʃ"), 1.0), (("c",), 3.0)]
+  assert result == dictionary
+  assert result.to_pronunciation_dict() == dictionary
+
+
+def test_assigned_pronunciations_are_converted():
+  dictionary = CompactPronunciationDict()
+
+  dictionary["a"] = OrderedDict(((("a",), 1),))
+
+  assert isinstance(dictionary["a"], CompactPronunciations)
+
+
+def test_pickle():
+  dictionary = CompactPronunciationDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b", "ʃ"), 1),
+    (("c",), 3),
+  ))
+
+  result = pickle.loads(pickle.dumps(dictionary))
+
+  assert result == dictionary
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciations
+
+
+def test_equality_considers_order():
+  pronunciations = CompactPronunciations(OrderedDict((
+    (("b",), 1),
+    (("c",), 3),
+  )))
+
+  assert pronunciations == OrderedDict(((("b",), 1), (("c",), 3)))
+  assert pronunciations != OrderedDict(((("c",), 3), (("b",), 1)))
+  assert OrderedDict(((("c",), 3), (("b",), 1))) != pronunciations
+  assert pronunciations == {("c",): 3, ("b",): 1}
+
+
+def test_set_and_delete():
+  pronunciations = CompactPronunciations(OrderedDict((
+    (("b",), 1),
+  )))
+
+  pronunciations[("c",)] = 2
+  pronunciations[("b",)] = 0.5
+  del pronunciations[("c",)]
+
+  assert list(pronunciations.items()) == [(("b",), 0.5)]
+
+
+def test_set_existing__keeps_order():
+  pronunciations = CompactPronunciations(OrderedDict((
+    (("a", "b"), 1),
+    (("b",), 2),
+    (("c", "d", "e"), 3),
+  )))
+
+  pronunciations[("b",)] = 0.5
+
+  assert list(pronunciations.items()) == [(("a", "b"), 1), (("b",), 0.5), (("c", "d", "e"), 3)]
+
+
+def test_set_new__appends():
+  pronunciations = CompactPronunciations(OrderedDict((
+    (("a", "b"), 1),
+    (("b",), 2),
+  )))
+
+  pronunciations[("a",)] = 3
+  pronunciations[()] = 4
+
+  assert list(pronunciations.items()) == [(("a", "b"), 1), (("b",), 2), (("a",), 3), ((), 4)]
+
+
+def test_delete__keeps_others():
+  pronunciations = CompactPronunciations(OrderedDict((
+    (("a", "b"), 1),
+    (("b", "c", "d"), 2),
+    (("d",), 3),
+  )))
+
+  del pronunciations[("b", "c", "d")]
+
+  assert list(pronunciations.items()) == [(("a", "b"), 1), (("d",), 3)]
+
+
+def test_get_and_contains():
+  pronunciations = CompactPronunciations(OrderedDict((
+    (("a", "b"), 1),
+    (("a",), 2),
+  )))
+
+  assert pronunciations[("a",)] == 2
+  assert ("a", "b") in pronunciations
+  assert ("b", "a") not in pronunciations
+  assert ("a", "unknown-symbol") not in pronunciations
+  assert pronunciations.get(("b",)) is None
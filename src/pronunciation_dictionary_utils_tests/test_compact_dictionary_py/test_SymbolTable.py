@@ -0,0 +1,27 @@
+import sys
+from multiprocessing.pool import ThreadPool
+
+from pronunciation_dictionary_utils.compact_dictionary import SymbolTable
+
+
+def test_get_id__same_symbol__returns_same_id():
+  table = SymbolTable()
+
+  assert table.get_id("a") == table.get_id("a")
+  assert table.symbols == ["a"]
+
+
+def test_get_id__from_multiple_threads__assigns_unique_ids():
+  table = SymbolTable()
+  symbols = [f"s{i}" for i in range(2000)]
+  switch_interval = sys.getswitchinterval()
+  sys.setswitchinterval(1e-6)
+  try:
+    with ThreadPool(8) as pool:
+      results = pool.map(lambda _: [table.get_id(symbol) for symbol in symbols], range(8))
+  finally:
+    sys.setswitchinterval(switch_interval)
+
+  assert all(result == results[0] for result in results)
+  assert len(set(results[0])) == len(symbols)
+  assert [table.symbols[symbol_id] for symbol_id in results[0]] == symbols
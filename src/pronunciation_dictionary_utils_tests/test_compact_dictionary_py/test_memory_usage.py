@@ -0,0 +1,39 @@
+import gc
+import random
+import tracemalloc
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciationDict
+
+
+def test_uses_at_least_three_times_less_memory_than_ordered_dicts():
+  random.seed(1)
+  symbols = "AA0 AA1 AE1 AH0 AH1 B D EH1 ER0 F G HH IH0 IY0 K L M N NG P R S T V W Z".split()
+  lines = [
+    f"word{word_nr}  {' '.join(random.choice(symbols) for _ in range(random.randint(3, 8)))}"
+    for word_nr in range(5000)
+    for _ in range(random.randint(1, 3))
+  ]
+  # the symbols are known before the measurement like after loading any other dictionary
+  CompactPronunciationDict([("word", OrderedDict(((tuple(symbols), 1.0),)))])
+
+  memory_usages = []
+  for dictionary_type in (OrderedDict, CompactPronunciationDict):
+    gc.collect()
+    tracemalloc.start()
+    dictionary = dictionary_type()
+    for line in lines:
+      # like while deserializing, each line results in new strings
+      word, pronunciation = line.split("  ")
+      pronunciations = dictionary.get(word)
+      if pronunciations is None:
+        dictionary[word] = OrderedDict(((tuple(pronunciation.split(" ")), 1.0),))
+      else:
+        pronunciations[tuple(pronunciation.split(" "))] = 1.0
+    memory_usage, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del dictionary
+    memory_usages.append(memory_usage)
+
+  ordered_dict_usage, compact_usage = memory_usages
+  assert ordered_dict_usage >= 3 * compact_usage
@@ -0,0 +1,19 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.common import merge_pronunciations
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciations
+
+
+def test_compact():
+  pronunciations1 = CompactPronunciations(OrderedDict((
+    (("b",), 1),
+  )))
+  pronunciations2 = OrderedDict((
+    (("b",), 2),
+    (("c",), 3),
+  ))
+
+  changed_anything = merge_pronunciations(pronunciations1, pronunciations2)
+
+  assert changed_anything
+  assert list(pronunciations1.items()) == [(("b",), 3.0), (("c",), 3.0)]
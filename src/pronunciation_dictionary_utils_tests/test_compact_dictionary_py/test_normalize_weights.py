@@ -0,0 +1,25 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.compact_dictionary import (CompactPronunciationDict,
+                                                               CompactPronunciations)
+from pronunciation_dictionary_utils.weights_normalization import normalize_weights
+
+
+def test_compact():
+  dictionary = CompactPronunciationDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b", "ʃ"), 1),
+    (("c",), 3),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  changed_counter = normalize_weights(dictionary, mp_options, silent=True)
+
+  assert changed_counter == 1
+  assert isinstance(dictionary["b"], CompactPronunciations)
+  assert list(dictionary["b"].items()) == [(("b", "ʃ"), 0.25), (("c",), 0.75)]
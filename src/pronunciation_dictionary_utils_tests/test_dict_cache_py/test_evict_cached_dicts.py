@@ -0,0 +1,28 @@
+import os
+from logging import getLogger
+from pathlib import Path
+
+from pronunciation_dictionary_utils_cli.dict_cache import evict_cached_dicts
+
+
+def test_removes_least_recently_used_entries(tmp_path: Path):
+  for index, name in enumerate(("b", "c", "a")):
+    path = tmp_path / f"{name}.cache"
+    path.write_bytes(b"x" * 10)
+    os.utime(path, ns=(index * 1_000_000_000, index * 1_000_000_000))
+  (tmp_path / "other.txt").write_bytes(b"x" * 100)
+
+  evict_cached_dicts(tmp_path, 20, getLogger())
+
+  assert sorted(path.name for path in tmp_path.iterdir()) == ["a.cache", "c.cache", "other.txt"]
+
+
+def test_too_large_entry__keeps_most_recently_used_entry(tmp_path: Path):
+  for index, name in enumerate(("b", "a")):
+    path = tmp_path / f"{name}.cache"
+    path.write_bytes(b"x" * 10)
+    os.utime(path, ns=(index * 1_000_000_000, index * 1_000_000_000))
+
+  evict_cached_dicts(tmp_path, 5, getLogger())
+
+  assert sorted(path.name for path in tmp_path.iterdir()) == ["a.cache"]
@@ -0,0 +1,125 @@
+import os
+from collections import OrderedDict
+from logging import getLogger
+from pathlib import Path
+
+from pronunciation_dictionary import DeserializationOptions
+
+from pronunciation_dictionary_utils_cli.dict_cache import (get_cache_key, get_cache_path,
+                                                           try_load_cached_dict,
+                                                           try_save_cached_dict)
+
+
+def test_unchanged_file__returns_cached_dictionary(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+    (("a", "b"), 2.0),
+  ))
+  cache_dir = tmp_path / "cache"
+  assert try_save_cached_dict(dictionary, cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+
+  result = try_load_cached_dict(cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+
+  assert result == dictionary
+  assert isinstance(result["a"], OrderedDict)
+
+
+def test_missing_entry__returns_none(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+
+  result = try_load_cached_dict(tmp_path / "cache", get_cache_key(path, "UTF-8", options), getLogger())
+
+  assert result is None
+
+
+def test_changed_modification_time__returns_none(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  cache_dir = tmp_path / "cache"
+  assert try_save_cached_dict(dictionary, cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+  stat = path.stat()
+  os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+  result = try_load_cached_dict(cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+
+  assert result is None
+
+
+def test_changed_size__returns_none(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  cache_dir = tmp_path / "cache"
+  assert try_save_cached_dict(dictionary, cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+  stat = path.stat()
+  path.write_text("a  a\nb  b\n", "UTF-8")
+  os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+  result = try_load_cached_dict(cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+
+  assert result is None
+
+
+def test_other_options__returns_none(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  cache_dir = tmp_path / "cache"
+  options = DeserializationOptions(False, False, False, True)
+  assert try_save_cached_dict(dictionary, cache_dir, get_cache_key(path, "UTF-8", options), getLogger())
+  other_options = DeserializationOptions(True, False, False, True)
+
+  result = try_load_cached_dict(cache_dir, get_cache_key(path, "UTF-8", other_options), getLogger())
+
+  assert result is None
+
+
+def test_corrupt_entry__returns_none(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  cache_dir = tmp_path / "cache"
+  key = get_cache_key(path, "UTF-8", options)
+  assert try_save_cached_dict(dictionary, cache_dir, key, getLogger())
+  cache_path = get_cache_path(cache_dir, key)
+  cache_path.write_bytes(cache_path.read_bytes()[:-5])
+
+  result = try_load_cached_dict(cache_dir, key, getLogger())
+
+  assert result is None
+
+
+def test_foreign_file__returns_none(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+  cache_dir = tmp_path / "cache"
+  cache_dir.mkdir()
+  key = get_cache_key(path, "UTF-8", options)
+  get_cache_path(cache_dir, key).write_bytes(b"no cache entry")
+
+  result = try_load_cached_dict(cache_dir, key, getLogger())
+
+  assert result is None
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.dictionary_snapshot import DictionarySnapshot, encode_dictionary
+
+
+def test_lookup__returns_decoded_entries():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["äb"] = OrderedDict((
+    (("b",), 0.5),
+    (("c", "ʃ"), 3),
+  ))
+  dictionary["c"] = OrderedDict()
+
+  snapshot = DictionarySnapshot(memoryview(b"".join(encode_dictionary(dictionary))))
+
+  assert len(snapshot) == 3
+  assert list(snapshot) == ["a", "äb", "c"]
+  assert snapshot["äb"] == dictionary["äb"]
+  assert snapshot["c"] == OrderedDict()
+  assert "a" in snapshot
+  assert "b" not in snapshot
+  assert snapshot.get("b") is None
+
+
+def test_lookup__keeps_weight_types():
+  dictionary = OrderedDict()
+  dictionary["äb"] = OrderedDict((
+    (("b",), 0.5),
+    (("c", "ʃ"), 3),
+  ))
+
+  snapshot = DictionarySnapshot(memoryview(b"".join(encode_dictionary(dictionary))))
+
+  weights = list(snapshot["äb"].values())
+  assert isinstance(weights[0], float)
+  assert isinstance(weights[1], int)
+
+
+def test_empty_dictionary():
+  snapshot = DictionarySnapshot(memoryview(b"".join(encode_dictionary(OrderedDict()))))
+
+  assert len(snapshot) == 0
+  assert "a" not in snapshot
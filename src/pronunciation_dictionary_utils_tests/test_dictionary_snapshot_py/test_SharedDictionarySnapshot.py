@@ -0,0 +1,23 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.dictionary_snapshot import SharedDictionarySnapshot
+
+
+def test_attach__returns_same_entries():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["äb"] = OrderedDict((
+    (("b",), 0.5),
+    (("c", "ʃ"), 3),
+  ))
+  dictionary["c"] = OrderedDict()
+  shared_snapshot = SharedDictionarySnapshot.create(dictionary)
+  attached_snapshot = SharedDictionarySnapshot.attach(shared_snapshot.name)
+
+  try:
+    assert dict(attached_snapshot.snapshot) == dict(dictionary)
+  finally:
+    attached_snapshot.close()
+    shared_snapshot.close()
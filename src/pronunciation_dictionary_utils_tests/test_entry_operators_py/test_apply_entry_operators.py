@@ -0,0 +1,166 @@
+from collections import OrderedDict
+
+import pytest
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.entry_operators import (apply_entry_operators,
+                                                            get_map_symbols_operator,
+                                                            get_normalize_weights_operator,
+                                                            get_remove_symbols_operator,
+                                                            get_select_single_pronunciation_operator,
+                                                            get_sort_pronunciations_operator)
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+def test_applies_all_operators_in_order():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("sil",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("sil", "b"), 1.0),
+    (("AA1",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  operators = [
+    get_map_symbols_operator(OrderedSet(("AA1",)), ["AA"], False),
+    get_remove_symbols_operator(OrderedSet(("sil",)), "all", False, "sil"),
+    get_sort_pronunciations_operator(False, False),
+    get_normalize_weights_operator(),
+  ]
+  mp_options = MultiprocessingOptions(1, None, 2)
+
+  changed_words, removed_words = apply_entry_operators(dictionary, operators, mp_options, silent=True)
+
+  assert changed_words == OrderedSet(("a", "b"))
+  assert removed_words == OrderedSet(("a",))
+  assert list(dictionary.items()) == [
+    ("b", OrderedDict((
+      (("AA",), 0.75),
+      (("b",), 0.25),
+    ))),
+    ("c", OrderedDict((
+      (("c",), 1.0),
+    ))),
+  ]
+
+
+def test_keep_empty():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("sil",), 1.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  operators = [
+    get_remove_symbols_operator(OrderedSet(("sil",)), "all", True, "sil"),
+    get_normalize_weights_operator(),
+  ]
+  mp_options = MultiprocessingOptions(1, None, 2)
+
+  _, removed_words = apply_entry_operators(dictionary, operators, mp_options, silent=True)
+
+  assert removed_words == OrderedSet()
+  assert dictionary["a"] == OrderedDict((
+    (("sil",), 1.0),
+  ))
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread", "process"])
+def test_backends(backend: str):
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("sil",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("sil", "b"), 1.0),
+    (("AA1",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  operators = [
+    get_map_symbols_operator(OrderedSet(("AA1",)), ["AA"], False),
+    get_remove_symbols_operator(OrderedSet(("sil",)), "all", False, "sil"),
+    get_sort_pronunciations_operator(False, False),
+    get_normalize_weights_operator(),
+    get_select_single_pronunciation_operator("first", None),
+  ]
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, backend) as session:
+    apply_entry_operators(dictionary, operators, mp_options, silent=True, session=session)
+
+  assert dictionary == OrderedDict((
+    ("b", OrderedDict((
+      (("AA",), 1.0),
+    ))),
+    ("c", OrderedDict((
+      (("c",), 1.0),
+    ))),
+  ))
+
+
+def test_no_operators_changes_nothing():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("sil",), 1.0),
+  ))
+  mp_options = MultiprocessingOptions(1, None, 2)
+
+  changed_words, removed_words = apply_entry_operators(dictionary, [], mp_options, silent=True)
+
+  assert changed_words == OrderedSet()
+  assert removed_words == OrderedSet()
+  assert dictionary == OrderedDict((
+    ("a", OrderedDict((
+      (("sil",), 1.0),
+    ))),
+  ))
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_transfer_entries__workers_are_reused_for_other_dictionaries(backend: str):
+  dictionary1 = OrderedDict()
+  dictionary1["a"] = OrderedDict((
+    (("sil",), 1.0),
+  ))
+  dictionary1["b"] = OrderedDict((
+    (("b", "sil"), 1.0),
+  ))
+  dictionary2 = OrderedDict()
+  dictionary2["c"] = OrderedDict((
+    (("c",), 1.0),
+  ))
+  dictionary2["d"] = OrderedDict((
+    (("sil", "d"), 1.0),
+  ))
+  operators = [
+    get_remove_symbols_operator(OrderedSet(("sil",)), "all", False, None),
+  ]
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, backend) as session:
+    result1 = apply_entry_operators(
+      dictionary1, operators, mp_options, silent=True, session=session, transfer_entries=True)
+    executor = session.get_executor()
+    result2 = apply_entry_operators(
+      dictionary2, operators, mp_options, silent=True, session=session, transfer_entries=True)
+
+    assert session.get_executor() is executor
+    if backend == "process":
+      assert not executor.is_current(dictionary2)
+
+  assert result1 == (OrderedSet(("a", "b")), OrderedSet(("a",)))
+  assert result2 == (OrderedSet(("d",)), OrderedSet())
+  assert list(dictionary1.items()) == [
+    ("b", OrderedDict(((("b",), 1.0),))),
+  ]
+  assert list(dictionary2.items()) == [
+    ("c", OrderedDict(((("c",), 1.0),))),
+    ("d", OrderedDict(((("d",), 1.0),))),
+  ]
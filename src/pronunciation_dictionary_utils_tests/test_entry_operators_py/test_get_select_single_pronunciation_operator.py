@@ -0,0 +1,8 @@
+import pytest
+
+from pronunciation_dictionary_utils.entry_operators import get_select_single_pronunciation_operator
+
+
+def test_invalid_mode_raises_error():
+  with pytest.raises(ValueError):
+    get_select_single_pronunciation_operator("abc", None)
@@ -0,0 +1,84 @@
+import os
+import time
+from itertools import count, islice
+
+import pytest
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.executors import AutoExecutor
+
+
+def get_pid(_: int) -> int:
+  return os.getpid()
+
+
+def get_pid_slowly(_: int) -> int:
+  time.sleep(0.002)
+  return os.getpid()
+
+
+def test_cheap_items__does_not_start_processes(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setattr(os, "cpu_count", lambda: 4)
+  executor = AutoExecutor(MultiprocessingOptions(4, None, 1))
+
+  try:
+    executor.prepare(None)
+    pids = set(executor.imap(get_pid, range(20000), 1))
+  finally:
+    executor.close()
+
+  assert pids == {os.getpid()}
+  assert not executor.is_open
+
+
+def test_expensive_items__starts_processes(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setattr(os, "cpu_count", lambda: 4)
+  executor = AutoExecutor(MultiprocessingOptions(4, None, 1))
+
+  try:
+    executor.prepare(None)
+    pids = set(executor.imap(get_pid_slowly, range(300), 1))
+  finally:
+    executor.close()
+
+  assert pids - {os.getpid()}
+
+
+def test_single_cpu__does_not_start_processes(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setattr(os, "cpu_count", lambda: 1)
+  executor = AutoExecutor(MultiprocessingOptions(4, None, 1))
+
+  try:
+    executor.prepare(None)
+    pids = set(executor.imap(get_pid_slowly, range(100), 1))
+  finally:
+    executor.close()
+
+  assert pids == {os.getpid()}
+
+
+def test_iterator__is_read_lazily(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setattr(os, "cpu_count", lambda: 4)
+  executor = AutoExecutor(MultiprocessingOptions(4, None, 1))
+
+  try:
+    executor.prepare(None)
+    # an endless iterator would never be exhausted if it was materialized
+    result = list(islice(executor.imap(get_pid, count(), 1), 500))
+  finally:
+    executor.close()
+
+  assert len(result) == 500
+
+
+def test_iterator__keeps_order(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setattr(os, "cpu_count", lambda: 4)
+  executor = AutoExecutor(MultiprocessingOptions(4, None, 1))
+
+  try:
+    executor.prepare(None)
+    result = list(executor.imap(abs, (-number for number in range(300)), 1))
+  finally:
+    executor.close()
+
+  assert result == list(range(300))
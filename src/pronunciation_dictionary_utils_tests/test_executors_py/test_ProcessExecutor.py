@@ -0,0 +1,55 @@
+import os
+from collections import OrderedDict
+
+import pytest
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils import dictionary_snapshot, executors
+from pronunciation_dictionary_utils.executors import ProcessExecutor, get_process_lookup_dict
+
+
+def get_pronunciations(word: str):
+  return os.getpid(), get_process_lookup_dict()[word]
+
+
+@pytest.mark.parametrize("shared_snapshot", [False, True])
+def test_workers_read_dictionary(shared_snapshot: bool, monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setattr(executors, "uses_shared_snapshot", lambda: shared_snapshot)
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 0.5),
+    (("c",), 2),
+  ))
+  executor = ProcessExecutor(MultiprocessingOptions(2, None, 1))
+
+  try:
+    executor.prepare(dictionary)
+    result = list(executor.imap(get_pronunciations, ["b", "a"], 1))
+  finally:
+    executor.close()
+
+  assert all(pid != os.getpid() for pid, _ in result)
+  assert [pronunciations for _, pronunciations in result] == [dictionary["b"], dictionary["a"]]
+
+
+def test_fork__creates_no_snapshot(monkeypatch: pytest.MonkeyPatch):
+  def create_snapshot(dictionary):
+    assert False
+  monkeypatch.setattr(executors, "uses_shared_snapshot", lambda: False)
+  monkeypatch.setattr(dictionary_snapshot.SharedDictionarySnapshot, "create", create_snapshot)
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  executor = ProcessExecutor(MultiprocessingOptions(2, None, 1))
+
+  try:
+    executor.prepare(dictionary)
+    result = list(executor.imap(get_pronunciations, ["a"], 1))
+  finally:
+    executor.close()
+
+  assert result[0][1] == dictionary["a"]
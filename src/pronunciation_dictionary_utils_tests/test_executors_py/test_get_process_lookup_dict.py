@@ -0,0 +1,47 @@
+import gc
+import time
+import weakref
+from collections import OrderedDict
+from typing import List
+
+import pytest
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.executors import get_process_lookup_dict
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+def get_words_after_delay(_: int) -> List[str]:
+  time.sleep(0.01)
+  return list(get_process_lookup_dict().keys())
+
+
+def test_two_thread_sessions__read_own_dictionaries():
+  dictionary1 = OrderedDict()
+  dictionary1["a"] = OrderedDict(((("a",), 1),))
+  dictionary2 = OrderedDict()
+  dictionary2["b"] = OrderedDict(((("b",), 1),))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "thread") as session1, ProcessingSession(mp_options, "thread") as session2:
+    results1 = session1.get_executor(dictionary1).imap(get_words_after_delay, range(10), 1)
+    results2 = session2.get_executor(dictionary2).imap(get_words_after_delay, range(10), 1)
+    words1 = list(results1)
+    words2 = list(results2)
+
+  assert words1 == [["a"]] * 10
+  assert words2 == [["b"]] * 10
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread", "auto"])
+def test_closed_session__releases_dictionary(backend: str):
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict(((("a",), 1),))
+  reference = weakref.ref(dictionary)
+
+  with ProcessingSession(MultiprocessingOptions(1, None, 1), backend) as session:
+    assert list(session.get_executor(dictionary).imap(get_words_after_delay, range(1), 1)) == [["a"]]
+  del dictionary
+  gc.collect()
+
+  assert reference() is None
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from logging import getLogger
+from pathlib import Path
+
+from pronunciation_dictionary import DeserializationOptions, MultiprocessingOptions, load_dict
+
+from pronunciation_dictionary_utils_cli.io import iterate_dict_batches
+
+
+def test_lines_of_word_at_batch_boundary__are_in_same_batch(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  a\nb  b\nb  c\nb  d\nc  c\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, False)
+  mp_options = MultiprocessingOptions(1, None, 1)
+
+  result = list(iterate_dict_batches(path, "UTF-8", options, 2, mp_options, getLogger()))
+
+  assert result == [
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 1.0), (("c",), 1.0), (("d",), 1.0)))),
+    )),
+    OrderedDict((
+      ("c", OrderedDict(((("c",), 1.0),))),
+    )),
+  ]
+
+
+def test_duplicate_pronunciation_in_next_batch__keeps_first_weight(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  1.0  a\nb  2.0  b\nb  3.0  b\nb  1.0  c\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, True)
+  mp_options = MultiprocessingOptions(1, None, 1)
+
+  result = list(iterate_dict_batches(path, "UTF-8", options, 2, mp_options, getLogger()))
+
+  assert result == [
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 2.0), (("c",), 1.0)))),
+    )),
+  ]
+
+
+def test_empty_and_invalid_lines__are_ignored(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("\n\na  a\n\n\n\nb\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, False)
+  mp_options = MultiprocessingOptions(1, None, 1)
+
+  result = list(iterate_dict_batches(path, "UTF-8", options, 2, mp_options, getLogger()))
+
+  assert result == [
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+  ]
+
+
+def test_any_batch_size__equals_load_dict(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text(
+    ";;; comment\nA  a\na  0.5  b\nb  2  c\nb  2  c\nb  1  d\nc  e f\n\nd(1)  g\nd(2)  h\ne  i\n", "UTF-8")
+  options = DeserializationOptions(True, True, False, True)
+  mp_options = MultiprocessingOptions(1, None, 1)
+  expected = load_dict(path, "UTF-8", options, mp_options)
+
+  for batch_size in range(1, 13):
+    result = OrderedDict()
+    for batch in iterate_dict_batches(path, "UTF-8", options, batch_size, mp_options, getLogger()):
+      assert len(batch) > 0
+      assert result.keys().isdisjoint(batch.keys())
+      result.update(batch)
+
+    assert result == expected
+    assert list(result.keys()) == list(expected.keys())
@@ -0,0 +1,52 @@
+from logging import getLogger
+from pathlib import Path
+
+import pytest
+from ordered_set import OrderedSet
+from pronunciation_dictionary import (DeserializationOptions, MultiprocessingOptions,
+                                      SerializationOptions, load_dict, save_dict)
+
+from pronunciation_dictionary_utils import (ProcessingSession, get_remove_symbols_operator,
+                                            remove_symbols_from_pronunciations)
+from pronunciation_dictionary_utils_cli.io import try_process_dict_streamed
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_equals_result_of_not_streamed_processing(tmp_path: Path, backend: str):
+  text = "a  sil\nb  b sil\nb  b\nb  c\nc  sil\nc  sil sil\nd  d\ne  sil e\ne  e sil\n"
+  path = tmp_path / "dict.txt"
+  path.write_text(text, "UTF-8")
+  expected_path = tmp_path / "expected.txt"
+  expected_path.write_text(text, "UTF-8")
+  options = DeserializationOptions(False, False, False, False)
+  s_options = SerializationOptions("DOUBLE-SPACE", False, False)
+  mp_options = MultiprocessingOptions(1, None, 2)
+  dictionary = load_dict(expected_path, "UTF-8", options, mp_options)
+  expected_removed_words, expected_changed_counter = remove_symbols_from_pronunciations(
+    dictionary, OrderedSet(("sil",)), "all", False, None, mp_options, silent=True)
+  save_dict(dictionary, expected_path, "UTF-8", s_options)
+  operator = get_remove_symbols_operator(OrderedSet(("sil",)), "all", False, None)
+
+  with ProcessingSession(mp_options, backend) as session:
+    result = try_process_dict_streamed(
+      path, "UTF-8", options, s_options, 2, operator, session, getLogger(), getLogger())
+
+  assert result == (expected_changed_counter, expected_removed_words)
+  assert path.read_text("UTF-8") == expected_path.read_text("UTF-8")
+
+
+def test_nothing_changed__keeps_file(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a   a\nb   b\n", "UTF-8")
+  options = DeserializationOptions(False, False, False, False)
+  s_options = SerializationOptions("DOUBLE-SPACE", False, False)
+  mp_options = MultiprocessingOptions(1, None, 2)
+  operator = get_remove_symbols_operator(OrderedSet(("sil",)), "all", False, None)
+
+  with ProcessingSession(mp_options, "inline") as session:
+    result = try_process_dict_streamed(
+      path, "UTF-8", options, s_options, 1, operator, session, getLogger(), getLogger())
+
+  assert result == (0, OrderedSet())
+  assert path.read_text("UTF-8") == "a   a\nb   b\n"
+  assert [file.name for file in tmp_path.iterdir()] == ["dict.txt"]
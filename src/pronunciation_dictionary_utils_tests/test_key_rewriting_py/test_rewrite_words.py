@@ -0,0 +1,123 @@
+from collections import OrderedDict
+
+import pytest
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.key_rewriting import rewrite_words
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_merges_into_existing_and_created_words(backend: str):
+  dictionary = OrderedDict()
+  dictionary["A"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["a"] = OrderedDict((
+    (("a",), 2.0),
+    (("x",), 1.0),
+  ))
+  dictionary["B"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+  dictionary["C"] = OrderedDict((
+    (("d",), 1.0),
+  ))
+  dictionary["-"] = OrderedDict((
+    (("e",), 1.0),
+  ))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, 1), backend) as session:
+    result = rewrite_words(dictionary, [("A", "a"), ("B", "b"), ("C", "c")], session, 1, True)
+
+  assert result == (OrderedSet(["A", "B", "C"]), OrderedSet(["c"]), OrderedSet())
+  assert list(dictionary.items()) == [
+    ("b", OrderedDict(((("b",), 1.0), (("c",), 3.0)))),
+    ("a", OrderedDict(((("a",), 3.0), (("x",), 1.0)))),
+    ("-", OrderedDict(((("e",), 1.0),))),
+    ("c", OrderedDict(((("d",), 1.0),))),
+  ]
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_merges_words_with_same_new_word_in_order_of_dictionary(backend: str):
+  dictionary = OrderedDict()
+  dictionary["A"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+  dictionary["B"] = OrderedDict((
+    (("c",), 3.0),
+  ))
+  dictionary["C"] = OrderedDict((
+    (("d",), 1.0),
+  ))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, 1), backend) as session:
+    result = rewrite_words(dictionary, [("B", "d"), ("C", "d"), ("A", "e")], session, 1, True)
+
+  assert result == (OrderedSet(["B", "C", "A"]), OrderedSet(["d", "e"]), OrderedSet())
+  assert list(dictionary.keys()) == ["b", "d", "e"]
+  assert dictionary["d"] == OrderedDict(((("c",), 3.0), (("d",), 1.0)))
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_empty_new_word__removes_words(backend: str):
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["-"] = OrderedDict((
+    (("e",), 1.0),
+  ))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, 1), backend) as session:
+    result = rewrite_words(dictionary, [("-", "")], session, 1, True)
+
+  assert result == (OrderedSet(["-"]), OrderedSet(), OrderedSet(["-"]))
+  assert "-" not in dictionary
+  assert "" not in dictionary
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_renamed_new_word__is_processed_in_order(backend: str):
+  dictionary = OrderedDict()
+  dictionary["A"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["C"] = OrderedDict((
+    (("d",), 1.0),
+  ))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, 1), backend) as session:
+    result = rewrite_words(dictionary, [("A", "C"), ("C", "c")], session, 1, True)
+
+  assert result == (OrderedSet(["A", "C"]), OrderedSet(["c"]), OrderedSet())
+  assert dictionary["c"] == OrderedDict(((("d",), 1.0), (("a",), 1.0)))
+
+
+def test_process__workers_get_no_copy_of_dictionary():
+  dictionary = OrderedDict()
+  dictionary["A"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["a"] = OrderedDict((
+    (("b",), 1.0),
+  ))
+
+  with ProcessingSession(MultiprocessingOptions(2, None, 1), "process") as session:
+    rewrite_words(dictionary, [("A", "a")], session, 1, True)
+    executor = session.get_executor()
+
+    assert executor.is_open
+    assert not executor.is_current(dictionary)
+
+  assert list(dictionary.items()) == [
+    ("a", OrderedDict(((("b",), 1.0), (("a",), 1.0)))),
+  ]
@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from copy import deepcopy
+
+from pronunciation_dictionary_utils.merging import merge_dictionaries, merge_many
+
+
+def test_add():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+  ))
+  other_dictionaries = [
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 1.0),))),
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+      ("c", OrderedDict(((("c",), 1.0),))),
+    )),
+  ]
+
+  changed_anything = merge_many(dictionary, other_dictionaries, "add")
+
+  assert changed_anything
+  assert dictionary == OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+  ))
+
+
+def test_replace():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+  ))
+  other_dictionaries = [
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 1.0),))),
+    )),
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+      ("c", OrderedDict(((("c",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("y",), 0.5),))),
+    )),
+  ]
+
+  changed_anything = merge_many(dictionary, other_dictionaries, "replace")
+
+  assert changed_anything
+  assert dictionary == OrderedDict((
+    ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+    ("b", OrderedDict(((("y",), 0.5),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+  ))
+
+
+def test_extend():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+  ))
+  other_dictionaries = [
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 1.0),))),
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+      ("c", OrderedDict(((("c",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("y",), 0.5),))),
+    )),
+  ]
+
+  changed_anything = merge_many(dictionary, other_dictionaries, "extend")
+
+  assert changed_anything
+  # the pronunciations of "a" in the second dictionary are equal to the first ones and therefore ignored
+  assert dictionary == OrderedDict((
+    ("a", OrderedDict(((("a",), 3.0), (("x",), 1.0)))),
+    ("b", OrderedDict(((("b",), 1.0), (("y",), 0.5)))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+  ))
+
+
+def test_is_equal_to_merging_one_after_another():
+  dictionaries = [
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 1.0),))),
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+      ("c", OrderedDict(((("c",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("y",), 0.5),))),
+    )),
+  ]
+
+  for mode in ("add", "replace", "extend"):
+    expected = deepcopy(dictionaries)
+    expected_changed_anything = False
+    for other_dictionary in expected[1:]:
+      expected_changed_anything |= merge_dictionaries(expected[0], other_dictionary, mode)
+
+    result = deepcopy(dictionaries)
+    changed_anything = merge_many(result[0], result[1:], mode)
+
+    assert list(result[0].items()) == list(expected[0].items())
+    assert changed_anything == expected_changed_anything
+
+
+def test_no_other_dictionaries__changes_nothing():
+  dictionary = OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+  ))
+
+  changed_anything = merge_many(dictionary, [], "extend")
+
+  assert not changed_anything
+  assert dictionary == OrderedDict((
+    ("a", OrderedDict(((("a",), 1.0),))),
+  ))
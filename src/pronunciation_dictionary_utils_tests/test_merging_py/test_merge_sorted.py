@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from copy import deepcopy
+
+import pytest
+
+from pronunciation_dictionary_utils.merging import merge_many, merge_sorted
+from pronunciation_dictionary_utils.words_sorting import sort_words
+
+
+def test_is_equal_to_merging_and_sorting():
+  dictionaries = [
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("b",), 1.0),))),
+      ("a", OrderedDict(((("a",), 1.0),))),
+    )),
+    OrderedDict((
+      ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+      ("c", OrderedDict(((("c",), 1.0),))),
+    )),
+    OrderedDict((
+      ("b", OrderedDict(((("y",), 0.5),))),
+    )),
+  ]
+
+  for mode in ("add", "replace", "extend"):
+    for descending in (False, True):
+      expected = [sort_words(dictionary, descending, False) for dictionary in deepcopy(dictionaries)]
+      expected_changed_anything = merge_many(expected[0], expected[1:], mode)
+      expected_entries = list(sort_words(expected[0], descending, False).items())
+
+      sorted_dictionaries = [
+        sort_words(dictionary, descending, False) for dictionary in deepcopy(dictionaries)
+      ]
+      result = list(merge_sorted(
+        [list(dictionary.items()) for dictionary in sorted_dictionaries], mode, descending, False))
+
+      assert [(word, pronunciations) for word, pronunciations, _ in result] == expected_entries
+      assert any(changed for _, _, changed in result) == expected_changed_anything
+
+
+def test_returns_changed_words():
+  entries = [
+    [
+      ("a", OrderedDict(((("a",), 1.0),))),
+    ],
+    [
+      ("a", OrderedDict(((("a",), 1.0),))),
+      ("b", OrderedDict(((("b",), 1.0),))),
+    ],
+    [
+      ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+      ("c", OrderedDict(((("c",), 1.0),))),
+    ],
+    [
+      ("b", OrderedDict(((("y",), 0.5),))),
+    ],
+  ]
+
+  result = merge_sorted(entries, "add", False, False)
+
+  assert [(word, changed) for word, _, changed in result] == [
+    ("a", False),
+    ("b", True),
+    ("c", True),
+  ]
+
+
+def test_unsorted_dictionary__raises_error():
+  entries = [
+    [
+      ("a", OrderedDict(((("a",), 1.0),))),
+    ],
+    [
+      ("b", OrderedDict(((("b",), 1.0),))),
+      ("a", OrderedDict(((("a",), 1.0),))),
+    ],
+  ]
+
+  result = merge_sorted(entries, "add", False, False)
+
+  with pytest.raises(ValueError):
+    list(result)
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+
+from pronunciation_dictionary_utils.pattern_replacement import PatternReplacer
+
+
+@pytest.mark.parametrize("pattern", [r"^A", r"B$", r"\bA", r"(A) (B)", r"A|C", r"A(?= B)", r"[AB]+"])
+def test_joinable_pattern__result_equals_replacing_each_text(pattern: str):
+  texts = ["A B", "B A", "", "C A B", "A"]
+  replacer = PatternReplacer(re.compile(pattern), "X")
+
+  result = replacer.replace_all(texts)
+
+  assert replacer.replaces_joined
+  assert result == [re.sub(pattern, "X", text) for text in texts]
+
+
+@pytest.mark.parametrize("pattern", [r"\s", r"\W", r"[^A]", r"\A", r"\Z", r"\B", r"(?s:.)", r"\n", r"[\x00-\x7f]"])
+def test_pattern_matching_separator__is_applied_to_each_text(pattern: str):
+  texts = ["A B", "", "B"]
+  replacer = PatternReplacer(re.compile(pattern), "X")
+
+  result = replacer.replace_all(texts)
+
+  assert not replacer.replaces_joined
+  assert result == [re.sub(pattern, "X", text) for text in texts]
+
+
+def test_replacement_containing_separator__is_applied_to_each_text():
+  replacer = PatternReplacer(re.compile("A"), "\n")
+
+  result = replacer.replace_all(["A B", "B"])
+
+  assert result == ["\n B", "B"]
+
+
+def test_texts_containing_separator__are_applied_to_each_text():
+  replacer = PatternReplacer(re.compile("^A"), "X")
+
+  result = replacer.replace_all(["B\nA", "A"])
+
+  assert result == ["B\nA", "X"]
+
+
+def test_empty_list__returns_empty_list():
+  replacer = PatternReplacer(re.compile("A"), "X")
+
+  result = replacer.replace_all([])
+
+  assert result == []
@@ -0,0 +1,51 @@
+from pronunciation_dictionary_utils_cli.pipeline import get_invalid_steps_msg
+
+
+def test_valid_steps__returns_none():
+  steps = {
+    "steps": [
+      {"command": "remove-symbols-from-words", "symbols": "'-", "mode": "both"},
+      {"command": "select-single-pronunciation"},
+      {"command": "sort-words", "descending": True},
+    ]
+  }
+
+  result = get_invalid_steps_msg(steps)
+
+  assert result is None
+
+
+def test_missing_steps__returns_msg():
+  result = get_invalid_steps_msg({"step": []})
+
+  assert result == "A list \"steps\" is required!"
+
+
+def test_step_is_no_object__returns_msg():
+  result = get_invalid_steps_msg({"steps": [{"command": "sort-words"}, "sort-words"]})
+
+  assert result == "Step 2: Step needs to be a table/object!"
+
+
+def test_unknown_command__returns_msg():
+  result = get_invalid_steps_msg({"steps": [{"command": "sort-words"}, {"command": "sort"}]})
+
+  assert result == "Step 2: Command \"sort\" is not available!"
+
+
+def test_missing_command__returns_msg():
+  result = get_invalid_steps_msg({"steps": [{"mode": "lower"}]})
+
+  assert result == "Step 1: Command \"None\" is not available!"
+
+
+def test_unknown_parameter__returns_msg():
+  result = get_invalid_steps_msg({"steps": [{"command": "sort-words", "reverse": True}]})
+
+  assert result.startswith("Step 1: Invalid parameters for command \"sort-words\"")
+
+
+def test_missing_parameter__returns_msg():
+  result = get_invalid_steps_msg({"steps": [{"command": "change-word-casing"}]})
+
+  assert result.startswith("Step 1: Invalid parameters for command \"change-word-casing\"")
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from pronunciation_dictionary_utils_cli.pipeline import load_steps
+
+
+def test_json(tmp_path: Path):
+  path = tmp_path / "steps.json"
+  path.write_text(
+    '{"steps": [{"command": "sort-words"}, {"command": "change-word-casing", "mode": "lower"}]}', "UTF-8")
+
+  result = load_steps(path, "UTF-8")
+
+  assert result == {
+    "steps": [
+      {"command": "sort-words"},
+      {"command": "change-word-casing", "mode": "lower"},
+    ]
+  }
+
+
+def test_toml(tmp_path: Path):
+  path = tmp_path / "steps.TOML"
+  path.write_text(
+    '[[steps]]\ncommand = "sort-words"\n\n[[steps]]\ncommand = "change-word-casing"\nmode = "lower"\n', "UTF-8")
+
+  result = load_steps(path, "UTF-8")
+
+  assert result == {
+    "steps": [
+      {"command": "sort-words"},
+      {"command": "change-word-casing", "mode": "lower"},
+    ]
+  }
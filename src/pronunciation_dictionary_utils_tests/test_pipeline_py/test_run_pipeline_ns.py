@@ -0,0 +1,105 @@
+from argparse import ArgumentParser
+from logging import getLogger
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from pronunciation_dictionary_utils_cli import pipeline
+from pronunciation_dictionary_utils_cli.pipeline import get_pipeline_parser
+from pronunciation_dictionary_utils_cli.pronunciations_remove_symbols import \
+  get_pronunciations_remove_symbols_parser
+from pronunciation_dictionary_utils_cli.single_pronunciation_selection import \
+  get_single_pronunciation_selection_parser
+from pronunciation_dictionary_utils_cli.words_casing_adjustment import get_words_casing_adjustment_parser
+from pronunciation_dictionary_utils_cli.words_remove_symbols import get_words_remove_symbols_parser
+from pronunciation_dictionary_utils_cli.words_sorting import get_words_sorting_parser
+
+
+def test_steps_are_applied_in_order(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("a  x b\na  c\n", "UTF-8")
+  steps_path = tmp_path / "steps.json"
+  steps_path.write_text(
+    '{"steps": [{"command": "remove-symbols-from-pronunciations", "symbols": ["x"], "mode": "all"}, {"command": "select-single-pronunciation", "mode": "shortest"}]}', "UTF-8")
+  parser = ArgumentParser()
+  method = get_pipeline_parser(parser)
+  ns = parser.parse_args([str(path), str(steps_path), "-b", "inline"])
+
+  result = method(ns, getLogger(), getLogger())
+
+  assert result
+  # in reverse order, "c" would have been selected
+  assert path.read_text("UTF-8") == "a  b"
+
+
+@pytest.mark.parametrize("backend", ["inline", "process"])
+def test_equals_result_of_single_commands(tmp_path: Path, backend: str):
+  text = "'Tom'  sil T O M\ntom  T O M\nAnn-  A sil N\nann  N\nbob  sil\nbob  B O B\n"
+  path = tmp_path / "dict.txt"
+  path.write_text(text, "UTF-8")
+  expected_path = tmp_path / "expected.txt"
+  expected_path.write_text(text, "UTF-8")
+  steps_path = tmp_path / "steps.json"
+  steps_path.write_text('''{"steps": [
+    {"command": "remove-symbols-from-words", "symbols": "'-", "mode": "both"},
+    {"command": "change-word-casing", "mode": "lower"},
+    {"command": "remove-symbols-from-pronunciations", "symbols": ["sil"], "mode": "all"},
+    {"command": "select-single-pronunciation", "mode": "last"},
+    {"command": "sort-words"}
+  ]}''', "UTF-8")
+  parser = ArgumentParser()
+  method = get_pipeline_parser(parser)
+  ns = parser.parse_args([str(path), str(steps_path), "-b", backend])
+
+  result = method(ns, getLogger(), getLogger())
+
+  for get_parser, arguments in (
+    (get_words_remove_symbols_parser, ["'-", "-m", "both"]),
+    (get_words_casing_adjustment_parser, ["lower"]),
+    (get_pronunciations_remove_symbols_parser, ["sil", "-m", "all", "-ro", str(tmp_path / "removed.txt")]),
+    (get_single_pronunciation_selection_parser, ["-m", "last"]),
+    (get_words_sorting_parser, []),
+  ):
+    command_parser = ArgumentParser()
+    command_method = get_parser(command_parser)
+    command_ns = command_parser.parse_args([str(expected_path), *arguments, "-b", backend])
+    assert command_method(command_ns, getLogger(), getLogger())
+  assert result
+  assert path.read_text("UTF-8") == expected_path.read_text("UTF-8")
+
+
+def test_invalid_step__changes_nothing(tmp_path: Path):
+  path = tmp_path / "dict.txt"
+  path.write_text("b  b\na  a\n", "UTF-8")
+  steps_path = tmp_path / "steps.json"
+  steps_path.write_text('{"steps": [{"command": "sort-words"}, {"command": "sort"}]}', "UTF-8")
+  parser = ArgumentParser()
+  method = get_pipeline_parser(parser)
+  ns = parser.parse_args([str(path), str(steps_path), "-b", "inline"])
+
+  result = method(ns, getLogger(), getLogger())
+
+  assert not result
+  assert path.read_text("UTF-8") == "b  b\na  a\n"
+
+
+def test_unexpected_error__reports_step(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+  def step_fail(dictionary, context):
+    raise KeyError("x")
+
+  monkeypatch.setitem(pipeline.STEPS, "normalize-weights", step_fail)
+  path = tmp_path / "dict.txt"
+  path.write_text("b  b\na  a\n", "UTF-8")
+  steps_path = tmp_path / "steps.json"
+  steps_path.write_text('{"steps": [{"command": "sort-words"}, {"command": "normalize-weights"}]}', "UTF-8")
+  parser = ArgumentParser()
+  method = get_pipeline_parser(parser)
+  ns = parser.parse_args([str(path), str(steps_path), "-b", "inline"])
+  logger = Mock()
+
+  result = method(ns, logger, Mock())
+
+  assert not result
+  logger.error.assert_called_once_with("Step 2 (normalize-weights) failed unexpectedly: KeyError: 'x'")
+  assert path.read_text("UTF-8") == "b  b\na  a\n"
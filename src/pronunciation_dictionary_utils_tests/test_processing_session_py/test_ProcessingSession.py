@@ -0,0 +1,11 @@
+import pytest
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+
+
+def test_invalid_backend__raises_value_error():
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with pytest.raises(ValueError):
+    ProcessingSession(mp_options, "gpu")
@@ -0,0 +1,97 @@
+import os
+import time
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+from pronunciation_dictionary_utils.pronunciations_map_symbols import map_symbols
+from pronunciation_dictionary_utils.pronunciations_sorting import sort_pronunciations
+from pronunciation_dictionary_utils.weights_normalization import normalize_weights
+
+
+def get_worker_pids(session: ProcessingSession, dictionary) -> set:
+  executor = session.get_executor(dictionary)
+  return set(executor.imap(get_pid, range(50), 1))
+
+
+def get_pid(_: int) -> int:
+  # ensure that the items are distributed among all workers
+  time.sleep(0.002)
+  return os.getpid()
+
+
+def test_unchanged_dictionary__reuses_workers():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1),
+    (("c",), 3),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    pids = get_worker_pids(session, dictionary)
+    changed_counter = sort_pronunciations(
+      dictionary, False, True, mp_options, silent=True, session=session)
+    assert changed_counter == 0
+    assert not get_worker_pids(session, dictionary).isdisjoint(pids)
+
+
+def test_changed_dictionary__refreshes_workers():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1),
+    (("c",), 3),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    pids = get_worker_pids(session, dictionary)
+    changed_words = map_symbols(dictionary, OrderedSet(("c",)), [
+                                "x"], False, mp_options, silent=True, session=session)
+    assert changed_words == {"b"}
+    assert get_worker_pids(session, dictionary).isdisjoint(pids)
+
+    changed_counter = normalize_weights(dictionary, mp_options, silent=True, session=session)
+
+  assert changed_counter == 1
+  assert dictionary["b"] == OrderedDict((
+    (("b",), 0.25),
+    (("x",), 0.75),
+  ))
+
+
+def test_other_dictionary__refreshes_workers():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  other_dictionary = OrderedDict()
+  other_dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    pids = get_worker_pids(session, dictionary)
+    assert get_worker_pids(session, other_dictionary).isdisjoint(pids)
+
+
+def test_auto__small_dictionary__does_not_start_processes():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "auto") as session:
+    pids = get_worker_pids(session, dictionary)
+
+  assert pids == {os.getpid()}
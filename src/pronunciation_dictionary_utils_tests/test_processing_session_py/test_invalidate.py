@@ -0,0 +1,33 @@
+from collections import OrderedDict
+
+import pytest
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.executors import BACKENDS
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+from pronunciation_dictionary_utils.weights_normalization import normalize_weights
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_changed_dictionary__uses_current_dictionary(backend: str):
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1),
+    (("c",), 3),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, backend) as session:
+    session.get_executor(dictionary)
+    dictionary["a"][("x",)] = 1
+    session.invalidate()
+    changed_counter = normalize_weights(dictionary, mp_options, silent=True, session=session)
+
+  assert changed_counter == 2
+  assert dictionary["a"] == OrderedDict((
+    (("a",), 0.5),
+    (("x",), 0.5),
+  ))
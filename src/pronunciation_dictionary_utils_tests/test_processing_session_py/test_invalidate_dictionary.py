@@ -0,0 +1,98 @@
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.executors import invalidate_dictionary
+from pronunciation_dictionary_utils.merging import merge_dictionaries, merge_many
+from pronunciation_dictionary_utils.processing_session import ProcessingSession
+from pronunciation_dictionary_utils.pronunciations_map_symbols import map_symbols
+from pronunciation_dictionary_utils.pronunciations_remove_symbols import \
+  remove_symbols_from_pronunciations
+
+
+def test_merge_dictionaries__refreshes_workers():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  other_dictionary = OrderedDict()
+  other_dictionary["new"] = OrderedDict((
+    (("c",), 1),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    removed_words, changed_counter = remove_symbols_from_pronunciations(
+      dictionary, OrderedSet(("x",)), "all", False, None, mp_options, silent=True, session=session)
+    assert changed_counter == 0
+    merge_dictionaries(dictionary, other_dictionary, "add")
+    changed_words = map_symbols(dictionary, OrderedSet(("c",)), [
+                                "x"], False, mp_options, silent=True, session=session)
+
+  assert changed_words == {"new"}
+  assert dictionary["new"] == OrderedDict((
+    (("x",), 1),
+  ))
+
+
+def test_merge_many__refreshes_workers():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  other_dictionary = OrderedDict()
+  other_dictionary["a"] = OrderedDict((
+    (("c",), 1),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    map_symbols(dictionary, OrderedSet(("x",)), ["y"], False, mp_options, silent=True, session=session)
+    merge_many(dictionary, [other_dictionary], "replace")
+    changed_words = map_symbols(dictionary, OrderedSet(("c",)), [
+                                "x"], False, mp_options, silent=True, session=session)
+
+  assert changed_words == {"a"}
+  assert dictionary["a"] == OrderedDict((
+    (("x",), 1),
+  ))
+
+
+def test_changed_outside_of_library__refreshes_workers():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    map_symbols(dictionary, OrderedSet(("x",)), ["y"], False, mp_options, silent=True, session=session)
+    dictionary["a"] = OrderedDict((
+      (("c",), 1),
+    ))
+    invalidate_dictionary(dictionary)
+    changed_words = map_symbols(dictionary, OrderedSet(("c",)), [
+                                "x"], False, mp_options, silent=True, session=session)
+
+  assert changed_words == {"a"}
+
+
+def test_other_session__is_refreshed():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+  mp_options = MultiprocessingOptions(2, None, 1)
+
+  with ProcessingSession(mp_options, "process") as session:
+    map_symbols(dictionary, OrderedSet(("x",)), ["y"], False, mp_options, silent=True, session=session)
+    # changed with a temporary session
+    map_symbols(dictionary, OrderedSet(("a",)), ["c"], False, mp_options, silent=True)
+    changed_words = map_symbols(dictionary, OrderedSet(("c",)), [
+                                "x"], False, mp_options, silent=True, session=session)
+
+  assert changed_words == {"a"}
+  assert dictionary["a"] == OrderedDict((
+    (("x",), 1),
+  ))
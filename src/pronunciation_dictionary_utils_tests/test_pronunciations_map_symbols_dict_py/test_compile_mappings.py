@@ -0,0 +1,63 @@
+import pytest
+
+from pronunciation_dictionary_utils.pronunciations_map_symbols_dict import compile_mappings
+
+
+def test_partial__longest_first() -> None:
+  symbols = {"AO", "AO2", "AO3", "AA1", "."}
+  mappings = {
+    "AO": "ɔ",
+    "AO2": "ˌɔ",
+    "AA": "a",
+  }
+
+  result = compile_mappings(symbols, mappings, True)
+
+  assert result == {
+    "AO": ("ɔ",),
+    "AO2": ("ˌɔ",),
+    "AO3": ("ɔ3",),
+  }
+
+
+def test_partial__with_whitespaces__raises_exception() -> None:
+  symbols = {"EY2"}
+  mappings = {"EY2": "ˌe ɪ"}
+
+  with pytest.raises(Exception) as expected_exception:
+    compile_mappings(symbols, mappings, True)
+  assert str(expected_exception.value) == "Whitespaces in mappings aren't supported with partial mapping."
+
+
+def test_full__only_exact_symbols() -> None:
+  symbols = {"AO", "AO2", "AO3", "EY2", "."}
+  mappings = {
+    "AO": "ɔ",
+    "AO2": "ˌɔ",
+    "EY2": "ˌe ɪ",
+  }
+
+  result = compile_mappings(symbols, mappings, False)
+
+  assert result == {
+    "AO": ("ɔ",),
+    "AO2": ("ˌɔ",),
+    "EY2": ("ˌe", "ɪ"),
+  }
+
+
+def test_full__empty_mapping_removes_symbol() -> None:
+  symbols = {"A", "B"}
+  mappings = {"A": ""}
+
+  result = compile_mappings(symbols, mappings, False)
+
+  assert result == {
+    "A": (),
+  }
+
+
+def test_no_mappable_symbols__returns_empty_table() -> None:
+  result = compile_mappings({"A", "B"}, {"C": "c"}, True)
+
+  assert result == {}
@@ -0,0 +1,22 @@
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.pronunciations_map_symbols import (compile_full_mapping,
+                                                                       compile_partial_mapping)
+
+
+def test_partial__contains_only_changed_symbols():
+  table = compile_partial_mapping({"Ae", "Ay", "t", "AX"}, OrderedSet(("e", "y")), "X")
+
+  assert table == {"Ae": ("AX",), "Ay": ("AX",)}
+
+
+def test_full__maps_only_whole_symbols():
+  table = compile_full_mapping({"Ae", "e", "t"}, OrderedSet(("e", "x")), ["A", "B"])
+
+  assert table == {"e": ("A", "B")}
+
+
+def test_full__mapping_to_itself__is_not_contained():
+  table = compile_full_mapping({"e", "t"}, OrderedSet(("e",)), ["e"])
+
+  assert table == {}
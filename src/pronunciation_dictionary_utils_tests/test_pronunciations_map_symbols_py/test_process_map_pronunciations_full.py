@@ -2,8 +2,9 @@ from collections import OrderedDict
 
 from ordered_set import OrderedSet
 
-from pronunciation_dictionary_utils.pronunciations_map_symbols import (
-  __init_pool, process_map_pronunciations_full)
+from pronunciation_dictionary_utils.executors import init_process_lookup_dict
+from pronunciation_dictionary_utils.pronunciations_map_symbols import \
+  process_map_pronunciations_full
 
 
 def test_component_change():
@@ -17,7 +18,7 @@ def test_component_change():
 
   dictionary["test"] = pronunciations
 
-  __init_pool(dictionary)
+  init_process_lookup_dict(dictionary)
   word, new_pronunciations = process_map_pronunciations_full("test", OrderedSet(("e", "y")), ["X"])
 
   assert word == "test"
@@ -32,7 +33,7 @@ def test_component_unchanged():
   pronunciations[tuple(("t", "e", "s", "t"))] = 2
   dictionary["test"] = pronunciations
 
-  __init_pool(dictionary)
+  init_process_lookup_dict(dictionary)
   word, new_pronunciations = process_map_pronunciations_full("test", OrderedSet(("X",)), ["Y"])
 
   assert word == "test"
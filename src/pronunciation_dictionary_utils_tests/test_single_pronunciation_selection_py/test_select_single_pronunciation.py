@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary import MultiprocessingOptions
+
+from pronunciation_dictionary_utils.single_pronunciation_selection import \
+  select_single_pronunciation
+
+
+def test_int_weights__sum_stays_int():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+    (("b",), 2),
+  ))
+
+  changed_counter = select_single_pronunciation(
+    dictionary, "highest-weight", None, MultiprocessingOptions(1, None, 1))
+
+  assert changed_counter == 1
+  assert dictionary["a"] == OrderedDict(((("b",), 3),))
+  assert isinstance(dictionary["a"][("b",)], int)
+
+
+def test_float_weights__are_summed():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 0.1),
+    (("b",), 0.2),
+  ))
+
+  select_single_pronunciation(dictionary, "first", None, MultiprocessingOptions(1, None, 1))
+
+  assert dictionary["a"] == OrderedDict(((("a",), 0.1 + 0.2),))
+
+
+def test_single_pronunciation__is_unchanged():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1),
+  ))
+
+  changed_counter = select_single_pronunciation(
+    dictionary, "last", None, MultiprocessingOptions(1, None, 1))
+
+  assert changed_counter == 0
+  assert dictionary["a"] == OrderedDict(((("a",), 1),))
@@ -0,0 +1,33 @@
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.subset_extraction import select_subset_dictionary
+
+
+def test_consider_case():
+  dictionary = OrderedDict((
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("A", OrderedDict(((("a",), 1.0),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+    ("a", OrderedDict(((("a",), 2.0),))),
+  ))
+
+  oov = select_subset_dictionary(dictionary, OrderedSet(("a", "B", "c")), True)
+
+  assert list(dictionary.keys()) == ["c", "a"]
+  assert list(oov) == ["B"]
+
+
+def test_ignore_case():
+  dictionary = OrderedDict((
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("A", OrderedDict(((("a",), 1.0),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+    ("a", OrderedDict(((("a",), 2.0),))),
+  ))
+
+  oov = select_subset_dictionary(dictionary, OrderedSet(("a", "B", "d", "D")), False)
+
+  assert list(dictionary.keys()) == ["b", "A", "a"]
+  assert list(oov) == ["d", "D"]
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+from ordered_set import OrderedSet
+
+from pronunciation_dictionary_utils.subset_extraction import (select_subset_dictionary,
+                                                              select_subset_entries)
+
+
+def test_is_equal_to_select_subset_dictionary():
+  entries = [
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("A", OrderedDict(((("a",), 1.0),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+    ("a", OrderedDict(((("a",), 2.0),))),
+  ]
+  vocabulary = OrderedSet(("a", "B", "d", "c"))
+
+  for consider_case in (True, False):
+    dictionary = OrderedDict(entries)
+    expected_oov = select_subset_dictionary(dictionary, vocabulary, consider_case)
+
+    result, oov = select_subset_entries(list(entries), vocabulary, consider_case)
+
+    assert list(result.items()) == list(dictionary.items())
+    assert list(oov) == list(expected_oov)
+
+
+def test_combines_entries_of_same_word():
+  entries = [
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("a", OrderedDict(((("a",), 2.0),))),
+    ("a", OrderedDict(((("a",), 3.0), (("x",), 1.0)))),
+  ]
+
+  result, oov = select_subset_entries(entries, OrderedSet(("a",)), True)
+
+  assert result == OrderedDict((
+    ("a", OrderedDict(((("a",), 2.0), (("x",), 1.0)))),
+  ))
+  assert len(oov) == 0
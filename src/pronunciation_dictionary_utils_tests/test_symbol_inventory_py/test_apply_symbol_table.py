@@ -0,0 +1,17 @@
+from pronunciation_dictionary_utils.symbol_inventory import apply_symbol_table
+
+
+def test_mapped_and_removed_symbols():
+  table = {"a": ("x", "y"), "b": ()}
+
+  result = apply_symbol_table([("a", "b", "c"), ("b",)], table)
+
+  assert result == [("x", "y", "c"), ()]
+
+
+def test_unchanged_pronunciation__is_returned_as_is():
+  pronunciation = ("c", "d")
+
+  result = apply_symbol_table([pronunciation], {"a": ("x",)})
+
+  assert result[0] is pronunciation
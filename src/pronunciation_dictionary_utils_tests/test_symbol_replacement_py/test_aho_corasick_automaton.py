@@ -0,0 +1,57 @@
+from pronunciation_dictionary_utils.symbol_replacement import AhoCorasickAutomaton, SymbolReplacer
+
+
+def test_replace__leftmost_longest():
+  automaton = AhoCorasickAutomaton(("e", "ey", "y"))
+
+  result = automaton.replace("teys", "X")
+
+  assert result == "tXs"
+
+
+def test_replace__independent_of_pattern_order():
+  automaton1 = AhoCorasickAutomaton(("AO", "AO1", "O1"))
+  automaton2 = AhoCorasickAutomaton(("O1", "AO1", "AO"))
+
+  assert automaton1.replace("AO1AO", "ɔ") == "ɔɔ"
+  assert automaton2.replace("AO1AO", "ɔ") == "ɔɔ"
+
+
+def test_replace__overlapping_patterns_via_fail_links():
+  automaton = AhoCorasickAutomaton(("abcd", "bc"))
+
+  result = automaton.replace("abce", "X")
+
+  assert result == "aXe"
+
+
+def test_replace__replacement_is_not_scanned_again():
+  automaton = AhoCorasickAutomaton(("a", "Xb"))
+
+  result = automaton.replace("ab", "X")
+
+  assert result == "Xb"
+
+
+def test_replace__no_match_returns_text():
+  automaton = AhoCorasickAutomaton(("x",))
+
+  result = automaton.replace("abc", "Y")
+
+  assert result == "abc"
+
+
+def test_find_longest_matches():
+  automaton = AhoCorasickAutomaton(("a", "ab", "b"))
+
+  result = automaton.find_longest_matches("abb")
+
+  assert result == {0: 2, 1: 1, 2: 1}
+
+
+def test_symbol_replacer__returns_cached_result():
+  replacer = SymbolReplacer(("e",), "X")
+
+  assert replacer.replace("Ae") == "AX"
+  assert replacer.replace("Ae") == "AX"
+  assert replacer.replace("A") == "A"
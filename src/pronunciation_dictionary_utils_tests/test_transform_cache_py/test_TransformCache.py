@@ -0,0 +1,57 @@
+from typing import List
+
+from pronunciation_dictionary import Pronunciation
+
+from pronunciation_dictionary_utils.transform_cache import TransformCache
+
+
+def reverse_all(pronunciations: List[Pronunciation], calls: List[List[Pronunciation]]) -> List[Pronunciation]:
+  calls.append(list(pronunciations))
+  return [tuple(reversed(pronunciation)) for pronunciation in pronunciations]
+
+
+def test_cached_pronunciations__are_not_transformed_again():
+  cache = TransformCache(10)
+  calls = []
+
+  cache.transform_all([("a", "b")], lambda x: reverse_all(x, calls))
+  result = cache.transform_all([("a", "b"), ("c", "d")], lambda x: reverse_all(x, calls))
+
+  assert result == {("a", "b"): ("b", "a"), ("c", "d"): ("d", "c")}
+  assert calls == [[("a", "b")], [("c", "d")]]
+  assert cache.hits == 1
+  assert cache.misses == 2
+
+
+def test_least_recently_used__is_evicted():
+  cache = TransformCache(2)
+  calls = []
+
+  cache.transform_all([("a",), ("b",)], lambda x: reverse_all(x, calls))
+  cache.transform_all([("a",)], lambda x: reverse_all(x, calls))
+  cache.transform_all([("c",)], lambda x: reverse_all(x, calls))
+  calls.clear()
+  cache.transform_all([("a",), ("b",)], lambda x: reverse_all(x, calls))
+
+  assert calls == [[("b",)]]
+  assert len(cache) == 2
+
+
+def test_more_pronunciations_than_maxsize__returns_all():
+  cache = TransformCache(1)
+
+  result = cache.transform_all([("a",), ("b",), ("c",)], lambda x: reverse_all(x, []))
+
+  assert result == {("a",): ("a",), ("b",): ("b",), ("c",): ("c",)}
+  assert len(cache) == 1
+
+
+def test_empty_result__is_cached():
+  cache = TransformCache(10)
+  calls = []
+
+  cache.transform_all([("a",)], lambda x: calls.append(x) or [()])
+  result = cache.transform_all([("a",)], lambda x: calls.append(x) or [()])
+
+  assert result == {("a",): ()}
+  assert len(calls) == 1
@@ -0,0 +1,25 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.weight_engine import WeightTable
+
+
+def test_component():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+    (("d",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 0.1),
+    (("x",), 0.2),
+  ))
+  weight_table = WeightTable.from_dictionary(dictionary)
+
+  new_weights, changed_words = weight_table.get_normalized_weights(ignore_zero_sums=False)
+
+  assert new_weights.tolist() == [1.0, 1 / 7, 3 / 7, 3 / 7, 0.1 / (0.1 + 0.2), 0.2 / (0.1 + 0.2)]
+  assert changed_words.tolist() == [False, True, True]
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+import numpy as np
+from pronunciation_dictionary import get_random_pronunciation
+
+from pronunciation_dictionary_utils.weight_engine import WeightTable, get_random_positions
+
+
+def test_same_as_get_random_pronunciation():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+    (("d",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 0.1),
+    (("x",), 0.2),
+  ))
+  counts = WeightTable.from_dictionary(dictionary).counts
+
+  for seed in range(50):
+    result = get_random_positions(counts, seed).tolist()
+
+    expected = [
+      list(pronunciations.keys()).index(get_random_pronunciation(pronunciations, seed))
+      for pronunciations in dictionary.values()
+    ]
+    assert result == expected
+
+
+def test_unseeded_in_range():
+  counts = np.array([1, 2, 5])
+
+  result = get_random_positions(counts, None)
+
+  assert np.all(result >= 0)
+  assert np.all(result < counts)
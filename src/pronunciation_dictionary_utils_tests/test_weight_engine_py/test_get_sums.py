@@ -0,0 +1,24 @@
+from collections import OrderedDict
+
+from pronunciation_dictionary_utils.weight_engine import WeightTable
+
+
+def test_same_as_sum():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+    (("d",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 0.1),
+    (("x",), 0.2),
+  ))
+  weight_table = WeightTable.from_dictionary(dictionary)
+
+  result = weight_table.get_sums().tolist()
+
+  assert result == [sum(pronunciations.values()) for pronunciations in dictionary.values()]
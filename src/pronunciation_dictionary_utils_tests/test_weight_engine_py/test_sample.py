@@ -0,0 +1,49 @@
+import random
+from collections import OrderedDict
+
+from pronunciation_dictionary import get_weighted_pronunciation
+
+from pronunciation_dictionary_utils.weight_engine import WeightTable
+
+
+def test_same_as_get_weighted_pronunciation():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict((
+    (("a",), 1.0),
+  ))
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+    (("d",), 3.0),
+  ))
+  dictionary["c"] = OrderedDict((
+    (("c",), 0.1),
+    (("x",), 0.2),
+  ))
+  weight_table = WeightTable.from_dictionary(dictionary)
+
+  for seed in range(50):
+    result = weight_table.sample(seed).tolist()
+
+    expected = [
+      list(pronunciations.keys()).index(get_weighted_pronunciation(pronunciations, seed))
+      for pronunciations in dictionary.values()
+    ]
+    assert result == expected
+
+
+def test_unseeded_depends_on_global_seed():
+  dictionary = OrderedDict()
+  dictionary["b"] = OrderedDict((
+    (("b",), 1.0),
+    (("c",), 3.0),
+    (("d",), 3.0),
+  ))
+  weight_table = WeightTable.from_dictionary(dictionary)
+
+  random.seed(1)
+  result1 = weight_table.sample(None).tolist()
+  random.seed(1)
+  result2 = weight_table.sample(None).tolist()
+
+  assert result1 == result2
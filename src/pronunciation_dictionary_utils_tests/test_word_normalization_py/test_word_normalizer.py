@@ -0,0 +1,50 @@
+from pronunciation_dictionary_utils.word_normalization import WordNormalizer
+
+
+def test_remove_symbols_all__removes_symbols_everywhere():
+  normalizer = WordNormalizer().remove_symbols("-'", "all")
+
+  result = normalizer.normalize_words(["a-b'c", "abc", "-'"])
+
+  assert result == ["abc", "abc", ""]
+
+
+def test_remove_symbols_both__strips_each_word():
+  normalizer = WordNormalizer().remove_symbols("-", "both")
+
+  result = normalizer.normalize_words(["-a-b-", "-", "ab"])
+
+  assert result == ["a-b", "", "ab"]
+
+
+def test_chain__is_applied_in_order():
+  normalizer = WordNormalizer().remove_symbols(".", "end").normalize_unicode("NFC").change_casing("casefold")
+
+  result = normalizer.normalize_words(["Straße.", "Café", "ΟΔΟΣ"])
+
+  assert result == ["strasse", "café", "οδοσ"]
+
+
+def test_lower__keeps_final_sigma_per_word():
+  normalizer = WordNormalizer().change_casing("lower")
+
+  result = normalizer.normalize_words(["ΟΔΟΣ", "ΣΑ"])
+
+  assert result == ["οδος", "σα"]
+
+
+def test_words_containing_separator__are_processed_one_by_one():
+  normalizer = WordNormalizer().remove_symbols("\n-", "all")
+
+  result = normalizer.normalize_words(["a\nb", "-c"])
+
+  assert result == ["ab", "c"]
+  assert normalizer.normalize("a\n-") == "a"
+
+
+def test_empty_chain__returns_same_words():
+  normalizer = WordNormalizer().remove_symbols("", "all")
+
+  assert len(normalizer) == 0
+  assert normalizer.normalize_words(["a", "B"]) == ["a", "B"]
+  assert normalizer.normalize_words([]) == []
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from pronunciation_dictionary_utils.words_sorting import sort_words, sort_words_external
+
+
+def test_is_equal_to_sort_words(tmp_path: Path):
+  entries = [
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("A", OrderedDict(((("a",), 1.0),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+    ("a", OrderedDict(((("a",), 2.0),))),
+    ("B", OrderedDict(((("b",), 1.0),))),
+  ]
+
+  for descending in (False, True):
+    for consider_case in (False, True):
+      for run_size in (1, 2, 5, 10):
+        expected = sort_words(OrderedDict(entries), descending, consider_case)
+
+        result = sort_words_external(
+          list(entries), descending, consider_case, run_size, tmp_path)
+
+        assert list(result) == list(expected.items())
+  assert list(tmp_path.iterdir()) == []
+
+
+def test_entries_of_same_word__are_combined():
+  entries = [
+    ("b", OrderedDict(((("b",), 1.0),))),
+    ("A", OrderedDict(((("a",), 1.0),))),
+    ("c", OrderedDict(((("c",), 1.0),))),
+    ("a", OrderedDict(((("a",), 2.0),))),
+    ("B", OrderedDict(((("b",), 1.0),))),
+    ("b", OrderedDict(((("b",), 3.0), (("x",), 0.5)))),
+  ]
+
+  result = list(sort_words_external(entries, False, True, 2))
+
+  assert result[3] == ("b", OrderedDict(((("b",), 1.0), (("x",), 0.5))))
+  assert [word for word, _ in result] == ["A", "B", "a", "b", "c"]
@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+import pytest
+
+from pronunciation_dictionary_utils.compact_dictionary import CompactPronunciationDict
+from pronunciation_dictionary_utils.words_sorting import sort_words, sort_words_in_place
+
+
+def test_is_equal_to_sort_words():
+  for descending in (False, True):
+    for consider_case in (False, True):
+      dictionary = OrderedDict()
+      for word in ["b", "B", "A", "ab", "a", "C", "c"]:
+        dictionary[word] = OrderedDict(((("x",), 1.0),))
+      expected = sort_words(dictionary, descending, consider_case)
+
+      changed_anything = sort_words_in_place(dictionary, descending, consider_case)
+
+      assert changed_anything
+      assert list(dictionary.items()) == list(expected.items())
+
+
+def test_keeps_values():
+  dictionary = OrderedDict()
+  for word in ["b", "B", "A"]:
+    dictionary[word] = OrderedDict(((("x",), 1.0),))
+  values = {word: id(pronunciations) for word, pronunciations in dictionary.items()}
+
+  sort_words_in_place(dictionary, False, False)
+
+  assert {word: id(pronunciations) for word, pronunciations in dictionary.items()} == values
+
+
+def test_sorted_dictionary__returns_false():
+  dictionary = OrderedDict()
+  for word in ["A", "B", "a", "b"]:
+    dictionary[word] = OrderedDict(((("x",), 1.0),))
+
+  changed_anything = sort_words_in_place(dictionary, False, True)
+
+  assert not changed_anything
+
+
+def test_compact_dictionary():
+  dictionary = CompactPronunciationDict()
+  for word in ["b", "B", "A", "ab", "a", "C", "c"]:
+    dictionary[word] = OrderedDict(((("x",), 1.0),))
+
+  sort_words_in_place(dictionary, False, True)
+
+  assert list(dictionary.keys()) == ["A", "B", "C", "a", "ab", "b", "c"]
+
+
+def test_locale():
+  dictionary = OrderedDict()
+  for word in ["b", "B", "A", "ab", "a", "C", "c"]:
+    dictionary[word] = OrderedDict(((("x",), 1.0),))
+
+  sort_words_in_place(dictionary, False, False, "C")
+
+  assert list(dictionary.keys()) == ["A", "a", "ab", "B", "b", "C", "c"]
+
+
+def test_unavailable_locale__raises_error():
+  dictionary = OrderedDict()
+  dictionary["a"] = OrderedDict(((("x",), 1.0),))
+
+  with pytest.raises(ValueError):
+    sort_words_in_place(dictionary, False, False, "xx_YY.invalid")